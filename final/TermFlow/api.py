@@ -0,0 +1,325 @@
+import sys
+import json
+import hashlib
+import argparse
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+import numpy as np
+import warehouse
+import normalized
+import trends
+from term_index import TermIndex
+
+# ---------------------------------------------------------
+# YEREL HTTP API (JSON)
+# ---------------------------------------------------------
+# TermFlow'un sayıları (terim serileri, normalize frekans, büyüme, tahmin) başka
+# araçlardan da okunabilsin diye standart kütüphane üzerinde küçük bir HTTP servisi.
+# Streamlit gerekmez; dashboard ile aynı paylaşılan yapılar kullanılır (warehouse
+# tablosu, NormalizedCube, TermIndex, trends hesapları).
+#
+# Uç noktalar (hepsi GET, cevap JSON):
+#   /api/version                                 veri seti sürümü, kategoriler, yıl aralığı
+#   /api/search?q=deep&page=0&page_size=10       terim arama (Deep Dive önerileri)
+#   /api/term?term=machine learning              kategori başına yıllık sayım + normalize
+#                                                frekans, toplam seri ve doğrusal tahmin
+#   /api/top?category=physics&n=20[&year=2024]   kategoride total'e (veya bir yıla) göre top-K
+#   /api/normalized?category=physics[&terms=a,b][&n=5][&min_year=..&max_year=..]
+#   /api/growth?category=physics&start=2019&end=2024[&min_volume=5][&limit=100]
+#
+# Önbellek: cevap gövdeleri süreç içi LRU önbellekte (veri seti sürümü, yol, sıralı
+# parametreler) anahtarıyla tutulur; veri dosyaları değişince anahtar da değişir.
+# ETag aynı anahtarın özetidir: istemci If-None-Match gönderirse cevap hiç
+# hesaplanmadan 304 döner.
+# Kullanım: python api.py [--host 127.0.0.1] [--port 8765]
+
+HOST = '127.0.0.1'
+PORT = 8765
+CACHE_SIZE = 4096  # gövdeler birkaç KB: en fazla ~16 MB
+MAX_PAGE_SIZE = 100
+MAX_TOP_N = 1000
+MAX_GROWTH_ROWS = 5000
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ---------------------------------------------------------
+# VERİ
+# ---------------------------------------------------------
+
+@lru_cache(maxsize=2)
+def _load_term_index(path, version):
+    return TermIndex(warehouse.load_terms(path))
+
+
+def dataset_version():
+    """Kelime ve alan dosyalarının birleşik sürümü (önbellek / ETag anahtarı). Veri yoksa None."""
+    words = warehouse.dataset_version(warehouse.MAIN_DATA_PATH)
+    domains = warehouse.dataset_version(warehouse.DOMAIN_STATS_PATH)
+    if words is None or domains is None:
+        return None
+    return f"{words}.{domains}"
+
+
+def _datasets():
+    df = warehouse.load_terms()
+    cube = normalized.load_cube()
+    if df is None or cube is None:
+        raise ApiError(503, "Veri dosyaları bulunamadı (all_data_merged.csv / domain_yearly_stats.csv).")
+    return df, cube
+
+
+def _floats(values, digits=3):
+    """NumPy dizisi -> JSON listesi (NaN -> null)."""
+    return [None if np.isnan(v) else round(float(v), digits) for v in np.asarray(values, dtype=np.float64)]
+
+
+# ---------------------------------------------------------
+# PARAMETRELER
+# ---------------------------------------------------------
+
+def _text(params, name, default=None):
+    value = params.get(name, default)
+    if value is None or not str(value).strip():
+        raise ApiError(400, f"'{name}' parametresi gerekli.")
+    return str(value).strip()
+
+
+def _int(params, name, default=None, low=None, high=None):
+    if name not in params:
+        if default is None:
+            raise ApiError(400, f"'{name}' parametresi gerekli.")
+        return default
+    try:
+        value = int(params[name])
+    except ValueError:
+        raise ApiError(400, f"'{name}' tam sayı olmalı.")
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise ApiError(400, f"'{name}' {low}..{high} aralığında olmalı.")
+    return value
+
+
+def _category(cube, params):
+    category = _text(params, 'category')
+    if normalized._key(category) not in cube.category_codes:
+        raise ApiError(404, f"Bilinmeyen kategori: {category}")
+    return cube.categories[cube.category_code(category)]
+
+
+# ---------------------------------------------------------
+# UÇ NOKTALAR
+# ---------------------------------------------------------
+
+def version_endpoint(params):
+    df, cube = _datasets()
+    years = [int(y) for y in warehouse.year_columns(df)]
+    return {'version': dataset_version(), 'n_rows': len(df), 'n_terms': len(cube.term_labels),
+            'categories': sorted(cube.categories), 'min_year': years[0], 'max_year': years[-1]}
+
+
+def search_endpoint(params):
+    _datasets()
+    index = _load_term_index(warehouse.MAIN_DATA_PATH, warehouse.dataset_version())
+    results, n_matches = index.search(_text(params, 'q'), page=_int(params, 'page', 0, low=0),
+                                      page_size=_int(params, 'page_size', 10, low=1, high=MAX_PAGE_SIZE))
+    return {'matches': n_matches, 'results': results}
+
+
+def term_endpoint(params):
+    df, cube = _datasets()
+    term = _text(params, 'term')
+    code = cube.term_labels.get_indexer([term])[0]
+    if code < 0:
+        raise ApiError(404, f"Terim bulunamadı: {term}")
+
+    # row_lookup: terimin kategori satırları tabloyu taramadan bulunur
+    cat_codes = np.flatnonzero(cube.row_lookup[code] >= 0)
+    rows = cube.row_lookup[code, cat_codes]
+    year_cols = warehouse.year_columns(df)
+    counts = df.iloc[rows, df.columns.get_indexer(year_cols)].to_numpy(dtype=np.int64)
+    # Normalize frekans sadece alan istatistiklerinde de bulunan yıllarda var; diğerleri null
+    freq = np.full((len(rows), len(year_cols)), np.nan)
+    freq[:, np.isin(year_cols, cube.year_columns)] = cube.freq[rows]
+    categories = {
+        cube.categories[c]: {'total': int(cube.totals[r]), 'counts': k.tolist(), 'normalized': _floats(f)}
+        for c, r, k, f in zip(cat_codes, rows, counts, freq)
+    }
+
+    years, series = trends.term_series(df, term)
+    forecast = trends.linear_forecast(years, series)
+    return {
+        'term': term,
+        'years': years.tolist(),
+        'total': int(series.sum()),
+        'series': series.astype(np.int64).tolist(),
+        'categories': categories,
+        'forecast': None if forecast is None else
+                    {'years': forecast[0].tolist(), 'values': _floats(forecast[1], 1)},
+    }
+
+
+def top_endpoint(params):
+    df, cube = _datasets()
+    category = _category(cube, params)
+    n = _int(params, 'n', 20, low=1, high=MAX_TOP_N)
+    rows = cube.category_rows(category)
+    if 'year' in params:
+        year = str(_int(params, 'year'))
+        if year not in df.columns:
+            raise ApiError(404, f"Yıl bulunamadı: {year}")
+        values = df[year].to_numpy(dtype=np.int64)[rows]
+    else:
+        year = None
+        values = cube.totals[rows]
+    if len(rows) > n:
+        keep = np.argpartition(-values, n)[:n]
+        rows, values = rows[keep], values[keep]
+    order = np.argsort(-values, kind='stable')
+    return {'category': category, 'year': None if year is None else int(year),
+            'terms': [{'term': t, 'count': int(v)} for t, v in zip(cube.labels(rows[order]), values[order])]}
+
+
+def normalized_endpoint(params):
+    _, cube = _datasets()
+    category = _category(cube, params)
+    if 'terms' in params:
+        terms = [t.strip() for t in params['terms'].split(',') if t.strip()]
+        rows = cube.rows_for(terms, category)
+    else:
+        rows = cube.top_rows(category, _int(params, 'n', 5, low=1, high=MAX_TOP_N))
+        terms = cube.labels(rows).tolist()
+    min_year = _int(params, 'min_year') if 'min_year' in params else None
+    max_year = _int(params, 'max_year') if 'max_year' in params else None
+    values, years = cube.gather(rows, min_year, max_year)
+    # Kategoride olmayan terim: tüm değerler null
+    return {'category': category, 'unit': f"per {normalized.SCALE:,} papers", 'years': years.tolist(),
+            'series': {t: _floats(v) for t, v in zip(terms, values)}}
+
+
+def growth_endpoint(params):
+    df, cube = _datasets()
+    category = _category(cube, params)
+    start, end = _int(params, 'start'), _int(params, 'end')
+    if end <= start:
+        raise ApiError(400, "'end' 'start'tan büyük olmalı.")
+    table = trends.growth_table(df, category, start, end, min_end=_int(params, 'min_volume', 5, low=0))
+    if table is None:
+        raise ApiError(404, f"Yıl bulunamadı: {start} / {end}")
+    table = table.nlargest(_int(params, 'limit', 100, low=1, high=MAX_GROWTH_ROWS), 'cagr')
+    return {'category': category, 'start': start, 'end': end, 'terms': [
+        {'term': str(t), 'start_count': int(s), 'end_count': int(e), 'cagr': round(float(c), 4)}
+        for t, s, e, c in zip(table['bigram'], table['start_count'], table['end_count'], table['cagr'])]}
+
+
+ROUTES = {
+    '/api/version': version_endpoint,
+    '/api/search': search_endpoint,
+    '/api/term': term_endpoint,
+    '/api/top': top_endpoint,
+    '/api/normalized': normalized_endpoint,
+    '/api/growth': growth_endpoint,
+}
+
+
+# ---------------------------------------------------------
+# ÖNBELLEK VE HTTP
+# ---------------------------------------------------------
+
+def etag(version, path, params):
+    key = json.dumps([version, path, params], ensure_ascii=False)
+    return '"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20] + '"'
+
+
+def encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_response(version, path, params):
+    """(durum kodu, JSON gövdesi); aynı sürüm + istek için bir kez hesaplanır."""
+    try:
+        status, payload = 200, ROUTES[path](dict(params))
+    except ApiError as e:
+        status, payload = e.status, {'error': str(e)}
+    return status, encode(payload)
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive: istemci bağlantıyı yeniden kullanabilir
+    # Başlık ve gövde ayrı yazılır; Nagle açıkken gövde karşı tarafın gecikmeli ACK'ini
+    # (~40 ms) bekler
+    disable_nagle_algorithm = True
+    quiet = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path not in ROUTES:
+            return self._send(404, encode({'error': f"Bilinmeyen uç nokta: {url.path}"}))
+        version = dataset_version()
+        if version is None:
+            return self._send(503, encode({'error': "Veri dosyaları bulunamadı."}))
+
+        # Parametre sırası önbellek anahtarını etkilemesin
+        params = tuple(sorted(parse_qsl(url.query)))
+        tag = etag(version, url.path, params)
+        if tag in [t.strip() for t in self.headers.get('If-None-Match', '').split(',')]:
+            return self._send(304, None, tag)
+        status, body = cached_response(version, url.path, params)
+        self._send(status, body, tag if status == 200 else None)
+
+    def _send(self, status, body, tag=None):
+        self.send_response(status)
+        if tag:
+            self.send_header('ETag', tag)
+            self.send_header('Cache-Control', 'no-cache')  # her seferinde ETag ile doğrula
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+        else:
+            self.send_header('Content-Length', '0')
+        self.end_headers()
+        if body is not None:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host=HOST, port=PORT, quiet=False):
+    """Sunucuyu kurar (veri ilk istekte değil burada yüklenir)."""
+    _datasets()
+    handler = type('Handler', (ApiHandler,), {'quiet': quiet})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TermFlow JSON API")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--quiet', action='store_true', help="istek loglarını yazma")
+    args = parser.parse_args(argv)
+
+    try:
+        server = make_server(args.host, args.port, args.quiet)
+    except ApiError as e:
+        print(f"❌ {e}")
+        return 1
+    host, port = server.server_address[:2]
+    print(f"✅ TermFlow API: http://{host}:{port}/api/version", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
 import streamlit as st
 import os
+import time
 from data_loader import DataLoader
 from plot_manager import PlotManager
+from query import PREBUILT
+from archetypes import ARCHETYPES
 
 # --- PAGE SETTINGS ---
 st.set_page_config(page_title="TermFlow AI", layout="wide", page_icon="📈")
@@ -19,23 +22,324 @@ st.markdown("""
 loader = DataLoader()
 plotter = PlotManager()
 
-# Load Data
+# Load Data (shared across sessions; only the first visitor pays the load cost)
 with st.spinner("Loading Data Warehouse..."):
     df = loader.load_main_data()
-    df_domain = loader.load_domain_stats()
+    cube = loader.load_normalized()
+    metrics = loader.load_term_metrics()
+    emerging = loader.load_emerging_terms()
+    archetype_tables = loader.load_archetypes()
+    flows = loader.load_term_flows()
 
 if df is None:
     st.error("Data could not be loaded! Check 'data/all_data_merged.csv' file.")
     st.stop()
 
+# Category list, year bounds and term vocabulary: computed once per dataset, not per rerun
+meta = loader.load_metadata()
+
 # --- SIDEBAR ---
 with st.sidebar:
     if os.path.exists("assets/logo.png"):
         st.image("assets/logo.png", width=200)
     st.title("TermFlow")
-    page = st.radio("Navigation", ["🚀 Dashboard (Overview)", "🧭 Trend Explorer (Discovery)", "🔍 Deep Dive (Search)"])
+    page = st.radio("Navigation", ["🚀 Dashboard (Overview)", "🧭 Trend Explorer (Discovery)", "🔍 Deep Dive (Search)", "🧮 SQL Query"])
     st.markdown("---")
-    st.info(f"📚 Dataset: **{len(df):,}** Terms")
+    st.info(f"📚 Dataset: **{meta.n_terms:,}** Terms")
+
+# --- TAB / PAGE FRAGMENTS ---
+# Each tab is a fragment: a widget change inside a tab reruns only that tab,
+# not the whole script and not the other three tabs.
+
+EMERGING_ROWS = 50
+
+@st.fragment
+def rising_stars_tab():
+    st.markdown("**Growth vs Volume:** Which terms are both highly discussed and growing fast?")
+    cat_select = st.selectbox("Select Field:", meta.categories)
+    # Auto-detect year range
+    min_y, max_y = meta.min_year, meta.max_year
+    
+    y_range = st.slider("Year Range", min_y, max_y, (max_y-5, max_y))
+    
+    if st.button("Generate Matrix"):
+        fig = plotter.plot_growth_matrix(df, cat_select, y_range[0], y_range[1])
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Precomputed burst table: terms whose usage jumped above their own trailing baseline
+    if emerging is not None:
+        st.markdown("**Emerging Terms (Burst Detection):** Terms used far more than their recent baseline predicts, "
+                    "adjusted for the field's paper count.")
+        cat_bursts = emerging[
+            (emerging['category'] == cat_select) &
+            (emerging['last_burst_year'] >= y_range[0]) &
+            (emerging['first_burst_year'] <= y_range[1])
+        ]
+        st.dataframe(cat_bursts.head(EMERGING_ROWS).drop(columns='category'),
+                     use_container_width=True, hide_index=True)
+
+FLOW_MIN_CORR = 0.5
+FLOW_TABLE_ROWS = 100
+
+@st.fragment
+def relation_network_tab():
+    st.markdown("**Cross-Disciplinary Flow:** How popular is a term in two different fields?")
+    col_cat1, col_cat2 = st.columns(2)
+    categories = meta.categories
+    with col_cat1:
+        cat1 = st.selectbox("1st Field:", categories, index=0)
+    with col_cat2:
+        cat2 = st.selectbox("2nd Field:", categories, index=1 if len(categories) > 1 else 0)
+    
+    if cat1 != cat2:
+        fig = plotter.plot_relation_scatter(df, cat1, cat2)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Please select two different fields.")
+
+    # Precomputed diffusion table: first adoption year + lagged correlation per field pair
+    if flows is not None:
+        st.markdown("**Term Flows:** Which field used a term first, and which field picked it up later? "
+                    "Each later adopter is linked to the earlier field whose trend it follows most closely.")
+        f1, f2 = st.columns(2)
+        min_corr = f1.slider("Min lagged correlation:", -1.0, 1.0, FLOW_MIN_CORR, 0.05, key="flow_corr")
+        adopt_range = f2.slider("Adopted in:", meta.min_year, meta.max_year, (meta.min_year, meta.max_year), key="flow_years")
+        shown = flows[(flows['lag_corr'] >= min_corr) & flows['target_year'].between(*adopt_range)]
+        if shown.empty:
+            st.info("No term flows match these filters.")
+        else:
+            st.plotly_chart(plotter.plot_term_flows(shown, categories), use_container_width=True)
+            pair = shown[((shown['source'] == cat1) & (shown['target'] == cat2)) |
+                         ((shown['source'] == cat2) & (shown['target'] == cat1))]
+            st.caption(f"{len(pair):,} terms moved between {cat1} and {cat2}")
+            st.dataframe(pair.head(FLOW_TABLE_ROWS), use_container_width=True, hide_index=True)
+
+@st.fragment
+def normalized_trends_tab():
+    if cube is not None:
+        st.markdown("**True Popularity:** Trends normalized by article count.")
+        norm_cat = st.selectbox("Field:", meta.categories, key="norm_cat")
+        fig = plotter.plot_normalized_trend(cube, norm_cat)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Normalized data (domain_yearly_stats.csv) not found.")
+
+# --- TAB 4: STABILITY DISTRIBUTION (ŞAPKA GRAFİĞİ) ---
+STABILITY_METRICS = {
+    'total_volume': "Total volume",
+    'cv': "Coefficient of variation",
+    'growth_std': "YoY growth volatility",
+    'burstiness': "Burstiness",
+    'peak_share': "Peak-year share",
+    'active_years': "Active years",
+}
+STABILITY_TABLE_ROWS = 200
+
+@st.fragment
+def stability_tab():
+    st.markdown("**Volatility Distribution (Bell Curve):** How represents the market stability?")
+    st.markdown("""
+    * **Peak of the Hat (Center):** Most terms behave like this (Average stability).
+    * **Right Tail (Uç Kısım):** Highly volatile/trendy terms (Risky & Fast).
+    * **Left Tail (Sol Kısım):** Very static/boring terms.
+    """)
+    
+    vol_cat = st.selectbox("Select Field for Stability:", meta.categories, key="vol_cat")
+    if metrics is None:
+        st.warning("Stability metrics could not be computed.")
+        return
+    
+    # Precomputed per-term metrics: sorting / filtering is a lookup, not a recomputation
+    c1, c2, c3, c4 = st.columns(4)
+    vol_metric = c1.selectbox("Rank by:", list(STABILITY_METRICS), format_func=STABILITY_METRICS.get, key="vol_metric")
+    min_volume = c2.number_input("Min total volume:", min_value=0, value=0, step=100, key="vol_min")
+    peak_range = c3.slider("Peak year:", meta.min_year, meta.max_year, (meta.min_year, meta.max_year), key="vol_peak")
+    archetype = c4.selectbox("Archetype:", ["All"] + ARCHETYPES, key="vol_archetype",
+                             disabled=archetype_tables is None)
+    
+    cat_metrics = metrics[
+        (metrics['category'] == vol_cat) &
+        (metrics['total_volume'] >= min_volume) &
+        metrics['peak_year'].between(*peak_range)
+    ]
+    if archetype_tables is not None and archetype != "All":
+        # Precomputed clusters: the filter is a membership test, not a re-clustering
+        assignments = archetype_tables[0]
+        members = assignments.loc[(assignments['category'] == vol_cat) & (assignments['archetype'] == archetype), 'bigram']
+        cat_metrics = cat_metrics[cat_metrics['bigram'].isin(members)]
+    
+    fig_vol = plotter.plot_volatility_analysis(cat_metrics, vol_cat, vol_metric)
+    if fig_vol:
+        st.plotly_chart(fig_vol, use_container_width=True)
+        st.dataframe(
+            cat_metrics.nlargest(STABILITY_TABLE_ROWS, vol_metric).drop(columns='category'),
+            use_container_width=True, hide_index=True
+        )
+    else:
+        st.warning("Not enough data to create a distribution curve.")
+
+    # Evergreen vs Hype: cluster centroids of every term's normalized trend shape
+    if archetype_tables is not None:
+        assignments, centroids = archetype_tables
+        counts = assignments.loc[assignments['category'] == vol_cat, 'archetype'].value_counts()
+        st.markdown("**Trend Archetypes:** " + " · ".join(
+            f"{name} **{counts.get(name, 0):,}**" for name in ARCHETYPES))
+        st.plotly_chart(plotter.plot_archetype_centroids(centroids), use_container_width=True)
+
+SUGGESTIONS_PER_PAGE = 8
+SIMILAR_TRENDS = 10
+SIMILAR_TRENDS_PLOTTED = 5
+
+def shift_term_page(step):
+    st.session_state["term_page"] = st.session_state.get("term_page", 0) + step
+
+@st.fragment
+def deep_dive_page():
+    # Search runs on the server (TermIndex); only one page of suggestions goes to the browser
+    term_index = loader.load_term_index()
+    query = st.text_input("Search Term:", placeholder="E.g.: machine learning", key="term_query")
+
+    # New query -> back to the first page of suggestions
+    if st.session_state.get("term_query_last") != query:
+        st.session_state["term_query_last"] = query
+        st.session_state["term_page"] = 0
+    page_no = st.session_state.get("term_page", 0)
+
+    search_term = None
+    if query:
+        results, n_matches = term_index.search(query, page=page_no, page_size=SUGGESTIONS_PER_PAGE)
+        if not results:
+            st.warning("No matching term found.")
+        else:
+            labels = {r['term']: f"{r['term']}  ·  {r['total']:,}" + ("  (~)" if r['match'] == 'fuzzy' else "")
+                      for r in results}
+            search_term = st.radio("Suggestions:", list(labels), format_func=labels.get, key=f"term_pick_{page_no}")
+
+            n_pages = (n_matches - 1) // SUGGESTIONS_PER_PAGE + 1
+            prev_col, info_col, next_col = st.columns([1, 3, 1])
+            with prev_col:
+                st.button("◀", disabled=page_no == 0, on_click=shift_term_page, args=(-1,))
+            with info_col:
+                st.caption(f"{n_matches:,} matches · page {page_no + 1}/{n_pages}")
+            with next_col:
+                st.button("▶", disabled=page_no + 1 >= n_pages, on_click=shift_term_page, args=(1,))
+    
+    if search_term:
+        st.divider()
+        c1, c2 = st.columns([2, 1])
+        
+        with c1:
+            # Trend and Regression
+            fig_trend = plotter.plot_prediction(df, search_term)
+            if fig_trend:
+                st.plotly_chart(fig_trend, use_container_width=True)
+            else:
+                st.warning("Not enough data for this term.")
+        
+        with c2:
+            # Category Distribution (Sunburst)
+            fig_sun = plotter.plot_sunburst(df, search_term)
+            st.plotly_chart(fig_sun, use_container_width=True)
+
+        # Semantic Context: precomputed PPMI/SVD neighbours, a lookup per search
+        st.subheader("🧠 Semantic Context: Related Terms")
+        related_terms = loader.load_related_terms()
+        if related_terms is None:
+            st.info("Related terms are not computed yet. Run 'python cooccurrence.py' in the final/ folder.")
+        else:
+            neighbours = related_terms.lookup(search_term)
+            if neighbours.empty:
+                st.info("No related terms found for this term.")
+            else:
+                st.dataframe(
+                    neighbours[['related', 'similarity', 'cooccurrence']],
+                    column_config={
+                        'related': "Related term",
+                        'similarity': st.column_config.ProgressColumn("Similarity", min_value=0.0, max_value=1.0, format="%.2f"),
+                        'cooccurrence': st.column_config.NumberColumn("Papers together", format="%d"),
+                    },
+                    use_container_width=True, hide_index=True
+                )
+
+        # Similar trajectories: z-normalized per-year trends, cosine = correlation
+        st.subheader("📈 Terms That Trend Like This")
+        trajectory_index = loader.load_trajectory_index()
+        if trajectory_index is None:
+            st.info("Trend similarity needs normalized data (domain_yearly_stats.csv).")
+        else:
+            term_rows = df[df['bigram'] == search_term].sort_values('total', ascending=False)
+            traj_cat = st.selectbox("Trend in category:", term_rows['category'].astype(str).tolist(), key="traj_cat")
+            similar = trajectory_index.similar(search_term, traj_cat, k=SIMILAR_TRENDS)
+            if similar.empty:
+                st.info("This term has no trend to compare in this category.")
+            else:
+                t1, t2 = st.columns([1, 2])
+                with t1:
+                    st.dataframe(
+                        similar,
+                        column_config={
+                            'bigram': "Term",
+                            'category': "Category",
+                            'similarity': st.column_config.ProgressColumn("Correlation", min_value=-1.0, max_value=1.0, format="%.2f"),
+                        },
+                        use_container_width=True, hide_index=True
+                    )
+                with t2:
+                    shown = similar.head(SIMILAR_TRENDS_PLOTTED)
+                    trajectories = trajectory_index.trajectories(
+                        [search_term] + shown['bigram'].tolist(), [traj_cat] + shown['category'].tolist()
+                    )
+                    st.plotly_chart(plotter.plot_similar_trends(trajectories, search_term), use_container_width=True)
+
+QUERY_PREVIEW_ROWS = 1000
+
+def query_param_input(name, default, key):
+    # Widget type follows the default value: categories -> selectbox, numbers -> number_input
+    label = name.replace('_', ' ').capitalize()
+    if name.startswith('category'):
+        return st.selectbox(label, meta.categories, index=meta.categories.index(default) if default in meta.categories else 0, key=key)
+    if isinstance(default, float):
+        return st.number_input(label, value=default, step=0.05, key=key)
+    if name in ('since', 'until', 'start', 'end', 'year'):
+        return st.number_input(label, min_value=meta.min_year, max_value=meta.max_year, value=default, key=key)
+    return st.number_input(label, min_value=0, value=default, key=key)
+
+def show_query_result(run):
+    try:
+        start = time.perf_counter()
+        result = run()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    except Exception as e:
+        st.error(f"Query failed: {e}")
+        return
+    st.caption(f"{len(result):,} rows · {elapsed_ms:.0f} ms")
+    st.dataframe(result.head(QUERY_PREVIEW_ROWS), use_container_width=True, hide_index=True)
+
+@st.fragment
+def sql_query_page():
+    # In-process DuckDB over the same warehouse tables; built once, shared by all sessions
+    engine = loader.load_query_engine()
+    if engine is None:
+        st.warning("Query engine could not be built.")
+        return
+
+    name = st.selectbox("Prebuilt query:", list(PREBUILT), format_func=lambda n: PREBUILT[n].title, key="sql_prebuilt")
+    st.markdown(PREBUILT[name].description)
+    defaults = engine.defaults(name)
+    cols = st.columns(min(len(defaults), 4))
+    params = {}
+    for i, (param, default) in enumerate(defaults.items()):
+        with cols[i % len(cols)]:
+            params[param] = query_param_input(param, default, key=f"sql_{name}_{param}")
+    if st.button("Run", key="sql_run"):
+        show_query_result(lambda: engine.run(name, **params))
+
+    with st.expander("Ad-hoc SQL"):
+        st.markdown("Read-only `SELECT` over the tables below (results are limited; no file or network access).")
+        st.json(engine.tables(), expanded=False)
+        text = st.text_area("SQL:", value="SELECT category, COUNT(*) AS terms, SUM(total) AS mentions\nFROM term_summary\nGROUP BY category\nORDER BY mentions DESC", height=160, key="sql_text")
+        if st.button("Run SQL", key="sql_run_adhoc"):
+            show_query_result(lambda: engine.sql(text))
 
 # --- PAGE 1: DASHBOARD (STATIC IMAGES) ---
 if page == "🚀 Dashboard (Overview)":
@@ -75,82 +379,23 @@ elif page == "🧭 Trend Explorer (Discovery)":
     tab1, tab2, tab3, tab4 = st.tabs(["🌟 Rising Stars", "🧩 Relation Network", "⚖️ Normalized Trends", "📊 Stability Analysis"])
     
     with tab1:
-        st.markdown("**Growth vs Volume:** Which terms are both highly discussed and growing fast?")
-        cat_select = st.selectbox("Select Field:", df['category'].unique())
-        # Auto-detect year range
-        years = [int(c) for c in df.columns if c.isdigit()]
-        min_y, max_y = min(years), max(years)
-        
-        y_range = st.slider("Year Range", min_y, max_y, (max_y-5, max_y))
-        
-        if st.button("Generate Matrix"):
-            fig = plotter.plot_growth_matrix(df, cat_select, y_range[0], y_range[1])
-            st.plotly_chart(fig, use_container_width=True)
+        rising_stars_tab()
 
     with tab2:
-        st.markdown("**Cross-Disciplinary Flow:** How popular is a term in two different fields?")
-        col_cat1, col_cat2 = st.columns(2)
-        categories = df['category'].unique().tolist()
-        with col_cat1:
-            cat1 = st.selectbox("1st Field:", categories, index=0)
-        with col_cat2:
-            cat2 = st.selectbox("2nd Field:", categories, index=1 if len(categories) > 1 else 0)
-        
-        if cat1 != cat2:
-            fig = plotter.plot_relation_scatter(df, cat1, cat2)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Please select two different fields.")
+        relation_network_tab()
 
     with tab3:
-        if df_domain is not None:
-            st.markdown("**True Popularity:** Trends normalized by article count.")
-            norm_cat = st.selectbox("Field:", df['category'].unique(), key="norm_cat")
-            fig = plotter.plot_normalized_trend(df, df_domain, norm_cat)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Normalized data (domain_yearly_stats.csv) not found.")
+        normalized_trends_tab()
 
-    # --- NEW TAB FOR STANDARD DEVIATION ---
-# --- TAB 4: STABILITY DISTRIBUTION (ŞAPKA GRAFİĞİ) ---
     with tab4:
-        st.markdown("**Volatility Distribution (Bell Curve):** How represents the market stability?")
-        st.markdown("""
-        * **Peak of the Hat (Center):** Most terms behave like this (Average stability).
-        * **Right Tail (Uç Kısım):** Highly volatile/trendy terms (Risky & Fast).
-        * **Left Tail (Sol Kısım):** Very static/boring terms.
-        """)
-        
-        vol_cat = st.selectbox("Select Field for Stability:", df['category'].unique(), key="vol_cat")
-        
-        if st.button("Analyze Distribution"):
-            # PlotManager'daki güncellediğimiz fonksiyonu çağırıyor
-            fig_vol = plotter.plot_volatility_analysis(df, vol_cat)
-            if fig_vol:
-                st.plotly_chart(fig_vol, use_container_width=True)
-            else:
-                st.warning("Not enough data to create a distribution curve.")
+        stability_tab()
 
 # --- PAGE 3: DEEP DIVE (SEARCH) ---
 elif page == "🔍 Deep Dive (Search)":
     st.header("Detailed Term Analysis")
-    
-    all_terms = df['bigram'].unique().tolist()
-    search_term = st.selectbox("Search Term:", options=all_terms, index=None, placeholder="E.g.: machine learning")
-    
-    if search_term:
-        st.divider()
-        c1, c2 = st.columns([2, 1])
-        
-        with c1:
-            # Trend and Regression
-            fig_trend = plotter.plot_prediction(df, search_term)
-            if fig_trend:
-                st.plotly_chart(fig_trend, use_container_width=True)
-            else:
-                st.warning("Not enough data for this term.")
-        
-        with c2:
-            # Category Distribution (Sunburst)
-            fig_sun = plotter.plot_sunburst(df, search_term)
-            st.plotly_chart(fig_sun, use_container_width=True)
\ No newline at end of file
+    deep_dive_page()
+
+# --- PAGE 4: SQL QUERY ---
+elif page == "🧮 SQL Query":
+    st.header("Query the Term Warehouse")
+    sql_query_page()
\ No newline at end of file
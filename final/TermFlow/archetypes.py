@@ -0,0 +1,207 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+import normalized
+import trajectory
+
+# ---------------------------------------------------------
+# TREND ARKETİPLERİ (BATCH KÜMELEME)
+# ---------------------------------------------------------
+# Her (terim, kategori) satırının son WINDOW_YEARS yıllık normalize trendi (trajectory.py ile
+# aynı z-normalize birim vektörler) küresel k-means ile N_CLUSTERS şekil kümesine ayrılır:
+# benzerlik = kosinüs = Pearson korelasyonu, merkezler birim vektör. Tüm matris tek seferde:
+# atama [satır × yıl] · [yıl × küme] çarpımı + argmax, merkezler yıl başına np.bincount.
+# Her küme merkezinin şekline göre bir arketip adı alır:
+#   rising  : merkezin yılla korelasyonu >= TREND_CORR
+#   fading  : merkezin yılla korelasyonu <= -TREND_CORR
+#   bursty  : tek yıllık sivri zirve (merkezin en yüksek z-skoru >= BURST_PEAK_Z)
+#   peaked  : pencerenin ortasında geniş tepe
+# Şekilden bağımsız olarak değişim katsayısı < STABLE_CV olan (veya hiç değişmeyen)
+# satırlar 'stable' sayılır; z-normalizasyon gürültüyü şekil gibi büyütür.
+# Pencerede hiç kullanılmayan satırlar tabloya girmez.
+# Tablolar `python archetypes.py` ile data/term_archetypes.csv ve data/archetype_centroids.csv'ye
+# yazılır; dosyalar yoksa veya veri setinden eskiyse yükleme sırasında bellekte hesaplanır.
+
+ARCHETYPES_PATH = os.path.join(warehouse.DATA_DIR, "term_archetypes.csv")
+CENTROIDS_PATH = os.path.join(warehouse.DATA_DIR, "archetype_centroids.csv")
+ARCHETYPES = ['rising', 'fading', 'peaked', 'bursty', 'stable']
+WINDOW_YEARS = trajectory.WINDOW_YEARS
+N_CLUSTERS = 12
+MAX_ITERATIONS = 100
+TOLERANCE = 0.005  # kümesi değişen satır oranı bunun altına inince durulur
+SHIFT_TOLERANCE = 1e-4  # ... veya merkezlerin en büyük kayması (1 - kosinüs) bunun altına inince
+INIT_SAMPLE = 20_000  # k-means++ başlangıcı bu kadar satırlık örnekte seçilir
+SEED = 0
+TREND_CORR = 0.7
+BURST_PEAK_Z = 2.8  # 15 yılda tek yıllık sıçramanın z'si ~3.7, üç yıllık tepeninki ~2.2
+EDGE_YEARS = 2  # zirvesi ilk/son EDGE_YEARS yılda olan tepe değil, düşüş/yükseliştir
+STABLE_CV = 0.25
+CHUNK_ROWS = 100_000
+
+
+def _assign(vectors, centroids):
+    """Her satırın en yakın merkezi ve ona kosinüs benzerliği (parça parça)."""
+    labels = np.empty(len(vectors), dtype=np.int64)
+    sims = np.empty(len(vectors), dtype=np.float32)
+    for start in range(0, len(vectors), CHUNK_ROWS):
+        scores = vectors[start:start + CHUNK_ROWS] @ centroids.T
+        best = scores.argmax(axis=1)
+        labels[start:start + CHUNK_ROWS] = best
+        sims[start:start + CHUNK_ROWS] = scores[np.arange(len(best)), best]
+    return labels, sims
+
+
+def _init_centroids(vectors, k, rng):
+    """k-means++ (kosinüs uzaklığı) rastgele bir örnek üzerinde."""
+    sample = vectors[rng.choice(len(vectors), size=min(INIT_SAMPLE, len(vectors)), replace=False)]
+    centroids = [sample[rng.integers(len(sample))]]
+    dist = 1.0 - sample @ centroids[0]
+    for _ in range(1, k):
+        weights = np.maximum(dist, 0.0)
+        if weights.sum() <= 0:
+            break
+        centroids.append(sample[rng.choice(len(sample), p=weights / weights.sum())])
+        dist = np.minimum(dist, 1.0 - sample @ centroids[-1])
+    return np.array(centroids, dtype=np.float32)
+
+
+def spherical_kmeans(vectors, k=N_CLUSTERS, max_iterations=MAX_ITERATIONS, seed=SEED):
+    """
+    vectors: [satır × boyut] birim vektörler. Dönen (merkezler [k × boyut], etiketler,
+    benzerlikler, iterasyon sayısı, son kayma); kümesi değişen satır oranı TOLERANCE'a
+    veya merkezlerin en büyük kayması (1 - kosinüs) SHIFT_TOLERANCE'a inince durur.
+    iterasyon == max_iterations ve kayma > SHIFT_TOLERANCE ise yakınsamadan kesilmiştir.
+    """
+    if len(vectors) == 0:
+        return (np.empty((0, vectors.shape[1]), dtype=np.float32), np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.float32), 0, 0.0)
+    rng = np.random.default_rng(seed)
+    centroids = _init_centroids(vectors, min(k, len(vectors)), rng)
+    labels, shift = None, np.inf
+    for iteration in range(1, max_iterations + 1):
+        new_labels, sims = _assign(vectors, centroids)
+        if labels is not None and np.count_nonzero(new_labels != labels) <= TOLERANCE * len(labels):
+            labels = new_labels
+            break
+        labels = new_labels
+        sums = np.stack([np.bincount(labels, weights=vectors[:, d], minlength=len(centroids))
+                         for d in range(vectors.shape[1])], axis=1)
+        norms = np.linalg.norm(sums, axis=1)
+        # Boş kalan küme: merkezine en uzak satırla yeniden başlatılır
+        for c in np.flatnonzero(norms == 0):
+            far = int(sims.argmin())
+            sums[c], norms[c], sims[far] = vectors[far], 1.0, 1.0
+        new_centroids = (sums / norms[:, None]).astype(np.float32)
+        shift = float(np.max(1.0 - np.sum(new_centroids * centroids, axis=1)))
+        centroids = new_centroids
+        if shift <= SHIFT_TOLERANCE:
+            labels, sims = _assign(vectors, centroids)
+            break
+    return centroids, labels, sims, iteration, shift
+
+
+def name_centroids(centroids):
+    """Merkez şekli -> arketip adı (ARCHETYPES'tan, 'stable' hariç)."""
+    n_years = centroids.shape[1]
+    time_axis = np.arange(n_years) - (n_years - 1) / 2
+    corr = centroids @ (time_axis / np.linalg.norm(time_axis))
+    z = centroids * np.sqrt(n_years)
+    peak = z.argmax(axis=1)
+    interior = (peak >= EDGE_YEARS) & (peak < n_years - EDGE_YEARS)
+
+    names = np.where(corr >= 0, 'rising', 'fading').astype(object)
+    names[interior & (z.max(axis=1) >= BURST_PEAK_Z)] = 'bursty'
+    names[interior & (z.max(axis=1) < BURST_PEAK_Z)] = 'peaked'
+    names[corr >= TREND_CORR] = 'rising'
+    names[corr <= -TREND_CORR] = 'fading'
+    return names
+
+
+def cluster_archetypes(cube, k=N_CLUSTERS, window_years=WINDOW_YEARS, seed=SEED):
+    """
+    cube: normalized.NormalizedCube. Dönen (atamalar, merkezler):
+      atamalar: (bigram, category, archetype, cluster, fit, cv); fit = merkeze kosinüs
+                benzerliği, 'stable' satırlarda cluster -1
+      merkezler: (cluster, archetype, size, <yıl sütunları: merkezin z-skorları>)
+    """
+    years, values = trajectory.window_values(cube, window_years)
+    means = values.mean(axis=1)
+    active = np.flatnonzero(means > 0)
+    rows, vectors, norms = trajectory.unit_trajectories(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = np.where(means > 0, norms / np.sqrt(len(years)) / means, np.nan).astype(np.float32)
+
+    shaped = cv[rows] >= STABLE_CV
+    # Şekilli satır yoksa (hepsi 'stable' veya tablo boş) merkez tablosu boş kalır
+    centroids, labels, sims, *_ = spherical_kmeans(vectors[shaped], k, seed=seed)
+    names = name_centroids(centroids)
+
+    cluster = np.full(len(values), -1, dtype=np.int64)
+    fit = np.full(len(values), np.nan, dtype=np.float32)
+    cluster[rows[shaped]] = labels
+    fit[rows[shaped]] = sims
+    archetype = np.full(len(values), 'stable', dtype=object)
+    archetype[rows[shaped]] = names[labels]
+
+    assignments = pd.DataFrame({
+        'bigram': cube.labels(active),
+        'category': np.asarray(cube.categories, dtype=object)[cube.row_categories[active]],
+        'archetype': archetype[active],
+        'cluster': cluster[active],
+        'fit': fit[active],
+        'cv': cv[active],
+    })
+    centroid_table = pd.DataFrame(centroids * np.sqrt(len(years)), columns=[str(y) for y in years])
+    centroid_table.insert(0, 'size', np.bincount(labels, minlength=len(centroids)))
+    centroid_table.insert(0, 'archetype', names)
+    centroid_table.insert(0, 'cluster', np.arange(len(centroids)))
+    return assignments, centroid_table
+
+
+def _read_archetypes(path, centroids_path):
+    assignments = pd.read_csv(path, dtype={'bigram': 'category', 'category': 'category', 'archetype': 'category'},
+                              keep_default_na=False, na_values=[''])
+    return assignments, pd.read_csv(centroids_path)
+
+
+@lru_cache(maxsize=2)
+def _load_archetypes_cached(path, domains_path, version, archetypes_path, centroids_path):
+    # Batch çıktıları iki kaynaktan da yeniyse onları oku, değilse hesapla
+    if os.path.exists(archetypes_path) and os.path.exists(centroids_path):
+        newest_input = max(os.path.getmtime(path), os.path.getmtime(domains_path))
+        if min(os.path.getmtime(archetypes_path), os.path.getmtime(centroids_path)) >= newest_input:
+            return _read_archetypes(archetypes_path, centroids_path)
+    assignments, centroids = cluster_archetypes(normalized.load_cube(path, domains_path))
+    assignments = assignments.astype({'bigram': 'category', 'category': 'category', 'archetype': 'category'})
+    return assignments, centroids
+
+
+def load_archetypes(path=warehouse.MAIN_DATA_PATH, domains_path=warehouse.DOMAIN_STATS_PATH,
+                    archetypes_path=ARCHETYPES_PATH, centroids_path=CENTROIDS_PATH):
+    """Paylaşılan (atamalar, merkezler) tabloları (salt okunur). Veri dosyaları yoksa None."""
+    path, domains_path = os.path.abspath(path), os.path.abspath(domains_path)
+    words_version = warehouse.dataset_version(path)
+    domains_version = warehouse.dataset_version(domains_path)
+    if words_version is None or domains_version is None:
+        return None
+    return _load_archetypes_cached(path, domains_path, (words_version, domains_version),
+                                   os.path.abspath(archetypes_path), os.path.abspath(centroids_path))
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    print(f"Veri yükleniyor: {warehouse.MAIN_DATA_PATH}")
+    cube = normalized.load_cube()
+    if cube is None:
+        print("HATA: all_data_merged.csv veya domain_yearly_stats.csv bulunamadı.")
+    else:
+        assignments, centroids = cluster_archetypes(cube)
+        assignments.to_csv(ARCHETYPES_PATH, index=False, float_format='%.4g')
+        centroids.to_csv(CENTROIDS_PATH, index=False, float_format='%.4g')
+        counts = assignments['archetype'].value_counts()
+        print(f"{len(assignments):,} satır kümelendi ({len(centroids)} küme): "
+              + ", ".join(f"{name} {counts.get(name, 0):,}" for name in ARCHETYPES))
+        print(f"-> {ARCHETYPES_PATH}, {CENTROIDS_PATH} ({time.perf_counter() - start:.2f} sn)")
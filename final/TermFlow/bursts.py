@@ -0,0 +1,148 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+import normalized
+
+# ---------------------------------------------------------
+# PATLAMA (BURST) TESPİTİ: YÜKSELEN TERİMLER
+# ---------------------------------------------------------
+# İki uç nokta arasındaki CAGR kısa süreli patlamaları kaçırır ve küçük sayımlarda
+# gürültülüdür. Burada her (terim, kategori, yıl) hücresi için Poisson z-skoru:
+#   taban oran  = önceki BASELINE_YEARS yıldaki sayım / aynı yıllardaki makale sayısı
+#                 (hiç görülmemiş terimler için PRIOR_COUNT yumuşatması)
+#   beklenen λ  = taban oran × o yılın makale sayısı (domain_yearly_stats)
+#   z           = (sayım - λ) / sqrt(λ)
+# z >= Z_THRESHOLD, sayım >= MIN_COUNT ve sayım >= MIN_LIFT × λ olan yıllar patlama
+# sayılır. Kayan toplamlar kümülatif toplam farkıyla hesaplanır: tüm [satır × yıl]
+# matrisi tek seferde, döngüsüz.
+# Sonuç terim başına bir satırlık "emerging terms" tablosudur.
+
+EMERGING_PATH = os.path.join(warehouse.DATA_DIR, "emerging_terms.csv")
+BASELINE_YEARS = 5
+MIN_BASELINE_YEARS = 2
+PRIOR_COUNT = 0.5
+Z_THRESHOLD = 3.0
+MIN_COUNT = 5
+MIN_LIFT = 2.0  # büyük sayımlarda küçük oransal artışlar da yüksek z verir
+CHUNK_ROWS = 100_000
+
+
+def _trailing_sum(values, window):
+    """Her sütun için önceki `window` sütunun toplamı (kendisi hariç)."""
+    cum = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.float64)
+    np.cumsum(values, axis=1, out=cum[:, 1:])
+    idx = np.arange(values.shape[1])
+    return cum[:, idx] - cum[:, np.maximum(idx - window, 0)]
+
+
+def poisson_zscores(counts, papers, window=BASELINE_YEARS):
+    """
+    counts: [satır × yıl] sayımlar, papers: [satır × yıl] makale sayıları (NaN = yok).
+    Dönen (z, λ): [satır × yıl] z-skorları ve beklenen sayımlar; taban dönemi yetersiz
+    veya makale sayısı olmayan hücrelerde z NaN.
+    """
+    papers_filled = np.nan_to_num(papers, nan=0.0)
+    base_counts = _trailing_sum(counts, window)
+    base_papers = _trailing_sum(papers_filled, window)
+    base_years = _trailing_sum((papers_filled > 0).astype(np.float64), window)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = (base_counts + PRIOR_COUNT) / base_papers
+        expected = rate * papers
+        z = (counts - expected) / np.sqrt(expected)
+    z[(base_years < MIN_BASELINE_YEARS) | ~(papers > 0)] = np.nan
+    return z, expected
+
+
+def _chunk_summary(counts, papers, years):
+    z, expected = poisson_zscores(counts, papers)
+    burst = (z >= Z_THRESHOLD) & (counts >= MIN_COUNT) & (counts >= MIN_LIFT * expected)
+    has_burst = burst.any(axis=1)
+
+    z_filled = np.where(np.isnan(z), -np.inf, z)
+    peak = z_filled.argmax(axis=1)
+    rows = np.arange(len(counts))
+    n_years = burst.shape[1]
+    first = burst.argmax(axis=1)
+    last = n_years - 1 - burst[:, ::-1].argmax(axis=1)
+
+    return has_burst, {
+        'max_z': z_filled[rows, peak].astype(np.float32),
+        'peak_burst_year': years[peak],
+        'first_burst_year': years[first],
+        'last_burst_year': years[last],
+        'burst_years': burst.sum(axis=1).astype(np.int16),
+        'latest_z': z[:, -1].astype(np.float32),
+        'latest_count': counts[:, -1].astype(np.int64),
+    }
+
+
+def detect_bursts(df_words, df_domains):
+    """
+    Tüm kategoriler için patlama tespiti. Dönen tablo: en az bir patlama yılı olan
+    (bigram, category) satırları, max_z'ye göre azalan.
+    """
+    year_cols, denominators = normalized.aligned_denominators(df_words, df_domains)
+    years = np.array([int(y) for y in year_cols], dtype=np.int16)
+    values = df_words[year_cols].to_numpy()
+    row_categories = df_words['category'].cat.codes.to_numpy()
+
+    parts = []
+    for start in range(0, len(df_words), CHUNK_ROWS):
+        stop = start + CHUNK_ROWS
+        counts = values[start:stop].astype(np.float64)
+        papers = denominators[row_categories[start:stop]].astype(np.float64)
+        has_burst, summary = _chunk_summary(counts, papers, years)
+        keep = np.flatnonzero(has_burst)
+        part = pd.DataFrame({col: arr[keep] for col, arr in summary.items()})
+        part.insert(0, 'category', df_words['category'].to_numpy()[start:stop][keep])
+        part.insert(0, 'bigram', df_words['bigram'].to_numpy()[start:stop][keep])
+        parts.append(part)
+
+    if not parts:
+        return pd.DataFrame()
+    emerging = pd.concat(parts, ignore_index=True)
+    return emerging.sort_values('max_z', ascending=False, ignore_index=True)
+
+
+def _read_emerging(path):
+    return pd.read_csv(path, dtype={'bigram': 'category', 'category': 'category'})
+
+
+@lru_cache(maxsize=2)
+def _load_emerging_cached(path, domains_path, version, emerging_path):
+    # Batch çıktısı iki kaynaktan da yeniyse onu oku, değilse hesapla
+    if os.path.exists(emerging_path):
+        newest_input = max(os.path.getmtime(path), os.path.getmtime(domains_path))
+        if os.path.getmtime(emerging_path) >= newest_input:
+            return _read_emerging(emerging_path)
+    return detect_bursts(warehouse.load_terms(path), warehouse.load_domain_stats(domains_path))
+
+
+def load_emerging(path=warehouse.MAIN_DATA_PATH, domains_path=warehouse.DOMAIN_STATS_PATH,
+                  emerging_path=EMERGING_PATH):
+    """Paylaşılan emerging terms tablosu (salt okunur). Veri dosyaları yoksa None."""
+    path, domains_path = os.path.abspath(path), os.path.abspath(domains_path)
+    words_version = warehouse.dataset_version(path)
+    domains_version = warehouse.dataset_version(domains_path)
+    if words_version is None or domains_version is None:
+        return None
+    return _load_emerging_cached(path, domains_path, (words_version, domains_version),
+                                 os.path.abspath(emerging_path))
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    print(f"Veri yükleniyor: {warehouse.MAIN_DATA_PATH}")
+    terms = warehouse.load_terms()
+    domains = warehouse.load_domain_stats()
+    if terms is None or domains is None:
+        print("HATA: all_data_merged.csv veya domain_yearly_stats.csv bulunamadı.")
+    else:
+        table = detect_bursts(terms, domains)
+        table.to_csv(EMERGING_PATH, index=False, float_format='%.6g')
+        print(f"{len(terms):,} satır tarandı, {len(table):,} yükselen terim -> {EMERGING_PATH} "
+              f"({time.perf_counter() - start:.2f} sn)")
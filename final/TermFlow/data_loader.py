@@ -1,52 +1,98 @@
-import pandas as pd
 import streamlit as st
-import os
+import warehouse
+import normalized
+import term_metrics
+import bursts
+import archetypes
+import diffusion
+import query
+import related
+import trajectory
+from term_index import TermIndex
+
+class DatasetMetadata:
+    """
+    Arayüzün her yeniden çalıştırmada (rerun) tekrar hesapladığı özet bilgiler:
+    kategori listesi ve yıl sınırları. Veri seti başına bir kez kurulur.
+    (Terim sözlüğü TermIndex'te tutulur, tarayıcıya gönderilmez.)
+    """
+    def __init__(self, df):
+        self.n_terms = len(df)
+        self.categories = sorted(str(c) for c in df['category'].cat.categories)
+        self.year_columns = warehouse.year_columns(df)
+        self.years = [int(y) for y in self.year_columns]
+        self.min_year, self.max_year = self.years[0], self.years[-1]
+
+
+@st.cache_resource(show_spinner=False)
+def _load_metadata(path, version):
+    df = warehouse.load_terms(path)
+    return DatasetMetadata(df) if df is not None else None
+
+
+@st.cache_resource(show_spinner=False)
+def _load_term_index(path, version):
+    df = warehouse.load_terms(path)
+    return TermIndex(df) if df is not None else None
+
 
 class DataLoader:
     def __init__(self):
-        # Klasör yapına göre yollar
-        self.main_data_path = os.path.join("data", "all_data_merged.csv")
-        self.domain_stats_path = os.path.join("data", "domain_yearly_stats.csv")
-
-    @st.cache_data
-    def load_main_data(_self):
-        """all_data_merged.csv dosyasını yükler ve temizler."""
-        if not os.path.exists(_self.main_data_path):
-            return None
-        
+        # Klasör yapına göre yollar (warehouse çalışma dizininden bağımsız mutlak yol kullanır)
+        self.main_data_path = warehouse.MAIN_DATA_PATH
+        self.domain_stats_path = warehouse.DOMAIN_STATS_PATH
+
+    def load_main_data(self):
+        """
+        all_data_merged.csv -> tipli, paylaşılan tablo (warehouse önbelleğinden).
+        Dönen tablo salt okunurdur; değiştirilecekse .copy() alınmalı.
+        """
         try:
-            df = pd.read_csv(_self.main_data_path)
-            # Sütun isimlerini standartlaştır
-            df.columns = [str(c).lower().strip() for c in df.columns]
-            
-            # Kelime sütununu 'bigram' olarak sabitle
-            possible_names = ['bigram', 'term', 'keyword', 'unnamed: 0']
-            for name in possible_names:
-                if name in df.columns:
-                    df.rename(columns={name: 'bigram'}, inplace=True)
-                    break
-            
-            # Yıl sütunlarını sayıya çevir, boşlukları 0 yap
-            year_cols = [c for c in df.columns if c.isdigit()]
-            for yc in year_cols:
-                df[yc] = pd.to_numeric(df[yc], errors='coerce').fillna(0)
-            
-            # Total yoksa hesapla
-            if 'total' not in df.columns and year_cols:
-                df['total'] = df[year_cols].sum(axis=1)
-                
-            return df
+            return warehouse.load_terms(self.main_data_path)
         except Exception as e:
             st.error(f"Ana veri yükleme hatası: {e}")
             return None
 
-    @st.cache_data
-    def load_domain_stats(_self):
+    def load_domain_stats(self):
         """domain_yearly_stats.csv dosyasını yükler (Normalize trendler için)."""
-        if os.path.exists(_self.domain_stats_path):
-            df = pd.read_csv(_self.domain_stats_path)
-            df.columns = [str(c).lower().strip() for c in df.columns]
-            if 'domain' in df.columns:
-                df.rename(columns={'domain': 'category'}, inplace=True)
-            return df
-        return None
\ No newline at end of file
+        return warehouse.load_domain_stats(self.domain_stats_path)
+
+    def load_normalized(self):
+        """Normalize trendler için paylaşılan NormalizedCube (domain dosyası yoksa None)."""
+        return normalized.load_cube(self.main_data_path, self.domain_stats_path)
+
+    def load_term_metrics(self):
+        """Stability sekmesi için (terim, kategori) başına oynaklık metrikleri."""
+        return term_metrics.load_metrics(self.main_data_path)
+
+    def load_emerging_terms(self):
+        """Patlama tespitiyle bulunan yükselen terimler (Rising Stars için)."""
+        return bursts.load_emerging(self.main_data_path, self.domain_stats_path)
+
+    def load_archetypes(self):
+        """Trend arketipleri: (terim atamaları, küme merkezleri) veya None (Stability için)."""
+        return archetypes.load_archetypes(self.main_data_path, self.domain_stats_path)
+
+    def load_term_flows(self):
+        """Alanlar arası yayılım tablosu (Relation Network için, veri yoksa None)."""
+        return diffusion.load_flows(self.main_data_path, self.domain_stats_path)
+
+    def load_metadata(self):
+        """Tüm oturumların paylaştığı DatasetMetadata (dosya değişince yeniden kurulur)."""
+        return _load_metadata(self.main_data_path, warehouse.dataset_version(self.main_data_path))
+
+    def load_term_index(self):
+        """Deep Dive araması için paylaşılan sunucu tarafı TermIndex."""
+        return _load_term_index(self.main_data_path, warehouse.dataset_version(self.main_data_path))
+
+    def load_query_engine(self):
+        """SQL Query sayfası için paylaşılan süreç içi DuckDB motoru."""
+        return query.load_engine(self.main_data_path, self.domain_stats_path)
+
+    def load_related_terms(self):
+        """Deep Dive için önceden hesaplanmış ilgili terim listeleri (cooccurrence.py yoksa None)."""
+        return related.load_related()
+
+    def load_trajectory_index(self):
+        """Deep Dive'daki "benzer trend" araması için paylaşılan TrajectoryIndex."""
+        return trajectory.load_index(self.main_data_path, self.domain_stats_path)
\ No newline at end of file
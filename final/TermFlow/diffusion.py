@@ -0,0 +1,151 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+import normalized
+
+# ---------------------------------------------------------
+# ALANLAR ARASI YAYILIM (TERM FLOWS)
+# ---------------------------------------------------------
+# Birden fazla kategoride görülen her terim için, normalize yıl matrisinden (NormalizedCube):
+#   benimseme yılı : normalize frekansın >= ADOPTION_FREQ ve sayımın >= ADOPTION_MIN_COUNT
+#                    olduğu ilk yıl (kategori başına)
+#   gecikmeli korelasyon : corr(kaynak[t], hedef[t + lag]), lag = 0..MAX_LAG; en yüksek
+#                    korelasyonlu lag ve değeri
+# Terimler [terim × kategori × yıl] tensörüne toplanır; tüm kategori çiftleri ve bir
+# lag için korelasyonlar tek bir toplu matris çarpımıdır (terim parçaları halinde, döngü sadece lag'ler).
+# Her hedef kategori için kaynak = terimi daha önce benimsemiş kategoriler arasında
+# gecikmeli korelasyonu en yüksek olan. İlk benimseyen kategori kaynak olarak kalır;
+# terim başına en fazla (kategori sayısı - 1) akış.
+# Tablo `python diffusion.py` ile data/term_flows.csv'ye yazılır; dosya yoksa veya veri
+# setinden eskiyse yükleme sırasında bellekte hesaplanır.
+
+FLOWS_PATH = os.path.join(warehouse.DATA_DIR, "term_flows.csv")
+ADOPTION_FREQ = 0.5  # 10 bin makalede
+ADOPTION_MIN_COUNT = 3
+MAX_LAG = 5
+CHUNK_TERMS = 20_000
+FLOW_COLUMNS = ['bigram', 'source', 'target', 'source_year', 'target_year', 'gap', 'lag', 'lag_corr']
+
+
+def _zscore(values):
+    """Son eksen boyunca z-skoru; sabit seriler 0."""
+    centered = values - values.mean(axis=-1, keepdims=True)
+    std = centered.std(axis=-1, keepdims=True)
+    return np.divide(centered, std, out=np.zeros_like(centered), where=std > 0)
+
+
+def lagged_correlations(series, max_lag=MAX_LAG):
+    """
+    series: [terim × kategori × yıl]. Dönen [terim × kaynak × hedef × lag] Pearson
+    korelasyonları: corr(series[:, i, :Y-lag], series[:, j, lag:]).
+    """
+    n_years = series.shape[2]
+    out = np.empty(series.shape[:2] + (series.shape[1], max_lag + 1), dtype=np.float32)
+    for lag in range(max_lag + 1):
+        lead = _zscore(series[:, :, :n_years - lag])
+        follow = _zscore(series[:, :, lag:])
+        out[..., lag] = lead @ follow.transpose(0, 2, 1) / (n_years - lag)  # terim başına [i × j]
+    return out
+
+
+def _chunk_flows(cube, terms, counts_scale, max_lag):
+    """Bir terim parçası için akış sütunları (dizi sözlüğü)."""
+    rows = cube.row_lookup[terms]  # [terim × kategori], yoksa -1
+    present = rows >= 0
+    series = np.nan_to_num(cube.freq[np.maximum(rows, 0)], nan=0.0).astype(np.float32)
+    series[~present] = 0.0
+    counts = series * counts_scale[None, :, :]
+
+    # Geri hesaplanan sayımlar float: tam sayı eşiğine yarım pay
+    adopted = (series >= ADOPTION_FREQ) & (counts >= ADOPTION_MIN_COUNT - 0.5) & present[:, :, None]
+    has_year = adopted.any(axis=2)
+    first = np.where(has_year, adopted.argmax(axis=2), np.iinfo(np.int64).max)
+
+    corr = lagged_correlations(series, max_lag)
+    best_lag = corr.argmax(axis=3)
+    best_corr = np.take_along_axis(corr, best_lag[..., None], axis=3)[..., 0]
+
+    # Kaynak adayı: hedeften kesin olarak önce benimseyen kategori
+    earlier = (first[:, :, None] < first[:, None, :]) & has_year[:, :, None] & has_year[:, None, :]
+    score = np.where(earlier, best_corr, -np.inf)
+    source = score.argmax(axis=1)  # [terim × hedef]
+    t, target = np.nonzero(earlier.any(axis=1))
+    src = source[t, target]
+    return {
+        'term': terms[t],
+        'source': src,
+        'target': target,
+        'source_year': cube.years[first[t, src]],
+        'target_year': cube.years[first[t, target]],
+        'lag': best_lag[t, src, target].astype(np.int16),
+        'lag_corr': best_corr[t, src, target],
+    }
+
+
+def compute_flows(cube, max_lag=MAX_LAG):
+    """
+    cube: normalized.NormalizedCube. Dönen tablo (FLOW_COLUMNS): her satır bir terimin
+    source kategorisinden target kategorisine yayılımı; gap = benimseme yılları farkı.
+    """
+    # Sayım = normalize frekans × makale sayısı / SCALE (küp sayımları ayrıca tutmaz)
+    counts_scale = np.nan_to_num(cube.denominators, nan=0.0).astype(np.float32) / np.float32(normalized.SCALE)
+    multi = np.flatnonzero((cube.row_lookup >= 0).sum(axis=1) >= 2)
+
+    parts = [_chunk_flows(cube, multi[i:i + CHUNK_TERMS], counts_scale, max_lag)
+             for i in range(0, len(multi), CHUNK_TERMS)]
+    if not parts:
+        return pd.DataFrame(columns=FLOW_COLUMNS)
+    cols = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+    categories = np.asarray(cube.categories, dtype=object)
+    flows = pd.DataFrame({
+        'bigram': np.asarray(cube.term_labels[cols['term']], dtype=object),
+        'source': categories[cols['source']],
+        'target': categories[cols['target']],
+        'source_year': cols['source_year'],
+        'target_year': cols['target_year'],
+        'gap': cols['target_year'] - cols['source_year'],
+        'lag': cols['lag'],
+        'lag_corr': np.round(cols['lag_corr'], 4),
+    })
+    return flows.sort_values(['lag_corr', 'gap'], ascending=False, ignore_index=True)
+
+
+def _read_flows(path):
+    return pd.read_csv(path, dtype={'bigram': 'category', 'source': 'category', 'target': 'category'})
+
+
+@lru_cache(maxsize=2)
+def _load_flows_cached(path, domains_path, version, flows_path):
+    # Batch çıktısı iki kaynaktan da yeniyse onu oku, değilse hesapla
+    if os.path.exists(flows_path):
+        newest_input = max(os.path.getmtime(path), os.path.getmtime(domains_path))
+        if os.path.getmtime(flows_path) >= newest_input:
+            return _read_flows(flows_path)
+    flows = compute_flows(normalized.load_cube(path, domains_path))
+    return flows.astype({'bigram': 'category', 'source': 'category', 'target': 'category'})
+
+
+def load_flows(path=warehouse.MAIN_DATA_PATH, domains_path=warehouse.DOMAIN_STATS_PATH, flows_path=FLOWS_PATH):
+    """Paylaşılan term flows tablosu (salt okunur). Veri dosyaları yoksa None."""
+    path, domains_path = os.path.abspath(path), os.path.abspath(domains_path)
+    words_version = warehouse.dataset_version(path)
+    domains_version = warehouse.dataset_version(domains_path)
+    if words_version is None or domains_version is None:
+        return None
+    return _load_flows_cached(path, domains_path, (words_version, domains_version), os.path.abspath(flows_path))
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    print(f"Veri yükleniyor: {warehouse.MAIN_DATA_PATH}")
+    cube = normalized.load_cube()
+    if cube is None:
+        print("HATA: all_data_merged.csv veya domain_yearly_stats.csv bulunamadı.")
+    else:
+        table = compute_flows(cube)
+        table.to_csv(FLOWS_PATH, index=False, float_format='%.4g')
+        print(f"{table['bigram'].nunique():,} terim, {len(table):,} akış -> {FLOWS_PATH} "
+              f"({time.perf_counter() - start:.2f} sn)")
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# ---------------------------------------------------------
+# SEVİYE-DETAY (LEVEL OF DETAIL) KATMANI
+# ---------------------------------------------------------
+# Yüz binlerce terimi tek tek işaretçi olarak tarayıcıya göndermek yerine:
+#   - hacmi en yüksek TOP_K terim ve en "alana özgü" OUTLIER_K terim tek tek çizilir,
+#   - kalan yoğun, düşük sayılı bölge log ölçekli ızgara hücrelerine (density tile) toplanır,
+#   - nokta sayısı WEBGL_THRESHOLD'u geçerse SVG yerine WebGL (scattergl) kullanılır.
+# Terim sayısı MAX_POINTS'in altındaysa hiçbir şey atılmaz, sadece iz tipi seçilir.
+
+TOP_K = 500
+OUTLIER_K = 200
+MAX_POINTS = 3000
+WEBGL_THRESHOLD = 1000
+DENSITY_BINS = 40
+
+
+def render_mode(n_points):
+    """px.scatter için: çok noktada 'webgl', azsa 'svg'."""
+    return 'webgl' if n_points > WEBGL_THRESHOLD else 'svg'
+
+
+def scatter_class(n_points):
+    """go.Scatter veya go.Scattergl (nokta sayısına göre)."""
+    return go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+
+
+def _top(values, k):
+    if k >= len(values):
+        return np.arange(len(values))
+    return np.argpartition(-values, k)[:k]
+
+
+def level_of_detail(df, value_cols, volume_col, max_points=MAX_POINTS, top_k=TOP_K, outlier_k=OUTLIER_K):
+    """
+    df'i (tek tek çizilecek, yoğunluğa toplanacak) diye ikiye ayırır.
+    Aykırı değer ölçüsü: log1p(sayımlar) arasındaki en büyük fark, yani terimin tek bir
+    alana ne kadar özgü olduğu (eksenlere yapışık noktalar).
+    """
+    if len(df) <= max_points:
+        return df, df.iloc[0:0]
+
+    volume = df[volume_col].to_numpy(dtype=np.float64)
+    logs = np.log1p(df[value_cols].to_numpy(dtype=np.float64))
+    specificity = logs.max(axis=1) - logs.min(axis=1)
+
+    keep = np.zeros(len(df), dtype=bool)
+    keep[_top(volume, top_k)] = True
+    keep[_top(specificity, outlier_k)] = True
+    return df[keep], df[~keep]
+
+
+def _log_bin_edges(values, bins):
+    top = np.log1p(values.max()) if len(values) else 1.0
+    return np.linspace(0.0, max(top, 1e-9), bins + 1)
+
+
+def density_tiles(df, x_col, y_col, label_col=None, bins=DENSITY_BINS):
+    """
+    2B log ölçekli ızgara: her dolu hücre için merkez (orijinal ölçekte), terim sayısı
+    ve (varsa) hücredeki en büyük terimin adı.
+    """
+    x = df[x_col].to_numpy(dtype=np.float64)
+    y = df[y_col].to_numpy(dtype=np.float64)
+    x_edges, y_edges = _log_bin_edges(x, bins), _log_bin_edges(y, bins)
+    xi = np.clip(np.searchsorted(x_edges, np.log1p(x), side='right') - 1, 0, bins - 1)
+    yi = np.clip(np.searchsorted(y_edges, np.log1p(y), side='right') - 1, 0, bins - 1)
+    cell = xi * bins + yi
+
+    tiles = pd.DataFrame({'cell': cell, 'x': x, 'y': y})
+    if label_col is not None:
+        tiles['label'] = df[label_col].astype(str).to_numpy()
+        tiles['_volume'] = x + y
+    grouped = tiles.groupby('cell', sort=True)
+    out = pd.DataFrame({'count': grouped.size()})
+    cells = out.index.to_numpy()
+    x_mid = (x_edges[:-1] + x_edges[1:]) / 2
+    y_mid = (y_edges[:-1] + y_edges[1:]) / 2
+    out['x'] = np.expm1(x_mid[cells // bins])
+    out['y'] = np.expm1(y_mid[cells % bins])
+    if label_col is not None:
+        best = tiles.loc[grouped['_volume'].idxmax(), ['cell', 'label']].set_index('cell')['label']
+        out['example'] = best.reindex(out.index).to_numpy()
+    return out.reset_index(drop=True)
+
+
+def density_trace(tiles, name="Other terms", unit="terms", example="e.g."):
+    """density_tiles çıktısını gri, sayıya göre büyüyen işaretçiler olarak çizer."""
+    sizes = 4 + 10 * np.log1p(tiles['count']) / max(np.log1p(tiles['count'].max()), 1e-9)
+    hover = tiles['count'].map(lambda c: f"{c:,} {unit}")
+    if 'example' in tiles:
+        hover = hover + f" ({example} " + tiles['example'].astype(str) + ")"
+    return scatter_class(len(tiles))(
+        x=tiles['x'], y=tiles['y'], mode='markers', name=name,
+        marker=dict(size=sizes, color='rgba(160,160,160,0.35)', line=dict(width=0)),
+        hovertext=hover, hoverinfo='text',
+    )
+
+
+def tile_representatives(df, value_cols, volume_col, bins=DENSITY_BINS // 4):
+    """
+    Çok boyutlu (scatter matrix) sürüm: her log ızgara hücresinden hacmi en yüksek terim
+    temsilci olarak kalır; 'tile_count' hücredeki terim sayısıdır.
+    """
+    if df.empty:
+        return df.assign(tile_count=pd.Series(dtype=np.int64))
+    logs = np.log1p(df[value_cols].to_numpy(dtype=np.float64))
+    top = np.maximum(logs.max(axis=0), 1e-9)
+    cells = np.minimum((logs / top * bins).astype(np.int64), bins - 1)
+    keys = np.ravel_multi_index(cells.T, (bins,) * len(value_cols))
+
+    order = np.argsort(-df[volume_col].to_numpy(dtype=np.float64), kind='stable')
+    _, first, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    reps = df.iloc[order[first]].copy()
+    reps['tile_count'] = counts
+    return reps
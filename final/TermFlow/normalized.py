@@ -0,0 +1,129 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+
+# ---------------------------------------------------------
+# NORMALİZE FREKANS KATMANI
+# ---------------------------------------------------------
+# "10.000 makale başına kullanım" = sayım / o yıl o alandaki makale sayısı * 10000.
+# Eskiden her grafik kelime ve alan tablolarını melt edip (category, year) üzerinden
+# merge ediyordu. Burada veri yüklenirken bir kez hesaplanır:
+#   freq        : [satır × yıl] float32, satır = warehouse tablosundaki (terim, kategori)
+#   denominators: [kategori × yıl] float32, alan başına yıllık makale sayısı
+#   row_lookup  : [terim × kategori] -> satır (yoksa -1)
+# Yani [terim × kategori × yıl] küpü, boş hücreleri saklamadan row_lookup üzerinden
+# okunur; herhangi bir terim kümesinin trendi tek bir gather işlemidir.
+# Makale sayısı 0 (veya yok) olan yıllarda değer NaN'dır (grafikte boşluk).
+
+SCALE = 10000
+
+
+def _key(category):
+    return str(category).lower().strip()
+
+
+def aligned_denominators(df_words, df_domains):
+    """
+    İki tabloda da bulunan yıl sütunları ve [kategori × yıl] makale sayıları (float32),
+    kelime tablosunun kategori kod sırasıyla hizalı. 0 ve eksik değerler NaN.
+    """
+    domain_years = set(warehouse.year_columns(df_domains))
+    year_cols = [y for y in warehouse.year_columns(df_words) if y in domain_years]
+    categories = [_key(c) for c in df_words['category'].cat.categories]
+
+    dom = df_domains.assign(_key=df_domains['category'].map(_key)).drop_duplicates('_key').set_index('_key')
+    denominators = dom.reindex(categories)[year_cols].to_numpy(dtype=np.float32, copy=True)
+    denominators[~(denominators > 0)] = np.nan
+    return year_cols, denominators
+
+
+class NormalizedCube:
+    def __init__(self, df_words, df_domains):
+        """df_words: warehouse.load_terms(), df_domains: warehouse.load_domain_stats()."""
+        # Sadece iki tabloda da bulunan yıllar; payda [kategori × yıl]
+        self.year_columns, self.denominators = aligned_denominators(df_words, df_domains)
+        self.years = np.array([int(y) for y in self.year_columns], dtype=np.int64)
+
+        self.categories = [str(c) for c in df_words['category'].cat.categories]
+        self.category_codes = {_key(c): i for i, c in enumerate(self.categories)}
+
+        # Satır kodları
+        self.term_codes = df_words['bigram'].cat.codes.to_numpy(dtype=np.int64)
+        self.row_categories = df_words['category'].cat.codes.to_numpy(dtype=np.int64)
+        self.term_labels = df_words['bigram'].cat.categories
+        self.totals = df_words['total'].to_numpy(dtype=np.int64)
+
+        # Normalize frekanslar (satır sayısı x yıl, tek seferde)
+        counts = df_words[self.year_columns].to_numpy(dtype=np.float32)
+        self.freq = counts / self.denominators[self.row_categories] * np.float32(SCALE)
+        self.freq.flags.writeable = False  # paylaşılan, salt okunur
+
+        self.row_lookup = np.full((len(self.term_labels), len(self.categories)), -1, dtype=np.int64)
+        self.row_lookup[self.term_codes, self.row_categories] = np.arange(len(df_words))
+
+    def category_code(self, category):
+        return self.category_codes[_key(category)]
+
+    def year_mask(self, min_year=None, max_year=None):
+        mask = np.ones(len(self.years), dtype=bool)
+        if min_year is not None:
+            mask &= self.years >= min_year
+        if max_year is not None:
+            mask &= self.years <= max_year
+        return mask
+
+    def category_rows(self, category):
+        """Kategorinin tüm satır indeksleri."""
+        return np.flatnonzero(self.row_categories == self.category_code(category))
+
+    def top_rows(self, category, n=5):
+        """Kategoride total'i en yüksek n satır (büyükten küçüğe)."""
+        rows = self.category_rows(category)
+        if len(rows) > n:
+            rows = rows[np.argpartition(-self.totals[rows], n)[:n]]
+        return rows[np.argsort(-self.totals[rows], kind='stable')]
+
+    def rows_for(self, terms, category):
+        """Terim adları -> satır indeksleri (kategoride yoksa -1)."""
+        codes = self.term_labels.get_indexer([str(t) for t in terms])
+        rows = self.row_lookup[codes, self.category_code(category)]
+        rows[codes < 0] = -1
+        return rows
+
+    def gather(self, rows, min_year=None, max_year=None):
+        """Satırların [satır × yıl] normalize frekansları ve yılları; -1 satırlar NaN."""
+        mask = self.year_mask(min_year, max_year)
+        values = self.freq[np.maximum(rows, 0)][:, mask]
+        values[rows < 0] = np.nan
+        return values, self.years[mask]
+
+    def labels(self, rows):
+        return np.asarray(self.term_labels[self.term_codes[rows]], dtype=object)
+
+    def long_frame(self, rows, min_year=None, max_year=None):
+        """Çizim için uzun tablo (bigram, year, normalized_freq); melt/merge yok."""
+        values, years = self.gather(rows, min_year, max_year)
+        return pd.DataFrame({
+            'bigram': np.repeat(self.labels(rows), len(years)),
+            'year': np.tile(years, len(rows)),
+            'normalized_freq': values.ravel(),
+        })
+
+
+@lru_cache(maxsize=2)
+def _load_cube_cached(words_path, domains_path, words_version, domains_version):
+    df_words = warehouse.load_terms(words_path)
+    df_domains = warehouse.load_domain_stats(domains_path)
+    return NormalizedCube(df_words, df_domains)
+
+
+def load_cube(words_path=warehouse.MAIN_DATA_PATH, domains_path=warehouse.DOMAIN_STATS_PATH):
+    """Paylaşılan NormalizedCube (dosyalar değişince yeniden kurulur). Dosya yoksa None."""
+    words_path, domains_path = os.path.abspath(words_path), os.path.abspath(domains_path)
+    words_version = warehouse.dataset_version(words_path)
+    domains_version = warehouse.dataset_version(domains_path)
+    if words_version is None or domains_version is None:
+        return None
+    return _load_cube_cached(words_path, domains_path, words_version, domains_version)
@@ -2,26 +2,20 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
+import lod
+import trends
 
 class PlotManager:
     
     # --- 1. GROWTH MATRIX ---
     def plot_growth_matrix(self, df, category, start_year, end_year):
-        cat_df = df[df['category'] == category].copy()
-        s_col, e_col = str(start_year), str(end_year)
-        
-        if s_col not in cat_df.columns or e_col not in cat_df.columns:
+        cat_df = trends.growth_table(df, category, start_year, end_year)
+        if cat_df is None:
             return None
 
-        cat_df = cat_df[(cat_df[s_col] > 0) & (cat_df[e_col] >= 5)]
-        
-        years_diff = end_year - start_year
-        if years_diff < 1: years_diff = 1
-        
-        cat_df['CAGR'] = ((cat_df[e_col] / cat_df[s_col]) ** (1/years_diff)) - 1
+        cat_df['CAGR'] = cat_df['cagr']
         cat_df['Growth_Percent'] = cat_df['CAGR'] * 100
-        cat_df['Volume'] = cat_df[e_col]
+        cat_df['Volume'] = cat_df['end_count']
         
         cat_df = cat_df[cat_df['Growth_Percent'] < 5000]
 
@@ -41,7 +35,7 @@ class PlotManager:
 
     # --- 2. RELATION SCATTER ---
     def plot_relation_scatter(self, df, cat1, cat2):
-        pivot_df = df.pivot_table(index='bigram', columns='category', values='total', aggfunc='sum').fillna(0)
+        pivot_df = df.pivot_table(index='bigram', columns='category', values='total', aggfunc='sum', observed=True).fillna(0)
         pivot_df = pivot_df.reset_index()
         
         if cat1 not in pivot_df.columns or cat2 not in pivot_df.columns:
@@ -51,8 +45,11 @@ class PlotManager:
         filtered_df = pivot_df[mask].copy()
         filtered_df['Total'] = filtered_df[cat1] + filtered_df[cat2]
 
+        # Level of detail: top-K + outliers tek tek, kalan yoğun bölge ızgara hücreleri olarak
+        detail_df, rest_df = lod.level_of_detail(filtered_df, [cat1, cat2], 'Total')
+
         fig = px.scatter(
-            filtered_df,
+            detail_df,
             x=cat1,
             y=cat2,
             hover_name="bigram",
@@ -65,30 +62,38 @@ class PlotManager:
             title=f"Relation Network: {cat1} vs {cat2}",
             labels={cat1: f"{cat1} (Usage)", cat2: f"{cat2} (Usage)"},
             log_x=True,
-            log_y=True
+            log_y=True,
+            render_mode=lod.render_mode(len(detail_df))
         )
+        if not rest_df.empty:
+            tiles = lod.density_tiles(rest_df, cat1, cat2, label_col='bigram')
+            fig.add_trace(lod.density_trace(tiles, name=f"Other terms ({len(rest_df):,})"))
+            fig.update_layout(showlegend=False)
         fig.update_layout(template="plotly_dark")
         return fig
 
+    def plot_term_flows(self, flows, categories):
+        # flows: diffusion table; left nodes = first adopters, right nodes = later adopters
+        links = flows.groupby(['source', 'target'], observed=True).size().reset_index(name='terms')
+        index = {c: i for i, c in enumerate(categories)}
+        fig = go.Figure(go.Sankey(
+            node=dict(label=[f"{c} (earlier)" for c in categories] + [f"{c} (later)" for c in categories],
+                      pad=15, thickness=15),
+            link=dict(source=links['source'].astype(str).map(index),
+                      target=links['target'].astype(str).map(index) + len(categories),
+                      value=links['terms']),
+        ))
+        fig.update_layout(title="Term Flows: Which Field Adopted a Term First", template="plotly_dark", height=600)
+        return fig
+
     # --- 3. NORMALIZED TRENDS ---
-    def plot_normalized_trend(self, df_words, df_domains, category):
-        cat_words = df_words[df_words['category'] == category]
-        top_words = cat_words.groupby('bigram')['total'].sum().sort_values(ascending=False).head(5).index.tolist()
-        plot_data = cat_words[cat_words['bigram'].isin(top_words)].copy()
-        
-        year_cols = [c for c in plot_data.columns if c.isdigit()]
-        df_long = plot_data.melt(id_vars=['bigram', 'category'], value_vars=year_cols, var_name='year', value_name='count')
-        df_long['year'] = pd.to_numeric(df_long['year'])
-        
-        dom_cols = [c for c in df_domains.columns if c.isdigit()]
-        df_dom_long = df_domains.melt(id_vars=['category'], value_vars=dom_cols, var_name='year', value_name='total_papers')
-        df_dom_long['year'] = pd.to_numeric(df_dom_long['year'])
-        
-        merged = pd.merge(df_long, df_dom_long, on=['category', 'year'], how='inner')
-        merged['normalized_freq'] = (merged['count'] / merged['total_papers']) * 10000
+    def plot_normalized_trend(self, cube, category):
+        # cube: normalized.NormalizedCube (precomputed count / total_papers * 10000)
+        rows = cube.top_rows(category, 5)
+        plot_data = cube.long_frame(rows)
         
         fig = px.line(
-            merged, x='year', y='normalized_freq', color='bigram', markers=True,
+            plot_data, x='year', y='normalized_freq', color='bigram', markers=True,
             title=f"Normalized Trends in {category} (Per 10k Papers)",
             template="plotly_dark"
         )
@@ -96,46 +101,27 @@ class PlotManager:
     
     # --- 4. VOLATILITY ANALYSIS (NEW ADDITION) ---
 # --- 4. VOLATILITY DISTRIBUTION (ŞAPKA / BELL CURVE) ---# --- 4. VOLATILITY / POPULARITY DISTRIBUTION (BELL SHAPE) ---
-    def plot_volatility_analysis(self, df, category):
+    def plot_volatility_analysis(self, metrics, category, metric='total_volume', top_n=21):
         """
-        Kelimeleri popülaritesine göre ortada en yüksek olacak şekilde dizer (Bell Shape).
-        X: Kelimeler, Y: Kullanım Sayısı (Volume).
+        Kelimeleri seçilen metriğe göre ortada en yüksek olacak şekilde dizer (Bell Shape).
+        metrics: term_metrics tablosu (önceden hesaplanmış). X: Kelimeler, Y: metrik değeri.
         """
-        cat_df = df[df['category'] == category].copy()
-        year_cols = [c for c in df.columns if c.isdigit()]
-        
-        # Toplam hacmi hesapla
-        cat_df['Total_Volume'] = cat_df[year_cols].sum(axis=1)
-        
-        # En popüler 21 kelimeyi al (Sayısı değiştirilebilir)
-        top_n = 21
-        top_terms = cat_df.nlargest(top_n, 'Total_Volume').sort_values('Total_Volume', ascending=False).reset_index(drop=True)
+        cat_df = metrics[(metrics['category'] == category) & metrics[metric].notna()]
         
+        # En yüksek top_n kelime (büyükten küçüğe)
+        top_terms = cat_df.nlargest(top_n, metric)
         if top_terms.empty: return None
 
-        # --- ŞAPKA (BELL) DİZİLİMİ ALGORİTMASI ---
-        # En büyüğü ortaya, diğerlerini sağa-sola dağıtarak şapka şekli verelim.
-        # Örn: [3, 1, 0, 2, 4] gibi indeksler oluşacak.
-        
-        left_side = []
-        right_side = []
-        center = []
-        
-        for i, row in top_terms.iterrows():
-            if i == 0:
-                center.append(row) # En büyük (Zirve)
-            elif i % 2 == 1:
-                left_side.append(row) # Tekler Sola
-            else:
-                right_side.append(row) # Çiftler Sağa
-        
-        # Sol tarafı küçükten büyüğe sırala (Zirveye tırmanış)
-        left_side.sort(key=lambda x: x['Total_Volume'])
-        # Sağ tarafı büyükten küçüğe sırala (Zirveden iniş)
-        right_side.sort(key=lambda x: x['Total_Volume'], reverse=True)
-        
-        # Hepsini Birleştir: [Küçükler -> ZİRVE -> Küçükler]
-        bell_shaped_data = pd.DataFrame(left_side + center + right_side)
+        # --- ŞAPKA (BELL) DİZİLİMİ ---
+        # Sıralı listede 0 ortaya, tek sıralar sola (küçükten büyüğe), çift sıralar sağa
+        # (büyükten küçüğe): [.., 3, 1, 0, 2, 4, ..]
+        ranks = np.arange(len(top_terms))
+        bell_order = np.concatenate([ranks[1::2][::-1], ranks[:1], ranks[2::2]])
+        bell_shaped_data = pd.DataFrame({
+            'bigram': top_terms['bigram'].astype(str).to_numpy()[bell_order],
+            'value': top_terms[metric].to_numpy()[bell_order],
+        })
+        peak_term = bell_shaped_data.iloc[len(ranks[1::2])]
         
         # --- ÇİZİM ---
         fig = go.Figure()
@@ -143,19 +129,18 @@ class PlotManager:
         # 1. Alan Grafiği (Filled Area)
         fig.add_trace(go.Scatter(
             x=bell_shaped_data['bigram'],
-            y=bell_shaped_data['Total_Volume'],
+            y=bell_shaped_data['value'],
             mode='lines+markers',
             fill='tozeroy', # Altını doldur
-            name='Usage Volume',
+            name=metric,
             line=dict(color='#00f2c3', width=3, shape='spline'), # Spline: Çizgileri yumuşatır (kavisli yapar)
             marker=dict(size=8, color='white', line=dict(width=1, color='#00f2c3'))
         ))
         
         # En tepeye (Zirveye) özel bir etiket (Annotation)
-        peak_term = center[0]
         fig.add_annotation(
             x=peak_term['bigram'],
-            y=peak_term['Total_Volume'],
+            y=peak_term['value'],
             text=f"👑 {peak_term['bigram']}",
             showarrow=True,
             arrowhead=1,
@@ -164,9 +149,9 @@ class PlotManager:
         )
 
         fig.update_layout(
-            title=f"Market Dominance Curve: {category} (Top {top_n} Terms)",
-            xaxis_title="Terms (Arranged by Popularity)",
-            yaxis_title="Total Usage Volume",
+            title=f"Market Dominance Curve: {category} (Top {top_n} Terms by {metric})",
+            xaxis_title="Terms (Arranged by Rank)",
+            yaxis_title=metric,
             template="plotly_dark",
             hovermode="x unified",
             height=500
@@ -174,25 +159,30 @@ class PlotManager:
         
         return fig
 
+    def plot_archetype_centroids(self, centroids):
+        # centroids: archetypes table (cluster, archetype, size, <year columns: z-scores>)
+        year_cols = [c for c in centroids.columns if c.isdigit()]
+        plot_data = centroids.melt(id_vars=['cluster', 'archetype', 'size'], value_vars=year_cols,
+                                   var_name='year', value_name='z')
+        plot_data['year'] = pd.to_numeric(plot_data['year'])
+        fig = px.line(
+            plot_data, x='year', y='z', color='archetype', line_group='cluster',
+            hover_data={'cluster': True, 'size': ':,'},
+            title="Trend Archetypes (Cluster Centroids, z-score of normalized frequency)",
+            template="plotly_dark"
+        )
+        return fig
+
     # --- 5. DEEP DIVE: PREDICTION & SUNBURST ---
     def plot_prediction(self, df, term):
-        term_data = df[df['bigram'] == term].copy()
-        year_cols = [c for c in df.columns if c.isdigit()]
-        years = [int(y) for y in year_cols]
-        counts = term_data[year_cols].sum().values
+        years, counts = trends.term_series(df, term)
+        forecast = trends.linear_forecast(years, counts)
+        if forecast is None: return None
+        future_years, future_preds = forecast
         
         trend_df = pd.DataFrame({'year': years, 'count': counts})
         trend_df = trend_df[trend_df['count'] > 0]
         
-        if len(trend_df) < 3: return None
-        
-        X = trend_df['year'].values.reshape(-1, 1)
-        y = trend_df['count'].values
-        model = LinearRegression().fit(X, y)
-        
-        future_years = np.array([years[-1]+1, years[-1]+2, years[-1]+3]).reshape(-1, 1)
-        future_preds = model.predict(future_years)
-        
         fig = go.Figure()
         fig.add_trace(go.Scatter(x=trend_df['year'], y=trend_df['count'], mode='lines+markers', name='Actual Data', line=dict(color='#00f2c3', width=3)))
         fig.add_trace(go.Scatter(x=future_years.flatten(), y=future_preds, mode='lines+markers', name='Prediction', line=dict(color='orange', dash='dot')))
@@ -202,4 +192,16 @@ class PlotManager:
     def plot_sunburst(self, df, term):
         term_data = df[df['bigram'] == term][['category', 'total']]
         fig = px.sunburst(term_data, path=['category'], values='total', title=f"'{term}' Category Distribution", template="plotly_dark")
+        return fig
+
+    def plot_similar_trends(self, trajectories, term):
+        # trajectories: TrajectoryIndex.trajectories() (z-scores, shape only)
+        plot_data = trajectories.assign(series=trajectories['bigram'] + " (" + trajectories['category'] + ")")
+        fig = px.line(
+            plot_data, x='year', y='z', color='series',
+            title=f"Terms Trending Like '{term}' (z-score of normalized frequency)",
+            template="plotly_dark"
+        )
+        fig.update_traces(opacity=0.5)
+        fig.update_traces(selector=dict(name=plot_data['series'].iloc[0]), opacity=1.0, line=dict(width=4))
         return fig
\ No newline at end of file
@@ -0,0 +1,293 @@
+import os
+import threading
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import duckdb
+import warehouse
+import term_metrics
+import bursts
+
+# ---------------------------------------------------------
+# SQL SORGU KATMANI (DuckDB, süreç içi)
+# ---------------------------------------------------------
+# Dashboard'un cevaplamadığı sorular için her seferinde yeni bir pandas scripti yazmak
+# yerine terim deposu süreç içi bir DuckDB veritabanına yüklenir (sunucu yok).
+# Yıldız şema: büyük tablolarda terim adı yerine tam sayı term_id tutulur, adlar
+# sorgunun sonunda (sadece sonuç satırlarına) terms tablosundan eklenir.
+#   terms         : (term_id, bigram)
+#   counts        : (term_id, category, year, count) -- sadece count > 0, (category, year)
+#                   sıralı: kategori/yıl filtreleri ilgisiz blokları hiç okumaz
+#   term_totals   : (term_id, category, first_year, last_year, active_years, total)
+#   domain_papers : (category, year, papers) -- domain_yearly_stats.csv
+# Serbest sorgular için adlı görünümler:
+#   term_counts (bigram, category, year, count), term_summary (bigram, category, first_year, ...),
+#   term_freq (term_counts + papers + per_10k: 10.000 makale başına kullanım),
+#   terms_wide (warehouse.load_terms() tablosu, kopyasız), term_metrics, emerging_terms
+# Dış dosya erişimi kapalıdır (read_csv, COPY ... TO çalışmaz); serbest sorgular tek
+# bir SELECT olarak sarılıp satır sınırıyla çalıştırılır.
+
+PER_PAPERS = 10000
+MAX_ROWS = 5000
+
+# Hazır sorgular: parametreler $isim ile verilir. Değeri None olan yıl parametreleri
+# veri setinin son yılıyla doldurulur.
+PrebuiltQuery = namedtuple('PrebuiltQuery', ['title', 'description', 'sql', 'params'])
+
+PREBUILT = {
+    'growing_in_both': PrebuiltQuery(
+        "Growing in two fields",
+        "Terms used in both fields whose yearly count grew faster than min_growth per year (CAGR) "
+        "between `since` and `until` in each field.",
+        """
+        WITH span AS (
+            SELECT term_id, category,
+                   COALESCE(MAX(count) FILTER (WHERE year = $since), 0) AS start_count,
+                   COALESCE(MAX(count) FILTER (WHERE year = $until), 0) AS end_count
+            FROM counts
+            WHERE category IN ($category_a, $category_b) AND year IN ($since, $until)
+            GROUP BY ALL
+        ), growth AS (
+            SELECT *, POW(end_count / start_count, 1.0 / ($until - $since)) - 1 AS cagr
+            FROM span WHERE start_count >= $min_count
+        ), hits AS (
+            SELECT a.term_id, a.cagr AS cagr_a, b.cagr AS cagr_b,
+                   a.end_count AS count_a, b.end_count AS count_b
+            FROM growth a JOIN growth b ON a.term_id = b.term_id
+            WHERE a.category = $category_a AND b.category = $category_b
+              AND a.cagr > $min_growth AND b.cagr > $min_growth
+            ORDER BY LEAST(a.cagr, b.cagr) DESC
+            LIMIT $limit
+        )
+        SELECT t.bigram, ROUND(cagr_a, 3) AS cagr_a, ROUND(cagr_b, 3) AS cagr_b, count_a, count_b
+        FROM hits JOIN terms t USING (term_id)
+        ORDER BY LEAST(cagr_a, cagr_b) DESC
+        """,
+        {'category_a': 'economics', 'category_b': 'computer_science', 'since': 2019, 'until': None,
+         'min_growth': 0.2, 'min_count': 5, 'limit': 100}),
+    'top_terms': PrebuiltQuery(
+        "Top terms in a period",
+        "Most used terms of a field between `start` and `end`.",
+        """
+        WITH top AS (
+            SELECT term_id, SUM(count)::BIGINT AS count, COUNT(*) AS active_years
+            FROM counts
+            WHERE category = $category AND year BETWEEN $start AND $end
+            GROUP BY term_id
+            ORDER BY count DESC
+            LIMIT $limit
+        )
+        SELECT t.bigram, count, active_years
+        FROM top JOIN terms t USING (term_id)
+        ORDER BY count DESC
+        """,
+        {'category': 'computer_science', 'start': 2021, 'end': None, 'limit': 50}),
+    'share_leaders': PrebuiltQuery(
+        "Highest share of papers",
+        "Terms with the highest usage per 10,000 papers of their field in one year.",
+        """
+        WITH top AS (
+            SELECT c.term_id, c.category, c.count, d.papers,
+                   c.count * 10000.0 / d.papers AS per_10k
+            FROM counts c
+            JOIN domain_papers d ON d.category = c.category::VARCHAR AND d.year = c.year
+            WHERE c.year = $year AND c.count >= $min_count AND d.papers > 0
+            ORDER BY per_10k DESC
+            LIMIT $limit
+        )
+        SELECT t.bigram, category, count, papers, ROUND(per_10k, 2) AS per_10k
+        FROM top JOIN terms t USING (term_id)
+        ORDER BY per_10k DESC
+        """,
+        {'year': None, 'min_count': 20, 'limit': 50}),
+    'newcomers': PrebuiltQuery(
+        "Newcomer terms",
+        "Terms that first appear in a field in or after `since`, ranked by total use.",
+        """
+        WITH top AS (
+            SELECT term_id, category, first_year, total
+            FROM term_totals
+            WHERE first_year >= $since AND total >= $min_total
+            ORDER BY total DESC
+            LIMIT $limit
+        )
+        SELECT t.bigram, category, first_year, total
+        FROM top JOIN terms t USING (term_id)
+        ORDER BY total DESC
+        """,
+        {'since': 2018, 'min_total': 50, 'limit': 100}),
+    'cross_field': PrebuiltQuery(
+        "Cross-field terms",
+        "Terms used in at least `min_fields` different fields.",
+        """
+        WITH top AS (
+            SELECT term_id, COUNT(*) AS fields, SUM(total)::BIGINT AS total
+            FROM term_totals
+            GROUP BY term_id
+            HAVING COUNT(*) >= $min_fields
+            ORDER BY fields DESC, total DESC
+            LIMIT $limit
+        )
+        SELECT t.bigram, top.fields, top.total,
+               STRING_AGG(s.category::VARCHAR, ', ' ORDER BY s.category) AS categories
+        FROM top JOIN terms t USING (term_id) JOIN term_totals s USING (term_id)
+        GROUP BY ALL
+        ORDER BY top.fields DESC, top.total DESC
+        """,
+        {'min_fields': 3, 'limit': 100}),
+}
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _unpivot(table, year_cols, value):
+    cols = ', '.join(_quote(c) for c in year_cols)
+    return f"(UNPIVOT {table} ON {cols} INTO NAME year VALUE {value})"
+
+
+class QueryEngine:
+    """Terim deposu üzerinde süreç içi DuckDB veritabanı (salt okunur kullanılır)."""
+
+    def __init__(self, df_words, df_domains=None, metrics=None, emerging=None):
+        """df_words: warehouse.load_terms(), df_domains: warehouse.load_domain_stats()."""
+        self.con = duckdb.connect(':memory:')
+        self.lock = threading.Lock()
+        year_cols = warehouse.year_columns(df_words)
+        self.min_year, self.max_year = int(year_cols[0]), int(year_cols[-1])
+
+        # Terim adları bir kez sözlüğe yazılır; büyük tablolar sadece term_id taşır
+        bigram = df_words['bigram']
+        self.con.register('_terms', pd.DataFrame({
+            'term_id': np.arange(len(bigram.cat.categories), dtype=np.int32),
+            'bigram': np.asarray(bigram.cat.categories, dtype=object),
+        }))
+        self.con.execute("CREATE TABLE terms AS SELECT term_id, bigram::VARCHAR AS bigram FROM _terms")
+        self.con.unregister('_terms')
+
+        wide = pd.DataFrame({'term_id': bigram.cat.codes.to_numpy().astype(np.int32),
+                             'category': df_words['category']})
+        for year in year_cols:
+            wide[year] = df_words[year].to_numpy()
+        self.con.register('_wide', wide)
+        self.con.execute(f"""
+            CREATE TABLE counts AS
+            SELECT term_id, category, CAST(year AS SMALLINT) AS year, count
+            FROM {_unpivot('_wide', year_cols, 'count')}
+            WHERE count > 0
+            ORDER BY category, year
+        """)
+        self.con.unregister('_wide')
+        self.con.execute("""
+            CREATE TABLE term_totals AS
+            SELECT term_id, category, MIN(year) AS first_year, MAX(year) AS last_year,
+                   COUNT(*)::SMALLINT AS active_years, SUM(count)::BIGINT AS total
+            FROM counts GROUP BY ALL
+        """)
+        self.con.execute("""
+            CREATE VIEW term_counts AS
+            SELECT t.bigram, c.category, c.year, c.count FROM counts c JOIN terms t USING (term_id)
+        """)
+        self.con.execute("""
+            CREATE VIEW term_summary AS
+            SELECT t.bigram, s.* EXCLUDE (term_id) FROM term_totals s JOIN terms t USING (term_id)
+        """)
+        self.con.register('terms_wide', df_words)
+
+        if df_domains is not None:
+            self.con.register('_domains', df_domains)
+            self.con.execute(f"""
+                CREATE TABLE domain_papers AS
+                SELECT category, CAST(year AS SMALLINT) AS year, papers
+                FROM {_unpivot('_domains', warehouse.year_columns(df_domains), 'papers')}
+            """)
+            self.con.unregister('_domains')
+            self.con.execute(f"""
+                CREATE VIEW term_freq AS
+                SELECT t.bigram, t.category, t.year, t.count, d.papers,
+                       t.count * {PER_PAPERS}.0 / d.papers AS per_10k
+                FROM term_counts t
+                JOIN domain_papers d ON d.category = t.category::VARCHAR AND d.year = t.year
+                WHERE d.papers > 0
+            """)
+        if metrics is not None:
+            self.con.register('term_metrics', metrics)
+        if emerging is not None:
+            self.con.register('emerging_terms', emerging)
+
+        # Kayıtlı DataFrame'ler dışında dosya sistemi / ağ erişimi yok
+        self.con.execute("SET enable_external_access = false")
+        self.con.execute("SET lock_configuration = true")
+
+    def tables(self):
+        """Sorgulanabilir tablo/görünüm adları -> sütun adları."""
+        # Kayıtlı DataFrame'ler (terms_wide, term_metrics, ...) 'temp' şemasında görünür
+        rows = self.sql("SELECT table_name, column_name FROM information_schema.columns "
+                        "WHERE table_name NOT LIKE '\\_%' ESCAPE '\\' "
+                        "ORDER BY table_name, ordinal_position", max_rows=None)
+        schema = {}
+        for table, column in rows.itertuples(index=False):
+            schema.setdefault(table, []).append(column)
+        return schema
+
+    def defaults(self, name):
+        """Hazır sorgunun varsayılan parametreleri (None yıllar -> son yıl)."""
+        return {k: (self.max_year if v is None else v) for k, v in PREBUILT[name].params.items()}
+
+    def run(self, name, **params):
+        """Hazır sorguyu çalıştırır; verilmeyen parametreler varsayılanla doldurulur."""
+        unknown = set(params) - set(PREBUILT[name].params)
+        if unknown:
+            raise ValueError(f"Bilinmeyen parametre: {', '.join(sorted(unknown))}")
+        return self._execute(PREBUILT[name].sql, {**self.defaults(name), **params})
+
+    def sql(self, text, params=None, max_rows=MAX_ROWS):
+        """
+        Serbest SQL (tek SELECT / WITH sorgusu). Sonuç en fazla max_rows satırla
+        sınırlanır; tablo değiştiren veya birden çok ifade içeren sorgular çalışmaz.
+        """
+        # Sarmalamadan önce ifadelere ayrılır: "...) AS q; DROP TABLE ..." gibi parantezi
+        # kapatıp ikinci ifade ekleyen girdiler tek bir SELECT olmadığı için reddedilir
+        try:
+            statements = duckdb.extract_statements(text)
+        except duckdb.ParserException as e:
+            raise ValueError(str(e)) from None
+        if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+            raise ValueError("Sadece tek bir SELECT / WITH sorgusu çalıştırılabilir.")
+        text = statements[0].query.strip().rstrip(';').rstrip()
+        if max_rows is not None:
+            text = f"SELECT * FROM (\n{text}\n) AS q LIMIT {int(max_rows)}"  # satır sonu: '--' yorumu sarmalayıcıyı yutmasın
+        return self._execute(text, params)
+
+    def _execute(self, text, params):
+        # Kayıtlı DataFrame'ler sadece bu bağlantıda görünür (cursor'larda değil);
+        # oturumların sorguları sırayla çalışır, milisaniyeler sürdüğü için yeterli
+        with self.lock:
+            result = self.con.execute(text, params or {}).arrow()
+            table = result.read_all() if hasattr(result, 'read_all') else result
+        # Sözlük kodlu (ENUM/kategorik) sütunlar düz metne çevrilir: pandas'a büyük
+        # sözlüğün tamamı değil sadece sonuç satırları gider
+        columns = [col.cast(col.type.value_type) if pa.types.is_dictionary(col.type) else col
+                   for col in table.columns]
+        return pa.table(columns, names=table.column_names).to_pandas()
+
+
+@lru_cache(maxsize=2)
+def _load_engine_cached(words_path, domains_path, words_version, domains_version):
+    df_domains = warehouse.load_domain_stats(domains_path) if domains_version else None
+    emerging = bursts.load_emerging(words_path, domains_path) if domains_version else None
+    return QueryEngine(warehouse.load_terms(words_path), df_domains,
+                       term_metrics.load_metrics(words_path), emerging)
+
+
+def load_engine(words_path=warehouse.MAIN_DATA_PATH, domains_path=warehouse.DOMAIN_STATS_PATH):
+    """Paylaşılan QueryEngine (dosyalar değişince yeniden kurulur). Ana veri yoksa None."""
+    words_path, domains_path = os.path.abspath(words_path), os.path.abspath(domains_path)
+    words_version = warehouse.dataset_version(words_path)
+    if words_version is None:
+        return None
+    return _load_engine_cached(words_path, domains_path, words_version,
+                               warehouse.dataset_version(domains_path))
@@ -0,0 +1,50 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+
+# ---------------------------------------------------------
+# İLGİLİ TERİMLER (PPMI + SVD KOMŞULARI)
+# ---------------------------------------------------------
+# Komşu listeleri offline hesaplanır (final/cooccurrence.py -> data/related_terms.csv):
+# makale düzeyinde eş-geçim, PPMI ve kesik SVD gömmelerinde kosinüs benzerliği.
+# Burada sadece okunur: tablo terime göre sıralanır, bir terimin komşuları ikili arama
+# ile bulunan ardışık bir satır aralığıdır (Deep Dive her aramada tabloyu taramaz).
+
+RELATED_PATH = os.path.join(warehouse.DATA_DIR, "related_terms.csv")
+
+
+class RelatedTerms:
+    def __init__(self, df):
+        """df: related_terms.csv (bigram, rank, related, similarity, cooccurrence)."""
+        self.table = df.sort_values(['bigram', 'rank'], kind='stable').reset_index(drop=True)
+        self.terms = self.table['bigram'].to_numpy(dtype=str)
+
+    def __len__(self):
+        return len(self.table)
+
+    def lookup(self, term, n=None):
+        """Terimin komşuları (rank sırasıyla); terim yoksa boş tablo."""
+        lo = np.searchsorted(self.terms, term, side='left')
+        hi = np.searchsorted(self.terms, term, side='right')
+        rows = self.table.iloc[lo:hi]
+        return rows.head(n) if n is not None else rows
+
+
+def _read_related(path):
+    return RelatedTerms(pd.read_csv(path, keep_default_na=False))
+
+
+@lru_cache(maxsize=2)
+def _load_related_cached(path, version):
+    return _read_related(path)
+
+
+def load_related(path=RELATED_PATH):
+    """Paylaşılan RelatedTerms (dosya değişince yeniden okunur). Dosya yoksa None."""
+    path = os.path.abspath(path)
+    version = warehouse.dataset_version(path)
+    if version is None:
+        return None
+    return _load_related_cached(path, version)
@@ -0,0 +1,138 @@
+from collections import defaultdict
+import numpy as np
+
+# ---------------------------------------------------------
+# SUNUCU TARAFI TERİM ARAMA İNDEKSİ
+# ---------------------------------------------------------
+# Deep Dive sayfası tüm sözlüğü tarayıcıya göndermek yerine bu indeksi sorgular;
+# tarayıcıya sadece bir sayfalık öneri gider.
+#   prefix    : alfabetik sıralı sözlükte ikili arama (searchsorted)
+#   substring : terimin içindeki her kelimeden başlayan sonekler ('deep learning' ->
+#               'learning') ayrı bir sıralı dizide tutulur; "learning" araması da ikili aramadır
+#   fuzzy     : harf üçlüleri (trigram) -> terim listeleri; ortak trigram oranına göre puan.
+#               Her sorguda çalışır (230k terimde birkaç ms): toplam eşleşme sayısı ve sıralama
+#               sayfadan bağımsızdır, tam eşleşmelerin arkasındaki fuzzy öneriler de sayfalanır.
+# Tam eşleşmeler terimin tüm kategorilerdeki toplam kullanımına (total) göre sıralanır.
+
+MATCH_ORDER = ['prefix', 'substring', 'fuzzy']
+FUZZY_MIN_SCORE = 0.3
+# Sözlüğün bu oranından fazlasında geçen trigram'lar ('ing', ' co') ayırt edici değil;
+# sorguda başka trigram varsa atlanır.
+COMMON_TRIGRAM_RATIO = 0.05
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TermIndex:
+    def __init__(self, df):
+        """df: warehouse.load_terms() tablosu (bigram, category, ..., total)."""
+        totals = df.groupby('bigram', observed=True)['total'].sum()
+        terms = np.array([str(t).lower() for t in totals.index], dtype=str)
+        order = np.argsort(terms, kind='stable')
+        self.terms = terms[order]
+        self.labels = np.array([str(t) for t in totals.index], dtype=object)[order]
+        self.totals = totals.to_numpy(dtype=np.int64)[order]
+
+        # Substring: kelime başından başlayan sonekler ve ait oldukları terim
+        suffixes, owners = [], []
+        for i, term in enumerate(self.terms):
+            pos = term.find(' ')
+            while pos != -1:
+                suffixes.append(term[pos + 1:])
+                owners.append(i)
+                pos = term.find(' ', pos + 1)
+        suffixes = np.array(suffixes, dtype=str)
+        order = np.argsort(suffixes, kind='stable')
+        self.suffixes = suffixes[order]
+        self.suffix_owners = np.array(owners, dtype=np.int64)[order]
+
+        # Fuzzy: trigram -> terim indeksleri
+        postings = defaultdict(list)
+        self.trigram_counts = np.zeros(len(self.terms), dtype=np.int32)
+        for i, term in enumerate(self.terms):
+            grams = trigrams(term)
+            self.trigram_counts[i] = len(grams)
+            for g in grams:
+                postings[g].append(i)
+        self.postings = {g: np.array(ids, dtype=np.int32) for g, ids in postings.items()}
+        self.common_limit = max(1, int(len(self.terms) * COMMON_TRIGRAM_RATIO))
+
+    def __len__(self):
+        return len(self.terms)
+
+    # --- Eşleştiriciler: terim indeksleri (sırasız) ---
+
+    @staticmethod
+    def _prefix_range(sorted_values, query):
+        lo = np.searchsorted(sorted_values, query, side='left')
+        hi = np.searchsorted(sorted_values, query + '\uffff', side='left')
+        return lo, hi
+
+    def prefix_ids(self, query):
+        lo, hi = self._prefix_range(self.terms, query)
+        return np.arange(lo, hi)
+
+    def substring_ids(self, query):
+        """Terimin ilk kelimesinden sonra başlayan eşleşmeler (örn. 'learning' -> 'deep learning')."""
+        lo, hi = self._prefix_range(self.suffixes, query)
+        return np.unique(self.suffix_owners[lo:hi])
+
+    def fuzzy_ids(self, query, min_score=FUZZY_MIN_SCORE):
+        """Ortak trigram / birleşim (Jaccard) >= min_score olan terimler ve puanları."""
+        query_grams = trigrams(query)
+        grams = [g for g in query_grams if g in self.postings]
+        rare = [g for g in grams if len(self.postings[g]) <= self.common_limit]
+        if not grams:
+            return np.array([], dtype=np.int64), np.array([])
+        # Adaylar nadir trigram'lardan gelir; ortak trigram'lar sadece puana eklenir
+        rare = rare or grams
+        candidates, shared = np.unique(np.concatenate([self.postings[g] for g in rare]), return_counts=True)
+        for g in grams:
+            if g in rare:
+                continue
+            posting = self.postings[g]  # artan sırada
+            pos = np.minimum(np.searchsorted(posting, candidates), len(posting) - 1)
+            shared += posting[pos] == candidates
+        union = self.trigram_counts[candidates] + len(query_grams) - shared
+        scores = shared / union
+        keep = scores >= min_score
+        return candidates[keep], scores[keep]
+
+    # --- Sorgu ---
+
+    def search(self, query, page=0, page_size=10):
+        """
+        Sıralı öneriler: önce tam eşleşmeler (prefix + substring) total'e göre azalan,
+        sonra fuzzy eşleşmeler benzerliğe göre. Geriye (sonuç_sayfası, toplam_eşleşme)
+        döner; toplam her sayfada aynıdır.
+        Sonuç satırları: {'term', 'total', 'match'}.
+        """
+        query = ' '.join(str(query).lower().split())
+        if not query:
+            return [], 0
+
+        # Tam eşleşmeler (prefix + substring) birlikte, total'e göre
+        prefix = self.prefix_ids(query)
+        exact = np.union1d(prefix, self.substring_ids(query))
+        exact = exact[np.argsort(-self.totals[exact], kind='stable')]
+        ranked = [exact]
+        # prefix_ids ardışık bir aralık: üyelik kontrolü iki karşılaştırma
+        is_prefix = (exact >= prefix[0]) & (exact <= prefix[-1]) if len(prefix) else np.zeros(len(exact), bool)
+        kinds = [np.where(is_prefix, 0, 1).astype(np.int8)]
+
+        # Fuzzy: tam eşleşmeler dışındakiler, önce benzerlik, eşitlikte total
+        ids, scores = self.fuzzy_ids(query)
+        keep = ~np.isin(ids, exact)
+        ids, scores = ids[keep], scores[keep]
+        ids = ids[np.lexsort((-self.totals[ids], -scores))]
+        ranked.append(ids)
+        kinds.append(np.full(len(ids), 2, dtype=np.int8))
+
+        ranked, kinds = np.concatenate(ranked), np.concatenate(kinds)
+        start = page * page_size
+        rows = [{'term': self.labels[i], 'total': int(self.totals[i]), 'match': MATCH_ORDER[k]}
+                for i, k in zip(ranked[start:start + page_size], kinds[start:start + page_size])]
+        return rows, len(ranked)
@@ -0,0 +1,103 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+
+# ---------------------------------------------------------
+# TERİM KARARLILIK / OYNAKLIK METRİKLERİ (BATCH)
+# ---------------------------------------------------------
+# Her (terim, kategori) satırı için yıl matrisi [satır × yıl] üzerinden, NumPy ile:
+#   total_volume : tüm yılların toplamı
+#   mean         : yıllık ortalama
+#   cv           : değişim katsayısı = std / mean (0 ortalamada NaN)
+#   growth_std   : yıldan yıla büyüme oranlarının std'si (önceki yıl > 0 olan yıllar)
+#   peak_year    : en yüksek sayımın yılı
+#   peak_share   : zirve yılın toplam içindeki payı (1'e yakın = tek yıllık patlama)
+#   burstiness   : (std - mean) / (std + mean), -1 (düzenli) .. 1 (patlamalı)
+#   active_years : sayımı > 0 olan yıl sayısı
+# Tablo `python term_metrics.py` ile data/term_metrics.csv'ye yazılır; dosya yoksa
+# veya veri setinden eskiyse yükleme sırasında bellekte hesaplanır.
+
+METRICS_PATH = os.path.join(warehouse.DATA_DIR, "term_metrics.csv")
+METRIC_COLUMNS = ['total_volume', 'mean', 'cv', 'growth_std', 'peak_year', 'peak_share',
+                  'burstiness', 'active_years']
+CHUNK_ROWS = 100_000  # büyük tablolarda float64 kopyası parça parça oluşturulur
+
+
+def _chunk_metrics(counts, years):
+    total = counts.sum(axis=1)
+    mean = counts.mean(axis=1)
+    std = counts.std(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = np.where(mean > 0, std / mean, np.nan)
+        burstiness = np.where(std + mean > 0, (std - mean) / (std + mean), np.nan)
+        peak_share = np.where(total > 0, counts.max(axis=1) / total, np.nan)
+
+        prev, curr = counts[:, :-1], counts[:, 1:]
+        growth = np.where(prev > 0, (curr - prev) / prev, np.nan)
+        valid = (~np.isnan(growth)).sum(axis=1)
+        growth_mean = np.nansum(growth, axis=1) / valid
+        growth_std = np.sqrt(np.nansum((growth - growth_mean[:, None]) ** 2, axis=1) / valid)
+    growth_std[valid < 2] = np.nan
+
+    return {
+        'total_volume': total.astype(np.int64),
+        'mean': mean.astype(np.float32),
+        'cv': cv.astype(np.float32),
+        'growth_std': growth_std.astype(np.float32),
+        'peak_year': years[counts.argmax(axis=1)],
+        'peak_share': peak_share.astype(np.float32),
+        'burstiness': burstiness.astype(np.float32),
+        'active_years': (counts > 0).sum(axis=1).astype(np.int16),
+    }
+
+
+def compute_metrics(df):
+    """warehouse.load_terms() tablosu -> (bigram, category, METRIC_COLUMNS...) tablosu."""
+    year_cols = warehouse.year_columns(df)
+    years = np.array([int(y) for y in year_cols], dtype=np.int16)
+    values = df[year_cols].to_numpy()
+
+    parts = [_chunk_metrics(values[i:i + CHUNK_ROWS].astype(np.float64), years)
+             for i in range(0, len(df), CHUNK_ROWS)]
+    metrics = pd.DataFrame({col: np.concatenate([p[col] for p in parts]) if parts else []
+                            for col in METRIC_COLUMNS})
+    metrics.insert(0, 'category', df['category'].to_numpy())
+    metrics.insert(0, 'bigram', df['bigram'].to_numpy())
+    return metrics
+
+
+def _read_metrics(path):
+    df = pd.read_csv(path, dtype={'bigram': 'category', 'category': 'category'})
+    return df[['bigram', 'category'] + METRIC_COLUMNS]
+
+
+@lru_cache(maxsize=2)
+def _load_metrics_cached(path, version, metrics_path):
+    # Batch çıktısı veri setinden yeniyse onu oku, değilse hesapla
+    if os.path.exists(metrics_path) and os.path.getmtime(metrics_path) >= os.path.getmtime(path):
+        return _read_metrics(metrics_path)
+    return compute_metrics(warehouse.load_terms(path))
+
+
+def load_metrics(path=warehouse.MAIN_DATA_PATH, metrics_path=METRICS_PATH):
+    """Paylaşılan metrik tablosu (salt okunur). Veri dosyası yoksa None."""
+    path = os.path.abspath(path)
+    version = warehouse.dataset_version(path)
+    if version is None:
+        return None
+    return _load_metrics_cached(path, version, os.path.abspath(metrics_path))
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    print(f"Veri yükleniyor: {warehouse.MAIN_DATA_PATH}")
+    terms = warehouse.load_terms()
+    if terms is None:
+        print("HATA: all_data_merged.csv bulunamadı.")
+    else:
+        table = compute_metrics(terms)
+        table.to_csv(METRICS_PATH, index=False, float_format='%.6g')
+        print(f"{len(table):,} satır -> {METRICS_PATH} ({time.perf_counter() - start:.2f} sn)")
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import warehouse
+
+# ---------------------------------------------------------
+# KATEGORİ BAŞINA TOP-K VE YILLIK İSTATİSTİKLER (GENİŞ TABLO ÜZERİNDE)
+# ---------------------------------------------------------
+# groupby('category').apply(nlargest) ve melt edilmiş uzun tablo üzerinde
+# groupby(mean/std/max) yerine:
+#   - satırlar (kategori kodu, -değer) ile tek seferde sıralanır (np.lexsort),
+#     her satırın kategori içindeki sırası = konum - kategorinin ilk konumu;
+#   - istatistikler yıl matrisi [satır × yıl] üzerinde NumPy indirgemeleriyle hesaplanır.
+
+
+def top_k_per_category(df, n, value_col='total'):
+    """
+    Her kategoride value_col'u en yüksek n satır (kategori sırasıyla, büyükten küçüğe).
+    df: warehouse.load_terms() tablosu; dönen tablo df'in satır alt kümesidir.
+    """
+    codes = df['category'].cat.codes.to_numpy()
+    values = df[value_col].to_numpy()
+    order = np.lexsort((-values.astype(np.float64), codes))
+    sorted_codes = codes[order]
+    # Her satırın kategorisinin sıralı dizideki ilk konumu
+    starts = np.searchsorted(sorted_codes, sorted_codes, side='left')
+    rank = np.arange(len(order)) - starts
+    return df.iloc[order[rank < n]]
+
+
+def year_statistics(df, year_cols=None):
+    """
+    Satır başına yıllık ortalama, standart sapma (ddof=1, pandas gibi) ve maksimum.
+    Dönen tablo df ile aynı index'e sahiptir.
+    """
+    year_cols = year_cols or warehouse.year_columns(df)
+    counts = df[year_cols].to_numpy(dtype=np.float64)
+    ddof = 1 if counts.shape[1] > 1 else 0
+    return pd.DataFrame({
+        'mean': counts.mean(axis=1),
+        'std': counts.std(axis=1, ddof=ddof),
+        'max': counts.max(axis=1, initial=0),
+    }, index=df.index)
@@ -0,0 +1,156 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warehouse
+import normalized
+
+# ---------------------------------------------------------
+# TREND BENZERLİĞİ İNDEKSİ ("BUNA BENZER TREND GÖSTEREN TERİMLER")
+# ---------------------------------------------------------
+# Her (terim, kategori) satırının son WINDOW_YEARS yıllık normalize frekans vektörü
+# (NormalizedCube.freq) z-normalize edilip birim uzunluğa getirilir: iki vektörün iç
+# çarpımı = iki trendin Pearson korelasyonu. Ölçekten bağımsızdır; çok kullanılan ve az
+# kullanılan terimler aynı şekilde yükseliyorsa benzer sayılır.
+#   exact : tek bir [satır × yıl] · [yıl] matris-vektör çarpımı + argpartition
+#   LSH   : rastgele hiper-düzlem (SimHash) tabloları; N_TABLES tablonun her birinde
+#           satırın N_BITS bitlik işaret kodu sıralı dizide tutulur. Sorgu kendi kodunun
+#           ve 1 bit uzağındaki kodların kovalarını ikili aramayla toplar (multi-probe),
+#           adaylar exact kosinüsle yeniden sıralanır.
+# 15 boyutlu vektörlerde exact tarama çok ucuzdur (400k satırda ~3 ms) ve trend şekilleri
+# kümelendiği için LSH kovaları kalabalıktır; LSH ancak satır sayısı EXACT_MAX_ROWS'u
+# aşınca otomatik devreye girer (benchmarks/bench_trajectory.py).
+# Pencerede hiç değişmeyen (hep 0 veya sabit) satırlar indekse girmez.
+
+WINDOW_YEARS = 15
+N_TABLES = 16
+N_BITS = 20
+EXACT_MAX_ROWS = 1_000_000
+SEED = 0
+
+
+def window_values(cube, window_years=WINDOW_YEARS):
+    """Son window_years yılın [satır × yıl] normalize frekansları (float32 kopya, NaN -> 0) ve yılları."""
+    years = cube.years[-window_years:] if window_years else cube.years
+    return years, np.nan_to_num(cube.freq[:, -len(years):], nan=0.0).astype(np.float32)
+
+
+def unit_trajectories(values):
+    """
+    Ortalaması çıkarılmış, birim uzunluklu trendler: (satırlar, [satır × yıl] vektörler,
+    merkezlenmiş normlar). Düz satırlar (norm ~ 0) dahil edilmez. values yerinde değişir.
+    """
+    values -= values.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(values, axis=1)
+    rows = np.flatnonzero(norms > 1e-6)
+    return rows, values[rows] / norms[rows, None], norms
+
+
+class TrajectoryIndex:
+    def __init__(self, cube, window_years=WINDOW_YEARS, n_tables=N_TABLES, n_bits=N_BITS, seed=SEED):
+        """cube: normalized.load_cube() (satırlar warehouse tablosuyla aynı sırada)."""
+        self.cube = cube
+        self.years, values = window_values(cube, window_years)
+        self.rows, self.vectors, _ = unit_trajectories(values)
+        self.columns = np.ascontiguousarray(self.vectors.T)  # exact tarama için [yıl × satır]
+        self.row_terms = cube.term_codes[self.rows]
+        self.position = np.full(len(cube.freq), -1, dtype=np.int64)
+        self.position[self.rows] = np.arange(len(self.rows))
+
+        # LSH tabloları ilk yaklaşık sorguda kurulur (exact yolda hiç gerekmez)
+        self.n_tables, self.n_bits, self.seed = n_tables, n_bits, seed
+        self.tables = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def build_tables(self):
+        """SimHash tabloları: kod = işaret bitleri, tablo başına sıralı (kod, pozisyon) dizileri."""
+        if self.tables is None:
+            rng = np.random.default_rng(self.seed)
+            self.planes = rng.standard_normal((self.vectors.shape[1], self.n_tables * self.n_bits)).astype(np.float32)
+            codes = self._codes(self.vectors)
+            order = np.argsort(codes, axis=0, kind='stable')
+            self.tables = (order, np.take_along_axis(codes, order, axis=0))
+        return self.tables
+
+    def _codes(self, vectors):
+        """[n × boyut] -> [n × tablo] tam sayı kodları."""
+        bits = (vectors @ self.planes > 0).reshape(len(vectors), self.n_tables, self.n_bits)
+        return (bits.astype(np.int64) << np.arange(self.n_bits)).sum(axis=2)
+
+    def candidates(self, vector):
+        """LSH adayları (indeks pozisyonları): her tabloda kendi kovası + 1 bit uzağındaki kovalar."""
+        order, sorted_codes = self.build_tables()
+        code = self._codes(vector[None, :])[0]
+        probes = code[:, None] ^ np.concatenate([[0], 1 << np.arange(self.n_bits)])[None, :]
+        hit = np.zeros(len(self.rows), dtype=bool)  # np.unique'ten ucuz
+        for t in range(self.n_tables):
+            lo = np.searchsorted(sorted_codes[:, t], probes[t], side='left')
+            hi = np.searchsorted(sorted_codes[:, t], probes[t], side='right')
+            for a, b in zip(lo, hi):
+                hit[order[a:b, t]] = True
+        return np.flatnonzero(hit)
+
+    def neighbors(self, position, k=10, exact=None):
+        """
+        Pozisyondaki satıra trendi en benzer k satır (aynı terimin diğer kategorileri hariç):
+        (pozisyonlar, benzerlikler), benzerliğe göre azalan.
+        """
+        exact = len(self.rows) <= EXACT_MAX_ROWS if exact is None else exact
+        vector = self.vectors[position]
+        if exact:
+            pool, sims = None, vector @ self.columns
+        else:
+            pool = self.candidates(vector)
+            sims = self.vectors[pool] @ vector
+
+        # Aynı terim en fazla kategori sayısı kadar satırda olabilir: o kadar fazla al, sonra ele
+        take = min(k + len(self.cube.categories), len(sims))
+        top = np.argpartition(-sims, take - 1)[:take] if take < len(sims) else np.arange(len(sims))
+        found = top if pool is None else pool[top]
+        keep = self.row_terms[found] != self.row_terms[position]
+        top, found = top[keep], found[keep]
+        order = np.argsort(-sims[top], kind='stable')[:k]
+        return found[order], sims[top[order]]
+
+    def similar(self, term, category, k=10, exact=None):
+        """Terimin bu kategorideki trendine en benzer k (terim, kategori): bigram, category, similarity."""
+        row = self.cube.rows_for([term], category)[0]
+        if row < 0 or self.position[row] < 0:
+            return pd.DataFrame(columns=['bigram', 'category', 'similarity'])
+        positions, sims = self.neighbors(self.position[row], k, exact)
+        rows = self.rows[positions]
+        return pd.DataFrame({
+            'bigram': self.cube.labels(rows),
+            'category': [self.cube.categories[c] for c in self.cube.row_categories[rows]],
+            'similarity': np.round(sims.astype(np.float64), 4),
+        })
+
+    def trajectories(self, terms, categories):
+        """Çizim için z-normalize trendler (bigram, category, year, z) -- uzun tablo."""
+        frames = []
+        for term, category in zip(terms, categories):
+            row = self.cube.rows_for([term], category)[0]
+            if row < 0 or self.position[row] < 0:
+                continue
+            z = self.vectors[self.position[row]] * np.sqrt(len(self.years))  # birim vektör -> z-skoru
+            frames.append(pd.DataFrame({'bigram': term, 'category': category, 'year': self.years, 'z': z}))
+        if not frames:
+            return pd.DataFrame(columns=['bigram', 'category', 'year', 'z'])
+        return pd.concat(frames, ignore_index=True)
+
+
+@lru_cache(maxsize=2)
+def _load_index_cached(words_path, domains_path, words_version, domains_version):
+    return TrajectoryIndex(normalized.load_cube(words_path, domains_path))
+
+
+def load_index(words_path=warehouse.MAIN_DATA_PATH, domains_path=warehouse.DOMAIN_STATS_PATH):
+    """Paylaşılan TrajectoryIndex (dosyalar değişince yeniden kurulur). Dosya yoksa None."""
+    words_path, domains_path = os.path.abspath(words_path), os.path.abspath(domains_path)
+    words_version = warehouse.dataset_version(words_path)
+    domains_version = warehouse.dataset_version(domains_path)
+    if words_version is None or domains_version is None:
+        return None
+    return _load_index_cached(words_path, domains_path, words_version, domains_version)
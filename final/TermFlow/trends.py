@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import warehouse
+
+# ---------------------------------------------------------
+# BÜYÜME VE TAHMİN HESAPLARI (ÇİZİMDEN BAĞIMSIZ)
+# ---------------------------------------------------------
+# PlotManager (grafikler) ve api.py (JSON uç noktaları) aynı sayıları üretsin diye
+# hesaplar burada, plotly/streamlit'e bağlı olmadan tutulur.
+#   growth_table   : bir alanda iki yıl arası yıllık bileşik büyüme (CAGR)
+#   term_series    : terimin tüm kategorilerdeki yıllık toplam sayımı
+#   linear_forecast: sıfır olmayan yıllara doğrusal uyum, sonraki yıllar için tahmin
+
+FORECAST_YEARS = 3
+MIN_FORECAST_POINTS = 3
+
+
+def growth_table(df, category, start_year, end_year, min_end=5):
+    """
+    Kategoride start_year'da kullanılmış ve end_year'da en az min_end kez geçen terimlerin
+    (bigram, start_count, end_count, cagr) tablosu. Yıl sütunu yoksa None.
+    """
+    s_col, e_col = str(start_year), str(end_year)
+    if s_col not in df.columns or e_col not in df.columns:
+        return None
+
+    cat_df = df[df['category'] == category]
+    start = cat_df[s_col].to_numpy(dtype=np.float64)
+    end = cat_df[e_col].to_numpy(dtype=np.float64)
+    keep = (start > 0) & (end >= min_end)
+    start, end = start[keep], end[keep]
+
+    years_diff = max(end_year - start_year, 1)
+    return pd.DataFrame({
+        'bigram': cat_df['bigram'].to_numpy()[keep],
+        'start_count': start,
+        'end_count': end,
+        'cagr': (end / start) ** (1 / years_diff) - 1,
+    }, index=cat_df.index[keep])
+
+
+def term_series(df, term):
+    """Terimin tüm kategorilerdeki yıllık toplam sayımı: (yıllar, sayımlar)."""
+    year_cols = warehouse.year_columns(df)
+    counts = df.loc[df['bigram'] == term, year_cols].to_numpy(dtype=np.float64).sum(axis=0)
+    return np.array([int(y) for y in year_cols]), counts
+
+
+def linear_forecast(years, counts, horizon=FORECAST_YEARS):
+    """
+    Sayımı sıfır olmayan yıllara doğrusal (en küçük kareler) uyum; son yıldan sonraki
+    horizon yıl için (gelecek_yıllar, tahminler). Yeterli nokta yoksa None.
+    """
+    years, counts = np.asarray(years), np.asarray(counts, dtype=np.float64)
+    observed = counts > 0
+    if observed.sum() < MIN_FORECAST_POINTS:
+        return None
+    slope, intercept = np.polyfit(years[observed].astype(np.float64), counts[observed], 1)
+    future_years = years[-1] + np.arange(1, horizon + 1)
+    return future_years, slope * future_years + intercept
@@ -2,6 +2,11 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import warehouse
+import topk
 
 # -----------------------------------------------------------------------------
 # 1. SAYFA AYARLARI
@@ -14,143 +19,73 @@ Bu dashboard, yüklenen birleştirilmiş veri seti üzerinden akademik terimleri
 """)
 
 # -----------------------------------------------------------------------------
-# 2. VERİ YÜKLEME VE İŞLEME (TEK DOSYA - WIDE FORMAT)
+# 2. VERİ YÜKLEME (TEK DOSYA - WIDE FORMAT, MELT YOK)
 # -----------------------------------------------------------------------------
-@st.cache_data(show_spinner=True)
-def load_data(file_path="all_data_merged.csv"):
-    if not os.path.exists(file_path):
-        st.error(f"'{file_path}' dosyası bulunamadı! Lütfen dosyayı proje klasörüne ekleyin.")
-        return None
-
+def load_data(file_path=warehouse.MAIN_DATA_PATH):
     try:
-        df = pd.read_csv(file_path)
-        
-        # Sütun isimlerini temizle (küçük harf, boşluksuz)
-        df.columns = [str(c).lower().strip() for c in df.columns]
-
-        # --- DÜZELTME 1: 'unnamed: 0' SÜTUNUNU 'bigram' YAP ---
-        # Senin dosyanın özel durumu bu
-        if 'unnamed: 0' in df.columns:
-            df.rename(columns={'unnamed: 0': 'bigram'}, inplace=True)
-        
-        # Diğer olası isimleri de kontrol et
-        elif 'term' in df.columns:
-            df.rename(columns={'term': 'bigram'}, inplace=True)
+        # Ortak tablo: 'bigram' sütunu sabit, yıllar tam sayı ve boşluklar zaten 0
+        df = warehouse.load_terms(file_path)
+        if df is None:
+            st.error(f"'{file_path}' dosyası bulunamadı! Lütfen dosyayı proje klasörüne ekleyin.")
+            return None, None
 
-        # Bigram sütunu yoksa hata ver
-        if 'bigram' not in df.columns:
-            st.error("Veri setinde kelime sütunu (bigram) bulunamadı.")
-            return None
-
-        # --- DÜZELTME 2: BOŞLUKLARI DOLDUR (NaN -> 0) ---
-        # Yıl sütunlarındaki boşlukları 0 yapalım ki grafik kopmasın
-        df.fillna(0, inplace=True)
-
-        # --- DÜZELTME 3: WIDE TO LONG (YILLARI DÖNÜŞTÜRME) ---
         # Sadece sayısal yıl sütunlarını bul (Örn: 1990, 2020...)
-        year_cols = [c for c in df.columns if c.isdigit() and 1900 <= int(c) <= 2030]
-        
-        if year_cols:
-            # Sabit kalacak sütunlar (Bigram, Category, Total)
-            # Eğer total veya category yoksa onları korumaya çalışma
-            fixed_cols = [c for c in df.columns if c not in year_cols]
-            
-            # Melt işlemi: Yılları satıra indir
-            df_long = df.melt(
-                id_vars=fixed_cols, 
-                value_vars=year_cols, 
-                var_name='year', 
-                value_name='count'
-            )
-            
-            # Veri tipi düzeltme
-            df_long['year'] = pd.to_numeric(df_long['year'], errors='coerce')
-            df_long['count'] = pd.to_numeric(df_long['count'], errors='coerce')
-            
-            return df_long
-        else:
+        year_cols = [c for c in warehouse.year_columns(df) if 1900 <= int(c) <= 2030]
+        if not year_cols:
             st.error("Yıl sütunları bulunamadı (1990-2030 arası).")
-            return None
+            return None, None
+        return df, year_cols
 
     except Exception as e:
         st.error(f"Dosya okunurken hata oluştu: {e}")
-        return None
+        return None, None
 
 # -----------------------------------------------------------------------------
-# 3. TOP 12 FİLTRELEME (TOTAL SÜTUNUNU KULLANARAK)
+# 3. TOP 12 FİLTRELEME + 4. İSTATİSTİK HESAPLAMA (VEKTÖREL)
 # -----------------------------------------------------------------------------
-def filter_top_n_per_category(df, n=12):
-    # Senin dosyalarda 'total' sütunu olduğu için işimiz çok kolay
-    if 'total' in df.columns:
-        # Tekilleştir: Her bigram için tek bir satır al
-        unique_bigrams = df[['category', 'bigram', 'total']].drop_duplicates()
-        
-        # Her kategoride en yüksek 'total'e sahip n bigramı seç
-        top_terms = unique_bigrams.groupby('category').apply(
-            lambda x: x.nlargest(n, 'total')
-        ).reset_index(drop=True)
-        
-        # Ana veriyi sadece bu seçilenler için filtrele
-        merged_df = pd.merge(df, top_terms[['category', 'bigram']], on=['category', 'bigram'], how='inner')
-        return merged_df
-    else:
-        # Total yoksa kendimiz hesaplarız
-        total_counts = df.groupby(['category', 'bigram'])['count'].sum().reset_index()
-        top_terms = total_counts.groupby('category').apply(
-            lambda x: x.nlargest(n, 'count')
-        ).reset_index(drop=True)
-        merged_df = pd.merge(df, top_terms[['category', 'bigram']], on=['category', 'bigram'], how='inner')
-        return merged_df
-
-# -----------------------------------------------------------------------------
-# 4. İSTATİSTİK HESAPLAMA
-# -----------------------------------------------------------------------------
-def calculate_statistics(df):
-    stats = df.groupby(['category', 'bigram'])['count'].agg(
-        Yıllık_Ortalama='mean',
-        Standart_Sapma='std',
-        Maksimum_Görülme='max'
-    ).reset_index()
-    
-    # Toplamı ekle
-    if 'total' in df.columns:
-        totals = df[['category', 'bigram', 'total']].drop_duplicates()
-        stats = pd.merge(stats, totals, on=['category', 'bigram'])
-    else:
-        totals = df.groupby(['category', 'bigram'])['count'].sum().reset_index()
-        totals.rename(columns={'count': 'total'}, inplace=True)
-        stats = pd.merge(stats, totals, on=['category', 'bigram'])
-        
-    return stats.round(2)
+@st.cache_data(show_spinner=False)
+def build_top_terms(version, n=12, file_path=warehouse.MAIN_DATA_PATH):
+    """
+    Her kategoriden 'total'i en büyük n bigram (geniş tablo) ve istatistikleri.
+    Sadece küçük sonuç önbelleğe alınır; version dosya değişince yenilenir.
+    """
+    df, year_cols = load_data(file_path)
+    if df is None:
+        return None, None, None
+
+    top = topk.top_k_per_category(df, n, 'total')
+    top = top[['category', 'bigram', 'total'] + year_cols].reset_index(drop=True)
+    top['category'] = top['category'].astype(str)
+    top['bigram'] = top['bigram'].astype(str)
+
+    year_stats = topk.year_statistics(top, year_cols)
+    stats_df = pd.DataFrame({
+        'category': top['category'],
+        'bigram': top['bigram'],
+        'Yıllık_Ortalama': year_stats['mean'],
+        'Standart_Sapma': year_stats['std'],
+        'Maksimum_Görülme': year_stats['max'],
+        'total': top['total'],
+    }).round(2)
+    return top, stats_df, year_cols
 
 # -----------------------------------------------------------------------------
 # UYGULAMA AKIŞI
 # -----------------------------------------------------------------------------
 
-# A. Veriyi Yükle
-df_raw = load_data("all_data_merged.csv")
-
-if df_raw is not None:
-    # B. Filtrele (Her kategoriden en büyük 12 Bigram)
-    df_filtered = filter_top_n_per_category(df_raw, n=12)
-    
-    # C. İstatistikleri Hazırla
-    stats_df = calculate_statistics(df_filtered)
+# A/B/C. Veriyi yükle, her kategoriden en büyük 12 bigramı seç, istatistikleri hazırla
+df_top, stats_df, year_cols = build_top_terms(warehouse.dataset_version(), n=12)
 
+if df_top is not None:
     # --- LAYOUT ---
     col1, col2 = st.columns([3, 2])
 
     with col1:
         st.subheader("🌞 Kategorik Bigram Dağılımı")
         
-        # Sunburst verisi hazırlığı
-        if 'total' in df_filtered.columns:
-            # Sadece tekil bigramları al
-            df_sun = df_filtered[['category', 'bigram', 'total']].drop_duplicates()
-            val_col = 'total'
-        else:
-            df_sun = df_filtered.groupby(['category', 'bigram'])['count'].sum().reset_index()
-            val_col = 'count'
+        # Sunburst verisi hazırlığı (her bigram zaten tek satır)
+        df_sun = df_top[['category', 'bigram', 'total']]
+        val_col = 'total'
 
         fig_sun = px.sunburst(
             df_sun,
@@ -166,7 +101,7 @@ if df_raw is not None:
         st.subheader("📈 Trend Analizi")
         
         # Seçim Kutusu
-        unique_options = df_filtered[['category', 'bigram']].drop_duplicates()
+        unique_options = df_top[['category', 'bigram']].copy()
         unique_options['label'] = unique_options['category'] + " - " + unique_options['bigram']
         
         selected_label = st.selectbox(
@@ -177,11 +112,12 @@ if df_raw is not None:
         if selected_label:
             sel_cat, sel_term = selected_label.split(" - ")
             
-            # Çizgi Grafik
-            subset_trend = df_filtered[
-                (df_filtered['category'] == sel_cat) & 
-                (df_filtered['bigram'] == sel_term)
-            ].sort_values('year')
+            # Çizgi Grafik (seçilen satırın yıl sütunları)
+            sel_row = df_top[(df_top['category'] == sel_cat) & (df_top['bigram'] == sel_term)].iloc[0]
+            subset_trend = pd.DataFrame({
+                'year': [int(y) for y in year_cols],
+                'count': sel_row[year_cols].to_numpy(dtype=int),
+            })
             
             fig_line = px.line(
                 subset_trend,
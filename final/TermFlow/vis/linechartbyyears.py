@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
-import glob
 
 # ---------------------------------------------------------
 # 1. SAYFA AYARLARI
@@ -20,64 +19,39 @@ Hangi konunun hangi dönemde zirve yaptığını net bir şekilde görebilirsini
 """)
 
 # ---------------------------------------------------------
-# 2. VERİ YÜKLEME VE BİRLEŞTİRME FONKSİYONU
+# 2. VERİ YÜKLEME (TEK TABLO)
 # ---------------------------------------------------------
+# hw3/procces.py tüm takip edilen terimleri tek bir (group, term, period, count)
+# tablosuna yazar; eş anlamlılar (örn. electric vehicle/vehicles) zaten birleştirilmiştir.
+# Dosya repodaki yerinden (final/TermFlow/vis -> hw3/data) bulunur; çalışma klasörüne bağlı değil
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+TERM_COUNTS_FILE = os.path.join(REPO_DIR, "hw3", "data", "tracked_term_counts.csv")
+
 @st.cache_data
-def load_and_merge_data(folder_path="data"):
-    # Klasördeki tüm .csv dosyalarını bul
-    all_files = glob.glob(os.path.join(folder_path, "*.csv"))
-    
-    if not all_files:
+def load_term_counts(file_path=TERM_COUNTS_FILE):
+    if not os.path.exists(file_path):
         return None
 
-    df_list = []
-    
-    for filename in all_files:
-        try:
-            # CSV dosyasını oku
-            df = pd.read_csv(filename)
-            
-            # Sütun isimlerini kontrol et ve standartlaştır (küçük harf yap)
-            df.columns = [c.lower() for c in df.columns]
-            
-            # Eğer dosya boşsa veya gerekli sütunlar yoksa atla
-            if 'period' not in df.columns or 'count' not in df.columns:
-                continue
-
-            # Dosya isminden "Konu Adını" çıkar
-            # Örnek: "data/artificial_intelligence_quarterly_counts.csv" -> "Artificial Intelligence"
-            base_name = os.path.basename(filename) # dosya adı
-            topic_slug = base_name.replace("_quarterly_counts.csv", "").replace(".csv", "")
-            topic_name = topic_slug.replace("_", " ").title() # Alt tireleri boşluk yap, Baş Harfi Büyüt
-            
-            # Veriye 'Topic' sütunu ekle (Bu çizgi rengi olacak)
-            df['topic'] = topic_name
-            
-            df_list.append(df)
-            
-        except Exception as e:
-            st.error(f"Hata: {filename} dosyası okunurken sorun oluştu. {e}")
-            continue
-
-    if df_list:
-        # Tüm küçük tabloları alt alta birleştir (Long Format)
-        main_df = pd.concat(df_list, ignore_index=True)
-        return main_df
-    else:
+    try:
+        df = pd.read_csv(file_path)
+        df.columns = [c.lower() for c in df.columns]
+
+        if not {'term', 'period', 'count'}.issubset(df.columns):
+            st.error(f"Hata: {file_path} dosyasında 'term', 'period', 'count' sütunları olmalı.")
+            return None
+
+        # 'Topic' sütunu çizgi rengi olacak
+        return df.rename(columns={'term': 'topic'})
+
+    except Exception as e:
+        st.error(f"Hata: {file_path} dosyası okunurken sorun oluştu. {e}")
         return None
 
 # ---------------------------------------------------------
 # 3. VERİYİ İŞLEME VE GÖRSELLEŞTİRME
 # ---------------------------------------------------------
 
-# Veriyi yükle (data klasöründen)
-# Eğer 'data' klasörün yoksa kod hata vermesin diye kontrol ediyoruz:
-if not os.path.exists("data"):
-    os.makedirs("data")
-    st.warning("⚠️ 'data' klasörü oluşturuldu. Lütfen CSV dosyalarınızı bu klasörün içine atıp sayfayı yenileyin.")
-    st.stop()
-
-df = load_and_merge_data("data")
+df = load_term_counts()
 
 if df is not None:
     # --- A. FİLTRELEME (SIDEBAR) ---
@@ -149,4 +123,4 @@ if df is not None:
     else:
         st.warning("Lütfen sol taraftan en az bir konu seçin.")
 else:
-    st.error("Veri bulunamadı! 'data' klasörüne CSV dosyalarını yüklediğinizden emin olun.")
\ No newline at end of file
+    st.error(f"Veri bulunamadı! '{TERM_COUNTS_FILE}' yok; hw3 klasöründe 'python procces.py' çalıştırın.")
\ No newline at end of file
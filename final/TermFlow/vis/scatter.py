@@ -2,6 +2,11 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import warehouse
+import lod
 
 st.set_page_config(page_title="Scatterplot Matrix", layout="wide")
 st.title("🧩 Etkileşimli İlişki Matrisi (Scatterplot Matrix)")
@@ -11,47 +16,14 @@ st.markdown("Farklı disiplinler arasındaki terim geçişkenliğini analiz etme
 # 1. VERİYİ YÜKLE VE PIVOT ET (ÇAPRAZ TABLO)
 # ---------------------------------------------------------
 @st.cache_data
-def load_and_pivot_data(file_path="all_data_merged.csv"):
-    if not os.path.exists(file_path):
-        st.error(f"❌ HATA: '{file_path}' dosyası bulunamadı.")
-        return None
-
+def load_and_pivot_data(file_path=warehouse.MAIN_DATA_PATH):
     try:
-        df = pd.read_csv(file_path)
-        # Sütun isimlerini temizle
-        df.columns = [str(c).lower().strip() for c in df.columns]
-
-        # 1. Kelime Sütununu Bul
-        # 'bigram', 'term', 'keyword', 'unnamed: 0' olabilir
-        term_col = None
-        possible_names = ['bigram', 'term', 'keyword', 'word', 'unnamed: 0']
-        for name in possible_names:
-            if name in df.columns:
-                term_col = name
-                break
-        
-        # Eğer unnamed: 0 ise adını bigram yapalım
-        if term_col == 'unnamed: 0':
-            df.rename(columns={'unnamed: 0': 'bigram'}, inplace=True)
-            term_col = 'bigram'
-
-        if not term_col:
-            st.error("❌ Veri setinde kelime sütunu (bigram/term) bulunamadı.")
-            st.write("Mevcut sütunlar:", df.columns.tolist())
-            return None
-
-        # 2. Sayı Sütununu Bul
-        # 'total' varsa onu kullan, yoksa hata
-        if 'total' not in df.columns:
-            # Belki hesaplamamız gerekir?
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            # Yıl sütunlarını topla
-            df['total'] = df[numeric_cols].sum(axis=1)
-
-        # 3. Kategori Sütunu Var mı?
-        if 'category' not in df.columns:
-            st.error("❌ Veri setinde 'category' sütunu bulunamadı. Pivot işlemi yapılamaz.")
+        # Ortak, önbellekli tablo (bigram / category / yıllar / total)
+        df = warehouse.load_terms(file_path)
+        if df is None:
+            st.error(f"❌ HATA: '{file_path}' dosyası bulunamadı.")
             return None
+        term_col = 'bigram'
 
         # --- PIVOT İŞLEMİ ---
         # Amaç: Kategorileri sütun haline getirmek.
@@ -60,7 +32,8 @@ def load_and_pivot_data(file_path="all_data_merged.csv"):
             index=term_col, 
             columns='category', 
             values='total', 
-            aggfunc='sum'
+            aggfunc='sum',
+            observed=True
         ).fillna(0) # Boşluklara 0 yaz
 
         # Toplam büyüklüğü de bir sütun olarak ekle (Renk/Boyut için)
@@ -104,11 +77,23 @@ if data_result:
         mask = pivot_df[selected_cats].sum(axis=1) > 0
         filtered_df = pivot_df[mask]
 
+        # Level of detail: en büyük + en alana özgü terimler tek tek, geri kalanlar
+        # log ızgara hücresi başına tek temsilci (splom zaten WebGL ile çizilir)
+        detail_df, rest_df = lod.level_of_detail(filtered_df, selected_cats, 'Grand_Total')
+        if not rest_df.empty:
+            reps = lod.tile_representatives(rest_df, selected_cats, 'Grand_Total')
+            plot_df = pd.concat([detail_df.assign(tile_count=1), reps], ignore_index=True)
+            st.caption(f"{len(filtered_df):,} terimden {len(detail_df):,} tanesi tek tek, "
+                       f"kalan {len(rest_df):,} terim {len(reps):,} hücre temsilcisiyle gösteriliyor.")
+        else:
+            plot_df = filtered_df.assign(tile_count=1)
+
         fig = px.scatter_matrix(
-            filtered_df,
+            plot_df,
             dimensions=selected_cats,  # Seçilen kategoriler eksen olur
             color="Grand_Total",       # Renk, kelimenin genel popülaritesini gösterir
             hover_name=term_name,      # Üzerine gelince kelime yazar
+            hover_data=['tile_count'],  # Temsilci ise hücredeki terim sayısı
             height=900,                # Grafik yüksekliği
             width=1000,
             opacity=0.6,               # Noktalar hafif şeffaf olsun ki yoğunluk görülsün
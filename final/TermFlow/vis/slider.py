@@ -3,6 +3,10 @@ import pandas as pd
 import plotly.express as px
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import warehouse
 
 # --- SAYFA AYARLARI ---
 st.set_page_config(page_title="Yükselen Yıldızlar Matrisi", layout="wide")
@@ -16,37 +20,18 @@ Bu modül, verisetindeki hatalı (astronomik) sayıları temizler ve **Büyüme/
 # ---------------------------------------------------------
 # 1. VERİ YÜKLEME VE KATI TEMİZLİK
 # ---------------------------------------------------------
-@st.cache_data
-def load_and_clean_data(file_path="all_data_merged.csv"):
-    if not os.path.exists(file_path):
-        st.error(f"'{file_path}' bulunamadı.")
-        return None
-
+def load_and_clean_data(file_path=warehouse.MAIN_DATA_PATH):
+    # Tablo warehouse'ta süreç genelinde önbellekli; burada sadece filtre maskesi hesaplanır
     try:
-        df = pd.read_csv(file_path)
-        df.columns = [str(c).lower().strip() for c in df.columns]
-        
-        # Kelime sütunu bul
-        term_col = next((c for c in ['bigram', 'term', 'keyword', 'unnamed: 0'] if c in df.columns), None)
-        if term_col == 'unnamed: 0': 
-            df.rename(columns={'unnamed: 0': 'bigram'}, inplace=True)
-            term_col = 'bigram'
-            
-        if not term_col or 'category' not in df.columns:
-            st.error("Gerekli sütunlar eksik.")
+        df = warehouse.load_terms(file_path)
+        if df is None:
+            st.error(f"'{file_path}' bulunamadı.")
             return None
 
-        # Yıl sütunlarını bul
-        year_cols = [c for c in df.columns if c.isdigit() and 1990 <= int(c) <= 2030]
+        # Yıl sütunlarını bul (warehouse'ta sayıya çevrilmiş, boşluklar 0)
+        year_cols = [c for c in warehouse.year_columns(df) if 1990 <= int(c) <= 2030]
         
         # --- DEMİR YUMRUK TEMİZLİĞİ ---
-        # 1. Her şeyi sayıya çevir (Hata verenleri NaN yap)
-        for yc in year_cols:
-            df[yc] = pd.to_numeric(df[yc], errors='coerce')
-        
-        # 2. NaN olanları 0 yap
-        df[year_cols] = df[year_cols].fillna(0)
-
         # 3. MANTIK SINIRI (Hard Cap)
         # Bir kelime bir yılda 200.000'den fazla geçemez. (ArXiv'in yıllık kapasitesi belli)
         # Eğer bir satırda bile bu sınırı aşan sayı varsa, o kelimeyi komple çöpe at.
@@ -56,10 +41,11 @@ def load_and_clean_data(file_path="all_data_merged.csv"):
         # Satır bazında kontrol: Herhangi bir yılı max sınırdan büyük olanları bulma
         mask_valid = (df[year_cols] <= MAX_REALISTIC_COUNT).all(axis=1)
         
-        df_clean = df[mask_valid].copy()
+        df_clean = df[mask_valid]
         
         dropped_count = len(df) - len(df_clean)
-        if dropped_count > 0:
+        if dropped_count > 0 and not st.session_state.get('cleanup_notified'):
+            st.session_state['cleanup_notified'] = True
             st.toast(f"🧹 Veri Temizliği: {dropped_count} adet hatalı (astronomik değerli) satır silindi.", icon="🗑️")
 
         return df_clean, year_cols
@@ -0,0 +1,189 @@
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# TERİM DEPOSU (WAREHOUSE) ERİŞİMİ
+# ---------------------------------------------------------
+# all_data_merged.csv ve domain_yearly_stats.csv tek yerden okunur.
+# Okunan tablo süreç (process) genelinde bir kez önbelleğe alınır: aynı Streamlit
+# sunucusundaki tüm sayfalar/oturumlar ve offline scriptler aynı kopyayı paylaşır.
+#
+# Dönen DataFrame PAYLAŞILIR ve salt okunur kabul edilir: üzerine sütun eklemek veya
+# değer yazmak gerekiyorsa önce filtreleyip .copy() alın.
+
+# pipeline.py --workdir DIR aşamaları TERMFLOW_DATA_DIR=DIR/TermFlow/data ile çalıştırır
+DATA_DIR = os.environ.get('TERMFLOW_DATA_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+MAIN_DATA_PATH = os.path.join(DATA_DIR, "all_data_merged.csv")
+DOMAIN_STATS_PATH = os.path.join(DATA_DIR, "domain_yearly_stats.csv")
+
+# Kelime sütunu dosyaya göre farklı isimlerle gelebiliyor
+TERM_COLUMN_CANDIDATES = ['bigram', 'term', 'keyword', 'word', 'ngram', 'unnamed: 0']
+
+# ---------------------------------------------------------
+# ŞEMA
+# ---------------------------------------------------------
+# bigram / category -> category (sözlük kodlu: her satırda string yerine küçük bir kod)
+# yıl sütunları ('1986'..'2025') -> hepsine sığan en küçük tam sayı tipi (boşluklar 0)
+# total -> yıl sütunlarının toplamı, kendine sığan en küçük tam sayı tipi
+# Yıl sütunları tek tip tutulur: pandas onları tek bir 2B blokta saklar ve
+# satır bazlı işlemler (sum(axis=1), .values) kopyasız çalışır.
+SCHEMA = {
+    'bigram': 'category',
+    'category': 'category',
+}
+COUNT_DTYPES = ['int8', 'int16', 'int32', 'int64']
+
+
+def year_columns(df):
+    """Yıl sütunlarını ('1990', '2021', ...) küçükten büyüğe döndürür."""
+    return sorted((c for c in df.columns if str(c).isdigit()), key=int)
+
+
+def smallest_int_dtype(max_value):
+    """max_value değerini taşırmadan tutan en küçük işaretli tam sayı tipi."""
+    for dtype in COUNT_DTYPES:
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    return COUNT_DTYPES[-1]
+
+
+def _normalize_columns(df):
+    df.columns = [str(c).lower().strip() for c in df.columns]
+    return df
+
+
+def _as_category(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.astype(str).astype('category')
+
+
+def _find_term_column(columns):
+    return next((c for c in TERM_COLUMN_CANDIDATES if c in columns), None)
+
+
+def apply_schema(df, source="veri"):
+    """
+    Ham tabloyu (sütun adları küçük harfli) SCHEMA'ya çevirir:
+    bigram, category, sıralı yıl sütunları, total.
+    """
+    term_col = _find_term_column(df.columns)
+    if term_col is None:
+        raise ValueError(f"'{source}' içinde kelime sütunu (bigram/term) bulunamadı.")
+    if 'category' not in df.columns:
+        raise ValueError(f"'{source}' içinde 'category' sütunu bulunamadı.")
+
+    # Yıl sütunlarını sayıya çevir, boşlukları 0 yap. Sütun sütun doldurulur:
+    # tüm tablonun float kopyası hiç oluşmaz.
+    years = year_columns(df)
+    columns = {}
+    max_count = 0
+    for year in years:
+        col = df[year]
+        if not pd.api.types.is_numeric_dtype(col):
+            col = pd.to_numeric(col, errors='coerce')
+        columns[year] = col.fillna(0)
+        max_count = max(max_count, columns[year].max() if len(col) else 0)
+    count_dtype = smallest_int_dtype(max_count)
+
+    counts = np.empty((len(df), len(years)), dtype=count_dtype)
+    for i, year in enumerate(years):
+        counts[:, i] = columns.pop(year).to_numpy()
+    typed = pd.DataFrame(counts, columns=years, index=df.index, copy=False)
+
+    typed.insert(0, 'category', _as_category(df['category']))
+    typed.insert(0, 'bigram', _as_category(df[term_col]))
+
+    # Total yoksa hesapla
+    if 'total' in df.columns:
+        total = pd.to_numeric(df['total'], errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+    else:
+        total = counts.sum(axis=1, dtype=np.int64)
+    typed['total'] = total.astype(smallest_int_dtype(total.max() if total.size else 0))
+    return typed
+
+
+def _read_terms(path):
+    if path.endswith('.parquet'):
+        return apply_schema(_normalize_columns(pd.read_parquet(path)), path)
+
+    # Başlığı önce oku: metin sütunları doğrudan 'category' olarak okunur (arada
+    # Python string sütunu oluşmaz), yıllar float32 okunur (boşluklar NaN gelebilir;
+    # yıllık sayımlar float32'nin tam sayı sınırının, 16M, çok altında).
+    header = pd.read_csv(path, nrows=0).columns
+    lowered = {str(c).lower().strip(): c for c in header}
+    term_col = _find_term_column(lowered)
+    dtypes = {lowered[c]: SCHEMA[name] for c, name in ((term_col, 'bigram'), ('category', 'category')) if c in lowered}
+    dtypes.update({orig: 'float32' for low, orig in lowered.items() if low.isdigit()})
+    df = pd.read_csv(path, dtype=dtypes, low_memory=False)
+    return apply_schema(_normalize_columns(df), path)
+
+
+def _read_domain_stats(path):
+    df = _normalize_columns(pd.read_csv(path))
+    if 'domain' in df.columns:
+        df = df.rename(columns={'domain': 'category'})
+    years = year_columns(df)
+    counts = df[years].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+    counts = counts.astype(smallest_int_dtype(counts.to_numpy().max() if counts.size else 0))
+    return pd.concat([df['category'].astype(str), counts], axis=1)
+
+
+def _file_version(path):
+    """Önbellek anahtarı: dosya değişince (mtime/boyut) yeniden okunur."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4)
+def _load_terms_cached(path, version):
+    return _read_terms(path)
+
+
+@lru_cache(maxsize=4)
+def _load_domain_stats_cached(path, version):
+    return _read_domain_stats(path)
+
+
+def _binary_sibling(path):
+    """CSV'nin yanında ondan yeni bir .parquet varsa (merge_results.py yazar) onun yolu."""
+    if not path.endswith('.csv'):
+        return None
+    parquet = path[:-len('.csv')] + '.parquet'
+    if os.path.exists(parquet) and os.path.getmtime(parquet) >= os.path.getmtime(path):
+        return parquet
+    return None
+
+
+def load_terms(path=MAIN_DATA_PATH):
+    """all_data_merged.csv -> paylaşılan, tipli DataFrame. Dosya yoksa None."""
+    path = os.path.abspath(path)
+    if not os.path.exists(path):
+        return None
+    # Güncel Parquet kopyası varsa o okunur (pyarrow yoksa CSV'ye düşülür)
+    parquet = _binary_sibling(path)
+    if parquet is not None:
+        try:
+            return _load_terms_cached(parquet, _file_version(parquet))
+        except ImportError:
+            pass
+    return _load_terms_cached(path, _file_version(path))
+
+
+def load_domain_stats(path=DOMAIN_STATS_PATH):
+    """domain_yearly_stats.csv -> (category, yıllar...) tablosu. Dosya yoksa None."""
+    path = os.path.abspath(path)
+    if not os.path.exists(path):
+        return None
+    return _load_domain_stats_cached(path, _file_version(path))
+
+
+def dataset_version(path=MAIN_DATA_PATH):
+    """Veri setinin sürüm etiketi (önbellek / ETag anahtarları için)."""
+    path = os.path.abspath(path)
+    if not os.path.exists(path):
+        return None
+    mtime, size = _file_version(path)
+    return f"{mtime:x}-{size:x}"
@@ -0,0 +1,136 @@
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import http.client
+import subprocess
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TERMFLOW_DIR = os.path.join(FINAL_DIR, "TermFlow")
+
+# ---------------------------------------------------------
+# TermFlow HTTP API yük testi (tek sunucu süreci)
+# api.py ayrı bir süreçte başlatılır; istemci thread'leri keep-alive bağlantılarla
+# istek gönderir. Üç tur, her biri için istek/sn ve gecikme yüzdelikleri:
+#   cold       : her istek farklı (önbellek ıskalaması, cevap hesaplanır)
+#   warm       : aynı istekler tekrar (LRU önbellekten gövde)
+#   revalidate : If-None-Match ile (304, gövde yok)
+# Not: istemci ve sunucu aynı makinede çalışır; tek çekirdekte CPU'yu paylaşırlar.
+# Kullanım: python benchmarks/bench_api.py [--clients 1 4 16] [--requests 1000] [--port 8799]
+# ---------------------------------------------------------
+
+DEFAULT_CLIENTS = [1, 4, 16]
+
+
+def start_server(port):
+    proc = subprocess.Popen([sys.executable, 'api.py', '--port', str(port), '--quiet'],
+                            cwd=TERMFLOW_DIR, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    start = time.perf_counter()
+    line = proc.stdout.readline()
+    if proc.poll() is not None or 'http://' not in line:
+        raise RuntimeError(f"api.py başlatılamadı: {line}{proc.stdout.read()}")
+    return proc, round(time.perf_counter() - start, 2)
+
+
+def get(conn, path, headers=None):
+    conn.request('GET', path, headers=headers or {})
+    resp = conn.getresponse()
+    body = resp.read()
+    return resp.status, resp.getheader('ETag'), body
+
+
+def request_paths(port, n):
+    """Gerçek kategori/terimlerden en fazla n farklı istek yolu."""
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    meta = json.loads(get(conn, '/api/version')[2])
+    terms = []
+    for cat in meta['categories']:
+        top = json.loads(get(conn, '/api/top?' + urlencode({'category': cat, 'n': 200}))[2])
+        terms += [t['term'] for t in top['terms']]
+    conn.close()
+
+    paths, i = [], 0
+    while len(paths) < n:
+        cat = meta['categories'][i % len(meta['categories'])]
+        term = terms[i % len(terms)]
+        year = meta['max_year'] - i % 10
+        paths += [
+            '/api/term?' + urlencode({'term': term}),
+            '/api/top?' + urlencode({'category': cat, 'n': 10 + i % 50, 'year': year}),
+            '/api/normalized?' + urlencode({'category': cat, 'n': 1 + i % 10, 'min_year': year - 5}),
+            '/api/growth?' + urlencode({'category': cat, 'start': year - 5, 'end': year, 'limit': 20 + i}),
+            '/api/search?' + urlencode({'q': term[:3 + i % 4], 'page': i % 3}),
+        ]
+        i += 1
+    return list(dict.fromkeys(paths))[:n]
+
+
+def load(port, paths, clients, etags=None):
+    """paths'i clients thread'e bölüp gönderir; (istek/sn, [(yol, durum, ETag, ms), ...])."""
+    def worker(chunk):
+        conn = http.client.HTTPConnection('127.0.0.1', port)
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        out = []
+        for path in chunk:
+            headers = {'If-None-Match': etags[path]} if etags else None
+            start = time.perf_counter()
+            status, tag, _ = get(conn, path, headers)
+            out.append((path, status, tag, (time.perf_counter() - start) * 1000))
+        conn.close()
+        return out
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        results = [r for chunk in pool.map(worker, [paths[i::clients] for i in range(clients)]) for r in chunk]
+    elapsed = time.perf_counter() - start
+    return len(results) / elapsed, results
+
+
+def summary(phase, clients, rps, results):
+    latencies = np.array([r[3] for r in results])
+    statuses = {}
+    for r in results:
+        statuses[str(r[1])] = statuses.get(str(r[1]), 0) + 1
+    return {'phase': phase, 'clients': clients, 'requests': len(results), 'req_per_sec': round(rps, 1),
+            'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+            'p99_ms': round(float(np.percentile(latencies, 99)), 2), 'status': statuses}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, nargs='+', default=DEFAULT_CLIENTS)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--port', type=int, default=8799)
+    args = parser.parse_args(argv)
+
+    report = []
+    for clients in args.clients:
+        # Her eşzamanlılık düzeyi için yeni sunucu: cold turu gerçekten boş önbellekle başlar
+        proc, startup_sec = start_server(args.port)
+        try:
+            paths = request_paths(args.port, args.requests)
+            rows = [{'phase': 'startup', 'clients': clients, 'sec': startup_sec}]
+            rps, results = load(args.port, paths, clients)
+            rows.append(summary('cold', clients, rps, results))
+            rps, results = load(args.port, paths, clients)
+            rows.append(summary('warm', clients, rps, results))
+            etags = {path: tag for path, status, tag, _ in results if tag}
+            rps, results = load(args.port, [p for p in paths if p in etags], clients, etags)
+            rows.append(summary('revalidate', clients, rps, results))
+        finally:
+            proc.terminate()
+            proc.wait()
+        for row in rows:
+            print(json.dumps(row))
+        report += rows
+    return report
+
+
+if __name__ == "__main__":
+    main()
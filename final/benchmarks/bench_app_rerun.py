@@ -0,0 +1,180 @@
+import os
+import sys
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+# ---------------------------------------------------------
+# TermFlow app.py etkileşim gecikmesi (widget değişimi -> rerun süresi)
+# Kullanım: python benchmarks/bench_app_rerun.py [app_yolu ...] [--repeats N] [--sessions 1 4 8]
+# Varsayılan: TermFlow/app.py. Karşılaştırma için eski sürüm de verilebilir:
+#   git show <commit>:final/TermFlow/app.py > TermFlow/_app_old.py
+#   python benchmarks/bench_app_rerun.py TermFlow/_app_old.py TermFlow/app.py
+# Not: AppTest her etkileşimde scripti baştan çalıştırır (fragment'lar dahil), yani
+# 'full_rerun' eski davranışın maliyetidir. Tarayıcıda ise fragment içindeki bir widget
+# sadece o fragment'ı yeniden çalıştırır; 'fragment_rerun' bu işi (grafik + JSON) ölçer.
+# 'sessions': aynı süreçte N oturum açılır ve N thread aynı anda paylaşılan
+# DatasetMetadata ile fragment rerun'ı yapar (tek çekirdekte süre oturum sayısıyla artar).
+# ---------------------------------------------------------
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TERMFLOW_DIR = os.path.join(FINAL_DIR, "TermFlow")
+REPEATS = 30
+DEFAULT_SESSIONS = [1, 4, 8]
+
+# (sayfa, etkileşim adı, widget seçici) -> her tekrarda seçim değiştirilir
+SCENARIOS = [
+    ("🧭 Trend Explorer (Discovery)", "normalized_field", lambda at: at.selectbox(key="norm_cat")),
+    ("🧭 Trend Explorer (Discovery)", "stability_field", lambda at: at.selectbox(key="vol_cat")),
+    ("🔍 Deep Dive (Search)", "page_switch", None),
+]
+
+
+def fragment_work(name, category):
+    """Fragment rerun'ında yapılan iş: sekmenin grafiği + Plotly JSON serileştirme."""
+    sys.path.insert(0, TERMFLOW_DIR)
+    from data_loader import DataLoader
+    from plot_manager import PlotManager
+    loader, plotter = DataLoader(), PlotManager()
+    if name == "normalized_field":
+        plotter.plot_normalized_trend(loader.load_normalized(), category).to_json()
+    elif name == "stability_field":
+        # Sekme açılışındaki varsayılan filtrelerle: çan eğrisi + sıralı tablo
+        metrics = loader.load_term_metrics()
+        cat_metrics = metrics[metrics['category'] == category]
+        plotter.plot_volatility_analysis(cat_metrics, category, 'total_volume').to_json()
+        cat_metrics.nlargest(200, 'total_volume').drop(columns='category').to_json()
+
+
+def time_fragments(name, repeats):
+    sys.path.insert(0, TERMFLOW_DIR)
+    from data_loader import DataLoader
+    categories = DataLoader().load_metadata().categories
+    timings = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        fragment_work(name, categories[i % len(categories)])
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def percentile(values, q):
+    return round(float(np.percentile(values, q)) * 1000, 1)
+
+
+def run_scenario(app_path, page, widget, repeats):
+    at = AppTest.from_file(app_path, default_timeout=120).run()
+    at.sidebar.radio[0].set_value(page).run()
+    timings = []
+    for i in range(repeats):
+        if widget is None:
+            # Sayfa değiştirme: her seferinde tam rerun
+            target = page if i % 2 else "🚀 Dashboard (Overview)"
+            at.sidebar.radio[0].set_value(target)
+        else:
+            box = widget(at)
+            box.set_value(box.options[i % len(box.options)])
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return timings
+
+
+def run_sessions(app_path, name, sessions, repeats):
+    """
+    `sessions` oturum (sunucudaki ayrı tarayıcı sekmeleri gibi):
+      açılış : AppTest oturumları sırayla açılır; ilki veriyi ve DatasetMetadata'yı yükler,
+               sonrakiler paylaşılan önbelleği kullanır (first_open_ms vs other_open_ms)
+      rerun  : oturumlar aynı anda (thread'ler) paylaşılan metadata'yı alıp fragment işini
+               yapar. AppTest thread-safe olmadığı için (tek global runtime) eşzamanlı tur
+               AppTest ile değil, bir fragment rerun'ının kendisiyle ölçülür.
+    """
+    open_ms = []
+    for _ in range(sessions):
+        start = time.perf_counter()
+        AppTest.from_file(app_path, default_timeout=300).run()
+        open_ms.append((time.perf_counter() - start) * 1000)
+
+    sys.path.insert(0, TERMFLOW_DIR)
+    from data_loader import DataLoader
+
+    def session(offset):
+        timings = []
+        for i in range(repeats):
+            start = time.perf_counter()
+            categories = DataLoader().load_metadata().categories  # her rerun'da paylaşılan nesne
+            fragment_work(name, categories[(offset + i) % len(categories)])
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(sessions) as pool:
+        timings = [t for chunk in pool.map(session, range(sessions)) for t in chunk]
+    elapsed = time.perf_counter() - start
+    return {
+        'first_open_ms': round(open_ms[0], 1),
+        'other_open_ms': round(float(np.median(open_ms[1:])), 1) if sessions > 1 else None,
+        'reruns_per_sec': round(len(timings) / elapsed, 2),
+        'p50_ms': percentile(timings, 50),
+        'p95_ms': percentile(timings, 95),
+    }
+
+
+def main(app_paths, repeats, sessions_list=()):
+    os.chdir(TERMFLOW_DIR)  # app.py göreli yolları (assets/) buna göre
+    report = []
+    for app_path in app_paths:
+        for page, name, widget in SCENARIOS:
+            timings = run_scenario(os.path.abspath(app_path), page, widget, repeats)
+            row = {
+                'app': os.path.basename(app_path),
+                'interaction': name,
+                'mode': 'full_rerun',
+                'p50_ms': percentile(timings, 50),
+                'p95_ms': percentile(timings, 95),
+            }
+            report.append(row)
+            print(json.dumps(row))
+
+    for page, name, widget in SCENARIOS:
+        if widget is None:
+            continue
+        timings = time_fragments(name, repeats)
+        row = {'app': 'app.py', 'interaction': name, 'mode': 'fragment_rerun',
+               'p50_ms': percentile(timings, 50), 'p95_ms': percentile(timings, 95)}
+        report.append(row)
+        print(json.dumps(row))
+
+    # Eşzamanlı oturumlar; önbellek süreç boyunca dolu kalır, yani first_open_ms de
+    # (yukarıdaki turlardan sonra) paylaşılan veriyle açılıştır
+    name = SCENARIOS[0][1]
+    for sessions in sessions_list:
+        row = {'app': os.path.basename(app_paths[-1]), 'interaction': name, 'mode': 'sessions',
+               'sessions': sessions, 'repeats': repeats}
+        row.update(run_sessions(os.path.abspath(app_paths[-1]), name, sessions, repeats))
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeats = REPEATS
+    if '--repeats' in args:
+        i = args.index('--repeats')
+        repeats = int(args[i + 1])
+        del args[i:i + 2]
+    sessions = DEFAULT_SESSIONS
+    if '--sessions' in args:
+        i = args.index('--sessions')
+        j = i + 1
+        while j < len(args) and args[j].isdigit():
+            j += 1
+        sessions = [int(a) for a in args[i + 1:j]]
+        del args[i:j]
+    paths = [os.path.abspath(a) for a in args] or [os.path.join(TERMFLOW_DIR, "app.py")]
+    main(paths, repeats, sessions)
@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import time
+import resource
+import numpy as np
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+import trajectory
+import archetypes
+from normalized import NormalizedCube
+
+# ---------------------------------------------------------
+# Trend arketipleri: tüm sözlük için küresel k-means, satır sayısıyla ölçeklenme
+# Kullanım: python benchmarks/bench_archetypes.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır; kopyaların yıllık sayıları Poisson ile
+#   yeniden örneklenir (aynı trendlerin kopyaları tek noktaya çökmesin).
+# Küpün kurulumu (normalize frekanslar) ayrı ölçülür; cluster_sec = cluster_archetypes.
+# centroid_shift: son güncellemede merkezlerin en büyük kayması (1 - kosinüs); iterations
+# MAX_ITERATIONS'a eşit ve kayma SHIFT_TOLERANCE'tan büyükse k-means yakınsamadan kesilmiştir.
+# ---------------------------------------------------------
+
+SEED = 42
+
+
+def scaled_terms(df, scale, rng):
+    year_cols = warehouse.year_columns(df)
+    parts = [df]
+    for i in range(1, scale):
+        part = df.assign(bigram=df['bigram'].astype(str) + f" v{i}")
+        part[year_cols] = rng.poisson(df[year_cols].to_numpy(dtype=np.float64))
+        parts.append(part)
+    out = pd.concat(parts, ignore_index=True)
+    out['total'] = out[year_cols].sum(axis=1)
+    return warehouse.apply_schema(out)
+
+
+def main(scales):
+    rng = np.random.default_rng(SEED)
+    base = warehouse.load_terms()
+    df_domains = warehouse.load_domain_stats()
+    report = []
+    for scale in scales:
+        df_words = scaled_terms(base, scale, rng)
+        start = time.perf_counter()
+        cube = NormalizedCube(df_words, df_domains)
+        cube_sec = round(time.perf_counter() - start, 3)
+
+        start = time.perf_counter()
+        assignments, centroids = archetypes.cluster_archetypes(cube)
+        cluster_sec = round(time.perf_counter() - start, 3)
+
+        # İterasyon sayısı ve k-means süresi tek başına (cluster_archetypes ile aynı girdi:
+        # 'stable' olmayan satırlar)
+        years, values = trajectory.window_values(cube)
+        means = values.mean(axis=1)
+        rows, vectors, norms = trajectory.unit_trajectories(values)
+        shaped = norms[rows] / np.sqrt(len(years)) / means[rows] >= archetypes.STABLE_CV
+        start = time.perf_counter()
+        *_, iterations, shift = archetypes.spherical_kmeans(vectors[shaped])
+        kmeans_sec = round(time.perf_counter() - start, 3)
+
+        counts = assignments['archetype'].value_counts()
+        row = {'rows': len(df_words), 'clustered': len(assignments), 'cube_sec': cube_sec,
+               'cluster_sec': cluster_sec, 'kmeans_sec': kmeans_sec, 'iterations': iterations,
+               'centroid_shift': float(f"{shift:.2g}"),
+               'converged': iterations < archetypes.MAX_ITERATIONS or shift <= archetypes.SHIFT_TOLERANCE,
+               'archetypes': {name: int(counts.get(name, 0)) for name in archetypes.ARCHETYPES},
+               'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
@@ -0,0 +1,41 @@
+import os
+import sys
+import json
+import time
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+import bursts
+
+# ---------------------------------------------------------
+# Patlama tespiti: tüm [satır × yıl] matrisi üzerinde Poisson z-skoru
+# Kullanım: python benchmarks/bench_bursts.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır (terimlere sonek eklenerek)
+# ---------------------------------------------------------
+
+
+def scaled_terms(df, scale):
+    parts = [df.assign(bigram=df['bigram'].astype(str) + (f" v{i}" if i else "")) for i in range(scale)]
+    return warehouse.apply_schema(pd.concat(parts, ignore_index=True))
+
+
+def main(scales):
+    base = warehouse.load_terms()
+    domains = warehouse.load_domain_stats()
+    report = []
+    for scale in scales:
+        df = scaled_terms(base, scale)
+        start = time.perf_counter()
+        emerging = bursts.detect_bursts(df, domains)
+        elapsed = time.perf_counter() - start
+        row = {'rows': len(df), 'sec': round(elapsed, 3), 'rows_per_sec': int(len(df) / elapsed),
+               'emerging': len(emerging)}
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
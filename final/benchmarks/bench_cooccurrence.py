@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+import time
+import resource
+import numpy as np
+from scipy import sparse
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, FINAL_DIR)
+import cooccurrence
+
+# ---------------------------------------------------------
+# Eş-geçim -> PPMI -> SVD -> komşular, sözlük boyutuyla ölçeklenme
+# Gerçek metin yerine Zipf dağılımlı sentetik [makale × terim] 0/1 matrisleri kullanılır
+# (tokenizasyon maliyeti term_extractor ile aynıdır, bench_pipeline.py ölçer).
+# Her aşamanın süresi ve sürecin tepe RSS'i (MB) raporlanır.
+# Kullanım: python benchmarks/bench_cooccurrence.py [sözlük_boyutu ...]
+# ---------------------------------------------------------
+
+DOCS = 200_000
+TERMS_PER_DOC = 25
+YEARS = 10
+ZIPF_A = 1.1
+SEED = 42
+
+
+def synthetic_docs(n_docs, vocab, rng):
+    """Zipf dağılımlı terimlerden oluşan [makale × terim] 0/1 matrisi."""
+    terms = (rng.zipf(ZIPF_A, size=n_docs * TERMS_PER_DOC) - 1) % vocab
+    rows = np.repeat(np.arange(n_docs), TERMS_PER_DOC)
+    X = sparse.csr_matrix((np.ones(len(terms), dtype=np.int32), (rows, terms)), shape=(n_docs, vocab))
+    X.data[:] = 1  # tekrarlar toplandı; ikili matris
+    return X
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return round(time.perf_counter() - start, 3), out
+
+
+def main(vocab_sizes):
+    rng = np.random.default_rng(SEED)
+    report = []
+    for vocab in vocab_sizes:
+        X = synthetic_docs(DOCS, vocab, rng)
+        term_ids = np.arange(vocab)
+        years = rng.integers(0, YEARS, size=DOCS)
+
+        def count_slices():
+            parts = [cooccurrence.slice_pairs(X[years == y], term_ids) for y in range(YEARS)]
+            return [np.concatenate(arrays) for arrays in zip(*parts)]
+
+        pairs_sec, (term_a, term_b, docs) = timed(count_slices)
+        matrix_sec, S = timed(cooccurrence.cooccurrence_matrix, term_a, term_b, docs, vocab)
+        ppmi_sec, P = timed(cooccurrence.ppmi, S)
+        svd_sec, (active, vectors) = timed(cooccurrence.embed, P)
+        neighbors_sec, related = timed(cooccurrence.related_table, S, active, vectors,
+                                       np.array([f"t{i}" for i in range(vocab)], dtype=object))
+        row = {'vocab': vocab, 'docs': DOCS, 'slice_pairs': len(term_a), 'ppmi_nnz': P.nnz,
+               'active_terms': len(active), 'pairs_sec': pairs_sec, 'matrix_sec': matrix_sec,
+               'ppmi_sec': ppmi_sec, 'svd_sec': svd_sec, 'neighbors_sec': neighbors_sec,
+               'related_rows': len(related),
+               'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 50_000, 200_000])
@@ -0,0 +1,78 @@
+import os
+import sys
+import json
+import time
+import resource
+import numpy as np
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+import diffusion
+from normalized import NormalizedCube
+
+# ---------------------------------------------------------
+# Alanlar arası yayılım: tensör + toplu matmul vs terim/çift başına np.corrcoef döngüsü
+# Kullanım: python benchmarks/bench_diffusion.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır (terimlere sonek eklenerek, sayımlar Poisson
+#   ile yeniden örneklenir). Döngülü sürüm sadece rastgele LOOP_TERMS terimde ölçülüp
+#   terim sayısına oranlanır (tam döngü dakikalar sürer).
+# ---------------------------------------------------------
+
+LOOP_TERMS = 200
+SEED = 42
+
+
+def scaled_terms(df, scale, rng):
+    year_cols = warehouse.year_columns(df)
+    parts = [df]
+    for i in range(1, scale):
+        part = df.assign(bigram=df['bigram'].astype(str) + f" v{i}")
+        part[year_cols] = rng.poisson(df[year_cols].to_numpy(dtype=np.float64))
+        parts.append(part)
+    out = pd.concat(parts, ignore_index=True)
+    out['total'] = out[year_cols].sum(axis=1)
+    return warehouse.apply_schema(out)
+
+
+def loop_correlations(cube, terms, max_lag=diffusion.MAX_LAG):
+    """Referans: her terim, kategori çifti ve lag için ayrı np.corrcoef."""
+    freq = np.nan_to_num(cube.freq, nan=0.0)
+    n_years = freq.shape[1]
+    with np.errstate(divide='ignore', invalid='ignore'):  # sabit seriler NaN verir
+        for term in terms:
+            rows = [r for r in cube.row_lookup[term] if r >= 0]
+            for a in rows:
+                for b in rows:
+                    for lag in range(max_lag + 1):
+                        np.corrcoef(freq[a, :n_years - lag], freq[b, lag:])
+
+
+def main(scales):
+    rng = np.random.default_rng(SEED)
+    base = warehouse.load_terms()
+    df_domains = warehouse.load_domain_stats()
+    report = []
+    for scale in scales:
+        cube = NormalizedCube(scaled_terms(base, scale, rng), df_domains)
+        multi = np.flatnonzero((cube.row_lookup >= 0).sum(axis=1) >= 2)
+
+        start = time.perf_counter()
+        flows = diffusion.compute_flows(cube)
+        vector_sec = round(time.perf_counter() - start, 3)
+
+        start = time.perf_counter()
+        loop_correlations(cube, rng.choice(multi, size=min(LOOP_TERMS, len(multi)), replace=False))
+        loop_sec = (time.perf_counter() - start) * len(multi) / min(LOOP_TERMS, len(multi))
+
+        row = {'rows': len(cube.freq), 'multi_field_terms': len(multi), 'flows': len(flows),
+               'vectorized_sec': vector_sec, 'loop_sec_est': round(loop_sec, 1),
+               'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
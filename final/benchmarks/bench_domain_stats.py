@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+import json
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+# final/ klasöründeki scriptleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import count_by_category as cbc
+
+# ---------------------------------------------------------
+# domain_yearly_stats.csv üretimi: explode yolu vs bitmask yolu
+# Kullanım: python benchmarks/bench_domain_stats.py [makale_sayısı ...]
+# ---------------------------------------------------------
+
+# Gerçek snapshot'a yakın kategori karışımı (kod, ağırlık)
+CATEGORY_MIX = [
+    ('cs.LG', 14), ('cs.CV', 9), ('cs.AI', 6), ('cs.CL', 6), ('hep-ph', 6), ('hep-th', 5),
+    ('quant-ph', 7), ('astro-ph.GA', 5), ('astro-ph.CO', 4), ('cond-mat.mes-hall', 5),
+    ('cond-mat.str-el', 4), ('gr-qc', 4), ('math.AP', 4), ('math.PR', 4), ('math.CO', 4),
+    ('math.OC', 3), ('math-ph', 2), ('stat.ML', 5), ('stat.ME', 2), ('eess.SP', 3),
+    ('eess.IV', 2), ('econ.EM', 1), ('econ.GN', 1), ('q-fin.ST', 1), ('q-fin.MF', 1),
+    ('q-bio.NC', 1), ('q-bio.QM', 1), ('nlin.CD', 1), ('physics.optics', 3), ('nucl-th', 1),
+]
+
+def make_synthetic(n_papers, seed=42):
+    """n_papers satırlık id / year / all_categories tablosu (1-3 kategori, ağırlıklı seçim)."""
+    rng = np.random.default_rng(seed)
+    codes = np.array([c for c, _ in CATEGORY_MIX], dtype=object)
+    weights = np.array([w for _, w in CATEGORY_MIX], dtype=float)
+    weights /= weights.sum()
+
+    n_cats = rng.choice([1, 2, 3], size=n_papers, p=[0.45, 0.35, 0.20])
+    picks = rng.choice(len(codes), size=(n_papers, 3), p=weights)
+    cats = [' '.join(codes[picks[i, :n_cats[i]]]) for i in range(n_papers)]
+
+    # Yayın sayısı yıllara göre artsın (arXiv'in büyüme eğrisine benzer)
+    year_values = np.arange(1991, 2026)
+    year_weights = np.exp((year_values - 1991) / 10.0)
+    years = rng.choice(year_values, size=n_papers, p=year_weights / year_weights.sum())
+
+    return pd.DataFrame({
+        'id': [f"http://arxiv.org/abs/{i:07d}v1" for i in range(n_papers)],
+        'year': years.astype(int),
+        'all_categories': cats,
+    })
+
+def measure(func, df):
+    """Süre (sn) ve tracemalloc ile Python/NumPy tepe bellek kullanımı (MB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(df)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+def main(sizes):
+    report = []
+    for n in sizes:
+        df = make_synthetic(n)
+        input_mb = df.memory_usage(deep=True).sum() / 1e6
+
+        old_df, old_t, old_peak = measure(cbc.domain_year_stats_explode, df)
+        new_df, new_t, new_peak = measure(cbc.domain_year_stats_bitmask, df[['year', 'all_categories']])
+
+        # Çıktılar birebir aynı olmalı
+        pd.testing.assert_frame_equal(old_df, new_df, check_dtype=False, check_names=False)
+
+        row = {
+            'papers': n,
+            'input_mb': round(input_mb, 1),
+            'explode_sec': round(old_t, 3),
+            'explode_peak_mb': round(old_peak, 1),
+            'bitmask_sec': round(new_t, 3),
+            'bitmask_peak_mb': round(new_peak, 1),
+            'speedup': round(old_t / new_t, 2) if new_t else None,
+            'equal_output': True,
+        }
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    main(sizes)
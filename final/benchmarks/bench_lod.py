@@ -0,0 +1,96 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import lod
+from plot_manager import PlotManager
+
+# ---------------------------------------------------------
+# Relation Network / Scatterplot Matrix: tüm terimler vs level-of-detail
+# Kullanım: python benchmarks/bench_lod.py [terim_sayısı ...]
+# Ölçülen: figür kurma + JSON serileştirme süresi ve JSON boyutu (tarayıcıya giden yük).
+# Tarayıcı çizim süresi burada ölçülemez; JSON boyutu ve SVG/WebGL seçimi onun vekilidir.
+# ---------------------------------------------------------
+
+CATEGORIES = ['physics', 'mathematics', 'computer_science', 'statistics']
+
+
+def make_terms(n_terms, seed=7):
+    """Uzun kuyruklu (lognormal) sayımlarla bigram x kategori tablosu (uzun format)."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for cat in CATEGORIES:
+        present = rng.random(n_terms) < 0.6
+        counts = np.floor(rng.lognormal(mean=2.0, sigma=1.6, size=n_terms)).astype(np.int64) + 1
+        rows.append(pd.DataFrame({'bigram': np.arange(n_terms)[present], 'category': cat,
+                                  'total': counts[present]}))
+    df = pd.concat(rows, ignore_index=True)
+    df['bigram'] = ('term ' + df['bigram'].astype(str)).astype('category')
+    df['category'] = df['category'].astype('category')
+    return df
+
+
+def legacy_relation_scatter(df, cat1, cat2):
+    """Eski plot_relation_scatter: her terim tek SVG işaretçisi."""
+    pivot_df = df.pivot_table(index='bigram', columns='category', values='total', aggfunc='sum',
+                              observed=True).fillna(0).reset_index()
+    filtered_df = pivot_df[(pivot_df[cat1] > 0) | (pivot_df[cat2] > 0)].copy()
+    filtered_df['Total'] = filtered_df[cat1] + filtered_df[cat2]
+    return px.scatter(filtered_df, x=cat1, y=cat2, hover_name="bigram", color="Total", size="Total",
+                      size_max=30, opacity=0.7, log_x=True, log_y=True)
+
+
+def legacy_scatter_matrix(pivot_df):
+    return px.scatter_matrix(pivot_df, dimensions=CATEGORIES, color="Grand_Total", hover_name="bigram")
+
+
+def lod_scatter_matrix(pivot_df):
+    detail, rest = lod.level_of_detail(pivot_df, CATEGORIES, 'Grand_Total')
+    reps = lod.tile_representatives(rest, CATEGORIES, 'Grand_Total')
+    plot_df = pd.concat([detail.assign(tile_count=1), reps], ignore_index=True)
+    return px.scatter_matrix(plot_df, dimensions=CATEGORIES, color="Grand_Total", hover_name="bigram",
+                             hover_data=['tile_count'])
+
+
+def measure(build):
+    start = time.perf_counter()
+    fig = build()
+    payload = fig.to_json()
+    elapsed = time.perf_counter() - start
+    points = sum(len(t.x) if getattr(t, 'x', None) is not None else len(t.dimensions[0].values)
+                 for t in fig.data)
+    return {'sec': round(elapsed, 3), 'json_kb': round(len(payload) / 1024, 1), 'points': points,
+            'traces': sorted({t.type for t in fig.data})}
+
+
+def main(sizes):
+    plotter = PlotManager()
+    report = []
+    for n in sizes:
+        df = make_terms(n)
+        pivot_df = df.pivot_table(index='bigram', columns='category', values='total', aggfunc='sum',
+                                  observed=True).fillna(0)
+        pivot_df['Grand_Total'] = pivot_df.sum(axis=1)
+        pivot_df = pivot_df.reset_index()
+
+        cases = {
+            'relation_full': lambda: legacy_relation_scatter(df, 'physics', 'mathematics'),
+            'relation_lod': lambda: plotter.plot_relation_scatter(df, 'physics', 'mathematics'),
+            'splom_full': lambda: legacy_scatter_matrix(pivot_df),
+            'splom_lod': lambda: lod_scatter_matrix(pivot_df),
+        }
+        for name, build in cases.items():
+            row = {'terms': n, 'chart': name, **measure(build)}
+            report.append(row)
+            print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000, 300_000])
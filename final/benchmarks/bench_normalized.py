@@ -0,0 +1,90 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+from normalized import NormalizedCube
+
+# ---------------------------------------------------------
+# Normalize trend: her çağrıda melt + merge vs önceden hesaplanmış NormalizedCube
+# Kullanım: python benchmarks/bench_normalized.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır (terimlere sonek eklenerek)
+# ---------------------------------------------------------
+
+REPEATS = 5
+
+
+def scaled_terms(df, scale):
+    parts = [df.assign(bigram=df['bigram'].astype(str) + (f" v{i}" if i else "")) for i in range(scale)]
+    return warehouse.apply_schema(pd.concat(parts, ignore_index=True))
+
+
+def legacy_normalized(df_words, df_domains, category):
+    """Eski plot_normalized_trend: top 5 terim, melt + merge + bölme."""
+    cat_words = df_words[df_words['category'] == category]
+    top_words = cat_words.groupby('bigram', observed=True)['total'].sum().sort_values(ascending=False).head(5).index
+    plot_data = cat_words[cat_words['bigram'].isin(top_words)]
+    year_cols = [c for c in plot_data.columns if c.isdigit()]
+    df_long = plot_data.melt(id_vars=['bigram', 'category'], value_vars=year_cols, var_name='year', value_name='count')
+    df_long['year'] = pd.to_numeric(df_long['year'])
+    dom_cols = [c for c in df_domains.columns if c.isdigit()]
+    df_dom_long = df_domains.melt(id_vars=['category'], value_vars=dom_cols, var_name='year', value_name='total_papers')
+    df_dom_long['year'] = pd.to_numeric(df_dom_long['year'])
+    merged = pd.merge(df_long, df_dom_long, on=['category', 'year'], how='inner')
+    merged['normalized_freq'] = (merged['count'] / merged['total_papers']) * 10000
+    return merged
+
+
+def legacy_forecast_frame(df_words, df_domains):
+    """Eski trendforecast: tüm tablo melt + merge (kategori başına tekrar filtrelenir)."""
+    year_cols = [c for c in warehouse.year_columns(df_words) if 1990 <= int(c) <= 2030]
+    long = df_words.melt(id_vars=['category', 'bigram'], value_vars=year_cols, var_name='year', value_name='count')
+    dom = df_domains[['category'] + year_cols].melt(id_vars=['category'], var_name='year', value_name='total_papers')
+    long['year'] = pd.to_numeric(long['year'])
+    dom['year'] = pd.to_numeric(dom['year'])
+    long['category'] = long['category'].astype(str)
+    merged = pd.merge(long, dom, on=['category', 'year'], how='inner')
+    merged['norm_freq'] = merged['count'] / merged['total_papers'] * 10000
+    return merged
+
+
+def best_of(fn):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return round(min(timings) * 1000, 3)
+
+
+def main(scales):
+    base = warehouse.load_terms()
+    df_domains = warehouse.load_domain_stats()
+    category = str(base['category'].cat.categories[0])
+    report = []
+    for scale in scales:
+        df_words = scaled_terms(base, scale)
+        start = time.perf_counter()
+        cube = NormalizedCube(df_words, df_domains)
+        build_ms = round((time.perf_counter() - start) * 1000, 3)
+        row = {
+            'rows': len(df_words),
+            'cube_build_ms': build_ms,
+            'cube_mb': round(cube.freq.nbytes / 1e6, 2),
+            'top5_legacy_ms': best_of(lambda: legacy_normalized(df_words, df_domains, category)),
+            'top5_cube_ms': best_of(lambda: cube.long_frame(cube.top_rows(category, 5))),
+            'full_legacy_ms': best_of(lambda: legacy_forecast_frame(df_words, df_domains)),
+            'category_cube_ms': best_of(lambda: cube.gather(cube.category_rows(category), 1990, 2030)),
+        }
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 25])
@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+import time
+import runpy
+import shutil
+import resource
+import argparse
+import contextlib
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FINAL_DIR = os.path.dirname(BENCH_DIR)
+
+# ---------------------------------------------------------
+# UÇTAN UCA PIPELINE BENCHMARK'I
+# ---------------------------------------------------------
+# Her (ölçek, seed) için deterministik sentetik snapshot üretilir (bench_work/<ölçek>_seed<seed>/data/,
+# tekrar çalıştırmada yeniden kullanılır). Ardından final/ scriptleri o klasörde, gerçek
+# çalıştırmadaki sırayla ve her biri AYRI bir süreçte çalıştırılır; her aşamadan önce
+# kendi çıktıları silinir (önceki çalıştırmanın çıktısı ölçümü etkilemesin). Her aşama için tek
+# satır JSON: duvar saati, CPU süresi, tepe RSS, kayıt/sn ve çıktı boyutu.
+# Eksik bağımlılığı olan aşama (örn. nltk/sklearn yoksa term_extractor) "skipped" ile
+# raporlanır, sonraki aşamalar çalışmaya devam eder.
+# Kullanım: python benchmarks/bench_pipeline.py [--scales 10000 100000 1000000]
+#           [--stages cleaner categorizer ...] [--workdir DIR] [--seed 42] [--out rapor.jsonl]
+
+DEFAULT_SCALES = [10_000, 100_000, 1_000_000]
+SNAPSHOT = os.path.join('data', 'arxiv-metadata-oai-snapshot.json')
+MERGED_TABLE = os.path.join('TermFlow', 'data', 'all_data_merged.csv')
+
+# (aşama, script, çıktılar) -- scriptler çalışma klasörüne göre göreli yollar kullanır
+STAGES = [
+    ('cleaner', 'cleaner.py', ['data/arxiv_cleaned_data.csv']),
+    ('categorizer', 'categorizer.py', ['arxiv_domain_data']),
+    ('count_by_category', 'count_by_category.py', [os.path.join('TermFlow', 'data', 'domain_yearly_stats.csv')]),
+    ('total_count_per_mounth', 'total_count_per_mounth.py', ['monthly_article_counts.csv']),
+    ('time_aggregator', 'time_aggregator.py', ['time_aggregates.csv']),
+    ('term_extractor', 'term_extractor.py', ['analysis_results']),
+    ('merge_results', 'merge_results.py', [MERGED_TABLE, MERGED_TABLE.replace('.csv', '.parquet')]),
+    ('cooccurrence', 'cooccurrence.py', [os.path.join('TermFlow', 'data', 'cooccurrence.npz'),
+                                         os.path.join('TermFlow', 'data', 'related_terms.csv')]),
+    # TermFlow'un ana tabloyu tipli yüklemesi (warehouse); birleştirilmiş tablo yoksa atlanır
+    ('termflow_load', None, [MERGED_TABLE]),
+]
+
+
+def path_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+# ---------------------------------------------------------
+# ÇOCUK SÜREÇ: tek aşamayı çalıştırıp ölçüm satırını basar
+# ---------------------------------------------------------
+
+def _termflow_load():
+    if not os.path.exists(MERGED_TABLE):
+        raise FileNotFoundError(f"{MERGED_TABLE} yok (merge_results aşaması çalışmadı)")
+    sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+    import warehouse
+    warehouse.load_terms(MERGED_TABLE)
+
+
+def run_child(script):
+    sys.path.insert(0, FINAL_DIR)  # partition_store, count_by_category gibi yerel importlar
+    result = {}
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        # Scriptlerin print/tqdm çıktısı ölçüm satırına karışmasın
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), \
+                contextlib.redirect_stderr(devnull):
+            if script == 'termflow_load':
+                _termflow_load()
+            else:
+                runpy.run_path(os.path.join(FINAL_DIR, script), run_name='__main__')
+    except FileNotFoundError as e:
+        result['skipped'] = str(e)
+    except ModuleNotFoundError as e:
+        result['skipped'] = f"missing dependency: {e.name}"
+    except BaseException as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['wall_sec'] = round(time.perf_counter() - wall, 3)
+    result['cpu_sec'] = round(time.process_time() - cpu, 3)
+    # Linux'ta ru_maxrss KB cinsindendir
+    result['peak_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    print(json.dumps(result))
+
+
+# ---------------------------------------------------------
+# ANA SÜREÇ
+# ---------------------------------------------------------
+
+def clear_outputs(outputs, workdir):
+    for rel in outputs:
+        path = os.path.join(workdir, rel)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+def run_stage(name, script, outputs, workdir, n_papers):
+    if script:
+        clear_outputs(outputs, workdir)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', script or name],
+                          cwd=workdir, capture_output=True, text=True)
+    lines = proc.stdout.strip().splitlines()
+    try:
+        measured = json.loads(lines[-1])
+    except (IndexError, json.JSONDecodeError):
+        measured = {'error': (proc.stderr.strip().splitlines() or ['no output'])[-1]}
+
+    row = {'stage': name, 'papers': n_papers, **measured}
+    if 'skipped' not in row and 'error' not in row:
+        row['records_per_sec'] = int(n_papers / row['wall_sec']) if row['wall_sec'] else None
+        row['output_bytes'] = sum(path_size(os.path.join(workdir, o)) for o in outputs
+                                  if os.path.exists(os.path.join(workdir, o)))
+    return row
+
+
+def main(scales, stages, workdir_root, seed, out_path):
+    # Üretici sadece ana süreçte yüklenir: çocuk süreçlerin RSS'ine pandas/numpy eklenmesin
+    sys.path.insert(0, BENCH_DIR)
+    import synthetic_arxiv
+
+    selected = [s for s in STAGES if not stages or s[0] in stages]
+    report = []
+    out = open(out_path, 'a') if out_path else None
+    for n_papers in scales:
+        workdir = os.path.join(workdir_root, f"{n_papers}_seed{seed}")
+        snapshot = os.path.join(workdir, SNAPSHOT)
+        if not os.path.exists(snapshot):
+            start = time.perf_counter()
+            synthetic_arxiv.generate(n_papers, snapshot, seed)
+            rows = [{'stage': 'generate', 'papers': n_papers,
+                     'wall_sec': round(time.perf_counter() - start, 3),
+                     'output_bytes': os.path.getsize(snapshot)}]
+        else:
+            rows = []
+
+        for name, script, outputs in selected:
+            rows.append(run_stage(name, script, outputs, workdir, n_papers))
+
+        for row in rows:
+            row['seed'] = seed
+            line = json.dumps(row)
+            print(line, flush=True)
+            if out:
+                out.write(line + '\n')
+        report.extend(rows)
+    if out:
+        out.close()
+    return report
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == '--child':
+        run_child(sys.argv[2])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Sentetik arXiv verisiyle final/ pipeline benchmark'ı")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES)
+    parser.add_argument('--stages', nargs='+', choices=[s[0] for s in STAGES])
+    parser.add_argument('--workdir', default=os.path.join(BENCH_DIR, 'bench_work'))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help="JSON satırlarının ekleneceği dosya (opsiyonel)")
+    args = parser.parse_args()
+    main(args.scales, args.stages, args.workdir, args.seed, args.out)
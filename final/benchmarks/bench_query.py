@@ -0,0 +1,85 @@
+import os
+import sys
+import json
+import time
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+import query
+
+# ---------------------------------------------------------
+# SQL katmanı: motor kurulumu + hazır sorgular vs aynı soru için pandas scripti
+# ("iki alanda da 2019'dan beri yılda %20'den hızlı büyüyen terimler")
+# rejects_injection: serbest SQL'in tek SELECT dışındaki girdileri reddettiğinin kontrolü
+# Kullanım: python benchmarks/bench_query.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır (terimlere sonek eklenerek)
+# ---------------------------------------------------------
+
+CAT_A, CAT_B = 'economics', 'computer_science'
+SINCE, MIN_GROWTH, MIN_COUNT = 2019, 0.2, 5
+
+
+def scaled_terms(df, scale):
+    parts = [df.assign(bigram=df['bigram'].astype(str) + (f" v{i}" if i else "")) for i in range(scale)]
+    return warehouse.apply_schema(pd.concat(parts, ignore_index=True))
+
+
+def pandas_script(df, until):
+    """Analistin yazacağı tipik pandas çözümü (CSV'yi tekrar okumadan)."""
+    span = until - SINCE
+    growth = {}
+    for cat in (CAT_A, CAT_B):
+        sub = df[df['category'] == cat][['bigram', str(SINCE), str(until)]]
+        sub = sub[sub[str(SINCE)] >= MIN_COUNT]
+        sub = sub.assign(cagr=(sub[str(until)] / sub[str(SINCE)]) ** (1 / span) - 1)
+        growth[cat] = sub[sub['cagr'] > MIN_GROWTH][['bigram', 'cagr']]
+    both = growth[CAT_A].merge(growth[CAT_B], on='bigram', suffixes=('_a', '_b'))
+    return both.assign(low=both[['cagr_a', 'cagr_b']].min(axis=1)).nlargest(100, 'low')
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return round((time.perf_counter() - start) * 1000, 2), out
+
+
+def rejects_injection(engine):
+    """Regresyon: parantezi kapatıp ikinci ifade ekleyen serbest SQL reddedilmeli, tablolar kalmalı."""
+    for text in ["SELECT 1 AS a) AS q; DROP TABLE counts; SELECT * FROM (SELECT 1",
+                 "DROP TABLE counts", "SELECT 1; SELECT 2", "CREATE TABLE x AS SELECT 1"]:
+        try:
+            engine.sql(text)
+            return False
+        except ValueError:
+            pass
+    return len(engine.sql("SELECT count(*) AS n FROM counts")) == 1
+
+
+def main(scales):
+    base = warehouse.load_terms()
+    report = []
+    for scale in scales:
+        df = scaled_terms(base, scale)
+        build_ms, engine = timed(query.QueryEngine, df)
+        until = engine.max_year
+        pandas_ms, expected = timed(pandas_script, df, until)
+        row = {'rows': len(df), 'build_ms': build_ms, 'pandas_ms': pandas_ms}
+        for name in query.PREBUILT:
+            # share_leaders domain_papers ister; bu benchmark sadece terim tablosunu yükler
+            if 'domain_papers' in query.PREBUILT[name].sql:
+                continue
+            row[f"{name}_ms"], result = timed(engine.run, name, category_a=CAT_A, category_b=CAT_B,
+                                              since=SINCE, min_growth=MIN_GROWTH, min_count=MIN_COUNT) \
+                if name == 'growing_in_both' else timed(engine.run, name)
+            if name == 'growing_in_both':
+                row['same_terms'] = set(result['bigram'].astype(str)) == set(expected['bigram'].astype(str))
+        row['rejects_injection'] = rejects_injection(engine)
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
@@ -0,0 +1,69 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+from term_index import TermIndex
+
+# ---------------------------------------------------------
+# Deep Dive arama: tüm sözlük selectbox'ta vs sunucu tarafı TermIndex
+# Kullanım: python benchmarks/bench_term_index.py [ölçek ...]
+#   ölçek N: gerçek sözlük N kez çoğaltılır (terimlere sonek eklenerek)
+# ---------------------------------------------------------
+
+QUERIES = {
+    'prefix': ['mach', 'quantum f', 'neural', 'x', 'deep'],
+    'substring': ['learning', 'network', 'field theory', 'model'],
+    'fuzzy': ['neurl netwrk', 'quantm mechancs', 'machin lerning', 'galaxi clustr'],
+}
+REPEATS = 20
+PAGE_SIZE = 8
+
+
+def scaled_terms(df, scale):
+    """Sözlüğü scale kez çoğaltan (bigram, total) tablosu; TermIndex için yeterli."""
+    base = df[['bigram', 'total']].astype({'bigram': str})
+    parts = [base.assign(bigram=base['bigram'] + (f" v{i}" if i else "")) for i in range(scale)]
+    out = pd.concat(parts, ignore_index=True)
+    out['bigram'] = out['bigram'].astype('category')
+    return out
+
+
+def main(scales):
+    df = warehouse.load_terms()
+    report = []
+    for scale in scales:
+        terms = scaled_terms(df, scale)
+        start = time.perf_counter()
+        index = TermIndex(terms)
+        build_sec = time.perf_counter() - start
+
+        # Eski selectbox: tüm benzersiz terimler her oturumda tarayıcıya gider
+        full_payload = len(json.dumps(terms['bigram'].unique().tolist()))
+
+        row = {'vocabulary': len(index), 'build_sec': round(build_sec, 3),
+               'selectbox_payload_kb': round(full_payload / 1024, 1)}
+        page_payloads = []
+        for mode, queries in QUERIES.items():
+            timings = []
+            for _ in range(REPEATS):
+                for q in queries:
+                    t = time.perf_counter()
+                    results, _ = index.search(q, page_size=PAGE_SIZE)
+                    timings.append(time.perf_counter() - t)
+                    page_payloads.append(len(json.dumps(results)))
+            row[f'{mode}_p50_ms'] = round(float(np.percentile(timings, 50)) * 1000, 3)
+            row[f'{mode}_p95_ms'] = round(float(np.percentile(timings, 95)) * 1000, 3)
+        row['suggestion_page_kb'] = round(max(page_payloads) / 1024, 2)
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
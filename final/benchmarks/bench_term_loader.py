@@ -0,0 +1,137 @@
+import os
+import sys
+import json
+import time
+import resource
+import subprocess
+import pandas as pd
+
+# TermFlow modüllerini (warehouse, plot_manager) import edebilmek için
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+
+# ---------------------------------------------------------
+# all_data_merged.csv yükleme: eski DataLoader vs warehouse şeması
+# Kullanım: python benchmarks/bench_term_loader.py [csv_yolu] [--scale N]
+#   --scale N : dosyayı N kez çoğaltıp (terimler ayrı tutularak) üretim boyutunu taklit eder
+# Her yükleyici ayrı bir süreçte çalışır, RSS ölçümleri birbirini etkilemez.
+# ---------------------------------------------------------
+
+FILTER_REPEATS = 50
+
+
+def legacy_load(path):
+    """Eski DataLoader.load_main_data (tip çıkarımı + object sütunlar + float yıllar)."""
+    df = pd.read_csv(path)
+    df.columns = [str(c).lower().strip() for c in df.columns]
+    for name in ['bigram', 'term', 'keyword', 'unnamed: 0']:
+        if name in df.columns:
+            df.rename(columns={name: 'bigram'}, inplace=True)
+            break
+    year_cols = [c for c in df.columns if c.isdigit()]
+    for yc in year_cols:
+        df[yc] = pd.to_numeric(df[yc], errors='coerce').fillna(0)
+    if 'total' not in df.columns and year_cols:
+        df['total'] = df[year_cols].sum(axis=1)
+    return df
+
+
+def warehouse_load(path):
+    return warehouse.load_terms(path)
+
+
+LOADERS = {'legacy': legacy_load, 'warehouse': warehouse_load}
+
+
+def make_scaled(path, scale, out_path):
+    """Dosyayı scale kez çoğaltır; her kopyanın terimlerine sonek eklenir (farklı terimler)."""
+    df = pd.read_csv(path)
+    term_col = df.columns[0]
+    copies = []
+    for i in range(scale):
+        part = df.copy()
+        if i:
+            part[term_col] = part[term_col].astype(str) + f" v{i}"
+        copies.append(part)
+    pd.concat(copies, ignore_index=True).to_csv(out_path, index=False)
+    return out_path
+
+
+def rss_mb():
+    """Anlık RSS (MB), Linux /proc üzerinden; yoksa tepe RSS."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def time_filters(df, repeats=FILTER_REPEATS):
+    """PlotManager'daki kategori filtreleri: df[df['category'] == cat] ve growth matrix."""
+    from plot_manager import PlotManager
+    plotter = PlotManager()
+    categories = [str(c) for c in pd.unique(df['category'])]
+    years = warehouse.year_columns(df)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for cat in categories:
+            df[df['category'] == cat]
+    filter_ms = (time.perf_counter() - start) * 1000 / (repeats * len(categories))
+
+    start = time.perf_counter()
+    for cat in categories:
+        plotter.plot_growth_matrix(df, cat, int(years[-6]), int(years[-1]))
+    growth_ms = (time.perf_counter() - start) * 1000 / len(categories)
+    return filter_ms, growth_ms
+
+
+def child(kind, path):
+    """Tek yükleyiciyi ölçer ve sonucu JSON olarak stdout'a yazar."""
+    base = rss_mb()
+    start = time.perf_counter()
+    df = LOADERS[kind](path)
+    load_sec = time.perf_counter() - start
+    rss_delta = rss_mb() - base
+    filter_ms, growth_ms = time_filters(df)
+    print(json.dumps({
+        'loader': kind,
+        'rows': len(df),
+        'load_sec': round(load_sec, 3),
+        'rss_delta_mb': round(rss_delta, 1),
+        'frame_mb': round(df.memory_usage(deep=True).sum() / 1e6, 1),
+        'category_filter_ms': round(filter_ms, 3),
+        'growth_matrix_ms': round(growth_ms, 1),
+    }))
+
+
+def main(path, scale):
+    if scale > 1:
+        path = make_scaled(path, scale, os.path.join(FINAL_DIR, "benchmarks", f"_scaled_x{scale}.csv"))
+    try:
+        report = []
+        for kind in LOADERS:
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', kind, path],
+                                 capture_output=True, text=True, check=True)
+            row = json.loads(out.stdout.strip().splitlines()[-1])
+            report.append(row)
+            print(json.dumps(row))
+        return report
+    finally:
+        if scale > 1 and os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == '--child':
+        child(args[1], args[2])
+        sys.exit(0)
+
+    scale = 1
+    if '--scale' in args:
+        i = args.index('--scale')
+        scale = int(args[i + 1])
+        del args[i:i + 2]
+    main(args[0] if args else warehouse.MAIN_DATA_PATH, scale)
@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import time
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+import topk
+
+# ---------------------------------------------------------
+# Sunburst sayfası: melt + groupby.apply(nlargest) + groupby istatistik vs topk (geniş tablo)
+# Kullanım: python benchmarks/bench_topk.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır (terimlere sonek eklenerek)
+# ---------------------------------------------------------
+
+TOP_N = 12
+
+
+def scaled_terms(df, scale):
+    parts = [df.assign(bigram=df['bigram'].astype(str) + (f" v{i}" if i else "")) for i in range(scale)]
+    return warehouse.apply_schema(pd.concat(parts, ignore_index=True))
+
+
+def legacy(df):
+    """Eski grandsunburts akışı (pandas 3'te grup sütunu reset_index ile geri alınır)."""
+    year_cols = warehouse.year_columns(df)
+    fixed_cols = ['bigram', 'category', 'total']
+    df_long = df.melt(id_vars=fixed_cols, value_vars=year_cols, var_name='year', value_name='count')
+    df_long['year'] = pd.to_numeric(df_long['year'], errors='coerce')
+
+    unique_bigrams = df_long[['category', 'bigram', 'total']].drop_duplicates()
+    top_terms = unique_bigrams.groupby('category', observed=True).apply(
+        lambda x: x.nlargest(TOP_N, 'total')).reset_index(level=0).reset_index(drop=True)
+    filtered = pd.merge(df_long, top_terms[['category', 'bigram']], on=['category', 'bigram'], how='inner')
+
+    stats = filtered.groupby(['category', 'bigram'], observed=True)['count'].agg(
+        Yıllık_Ortalama='mean', Standart_Sapma='std', Maksimum_Görülme='max').reset_index()
+    totals = filtered[['category', 'bigram', 'total']].drop_duplicates()
+    return pd.merge(stats, totals, on=['category', 'bigram']).round(2)
+
+
+def vectorized(df):
+    top = topk.top_k_per_category(df, TOP_N, 'total')
+    return topk.year_statistics(top, warehouse.year_columns(df)).round(2)
+
+
+def timed(fn, df):
+    start = time.perf_counter()
+    out = fn(df)
+    return round((time.perf_counter() - start) * 1000, 2), len(out)
+
+
+def main(scales):
+    base = warehouse.load_terms()
+    report = []
+    for scale in scales:
+        df = scaled_terms(base, scale)
+        legacy_ms, legacy_rows = timed(legacy, df)
+        new_ms, new_rows = timed(vectorized, df)
+        row = {'rows': len(df), 'legacy_ms': legacy_ms, 'topk_ms': new_ms,
+               'legacy_terms': legacy_rows, 'topk_terms': new_rows}
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+import pandas as pd
+
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+from normalized import NormalizedCube
+from trajectory import TrajectoryIndex
+
+# ---------------------------------------------------------
+# Trend benzerliği: exact tarama vs LSH (SimHash + multi-probe + yeniden sıralama)
+# Kullanım: python benchmarks/bench_trajectory.py [ölçek ...]
+#   ölçek N: gerçek tablo N kez çoğaltılır; kopyaların yıllık sayıları Poisson ile
+#   yeniden örneklenir (birebir aynı trendler LSH'yi haksız yere kolaylaştırmasın).
+# recall@K: LSH'nin bulduğu ilk K'nın exact ilk K ile kesişimi / K.
+# ---------------------------------------------------------
+
+QUERIES = 200
+K = 10
+SEED = 42
+
+
+def scaled_terms(df, scale, rng):
+    year_cols = warehouse.year_columns(df)
+    parts = [df]
+    for i in range(1, scale):
+        part = df.assign(bigram=df['bigram'].astype(str) + f" v{i}")
+        part[year_cols] = rng.poisson(df[year_cols].to_numpy(dtype=np.float64))
+        parts.append(part)
+    out = pd.concat(parts, ignore_index=True)
+    out['total'] = out[year_cols].sum(axis=1)
+    return warehouse.apply_schema(out)
+
+
+def timed_queries(index, positions, exact):
+    start = time.perf_counter()
+    results = [index.neighbors(p, K, exact)[0] for p in positions]
+    return round((time.perf_counter() - start) * 1000 / len(positions), 3), results
+
+
+def main(scales):
+    rng = np.random.default_rng(SEED)
+    base = warehouse.load_terms()
+    df_domains = warehouse.load_domain_stats()
+    report = []
+    for scale in scales:
+        cube = NormalizedCube(scaled_terms(base, scale, rng), df_domains)
+        start = time.perf_counter()
+        index = TrajectoryIndex(cube)
+        build_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        positions = rng.choice(len(index), size=min(QUERIES, len(index)), replace=False)
+        exact_ms, exact = timed_queries(index, positions, True)
+        start = time.perf_counter()
+        index.build_tables()
+        lsh_build_ms = round((time.perf_counter() - start) * 1000, 1)
+        lsh_ms, approx = timed_queries(index, positions, False)
+        candidates = np.mean([len(index.candidates(index.vectors[p])) for p in positions])
+        recall = np.mean([len(np.intersect1d(a, e)) / max(len(e), 1) for a, e in zip(approx, exact)])
+        row = {'rows': len(cube.freq), 'indexed': len(index), 'build_ms': build_ms,
+               'lsh_build_ms': lsh_build_ms, 'exact_query_ms': exact_ms, 'lsh_query_ms': lsh_ms,
+               'lsh_candidates': int(candidates), f'lsh_recall@{K}': round(float(recall), 3)}
+        report.append(row)
+        print(json.dumps(row))
+    return report
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 50])
@@ -0,0 +1,180 @@
+import os
+import sys
+import json
+import numpy as np
+
+# ---------------------------------------------------------
+# SENTETİK ARXIV SNAPSHOT ÜRETİCİ
+# ---------------------------------------------------------
+# arxiv-metadata-oai-snapshot.json ile aynı satır formatında (JSON lines), aynı seed ile
+# her seferinde aynı dosyayı üreten sentetik bir korpus:
+#   - kategori karışımı: arXiv'deki ağırlıklara yakın birincil kategori + %35 çapraz liste
+#   - yıl dağılımı: 1991-2025, yılda ~%9 büyüyen makale sayısı
+#   - özet uzunluğu: log-normal, medyan ~140 kelime
+#   - metin: Zipf dağılımlı ortak kelimeler + alanın gerçek bigram'larından 2-5 terim;
+#     böylece term_extractor gerçekçi terimler bulur. Terimler TermFlow verisinden bir kez
+#     alınıp TERMS_FILE'a dondurulmuştur: veri seti değişse de aynı seed aynı korpusu üretir
+#     (sürümler arası karşılaştırma). Listeyi bilerek yenilemek için --freeze-terms.
+# Kullanım: python benchmarks/synthetic_arxiv.py <makale_sayısı> <çıktı.json> [seed]
+#           python benchmarks/synthetic_arxiv.py --freeze-terms
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FINAL_DIR = os.path.dirname(BENCH_DIR)
+TERMS_FILE = os.path.join(BENCH_DIR, 'synthetic_terms.json')  # alan -> bigram'lar (total'e göre azalan)
+
+# (birincil kategori, ağırlık, categorizer'daki alan)
+CATEGORY_MIX = [
+    ('cs.LG', 0.10, 'computer_science'), ('cs.CV', 0.07, 'computer_science'),
+    ('cs.CL', 0.05, 'computer_science'), ('cs.AI', 0.03, 'computer_science'),
+    ('cs.IT', 0.03, 'computer_science'),
+    ('astro-ph.GA', 0.06, 'physics'), ('astro-ph.CO', 0.04, 'physics'),
+    ('cond-mat.mes-hall', 0.05, 'physics'), ('cond-mat.str-el', 0.04, 'physics'),
+    ('hep-th', 0.05, 'physics'), ('hep-ph', 0.05, 'physics'), ('quant-ph', 0.06, 'physics'),
+    ('gr-qc', 0.03, 'physics'), ('physics.optics', 0.02, 'physics'),
+    ('math.AP', 0.04, 'mathematics'), ('math.PR', 0.03, 'mathematics'),
+    ('math.CO', 0.03, 'mathematics'), ('math.AG', 0.03, 'mathematics'),
+    ('math.OC', 0.02, 'mathematics'),
+    ('stat.ML', 0.03, 'statistics'), ('stat.ME', 0.02, 'statistics'),
+    ('eess.SP', 0.02, 'electrical_engineering'), ('eess.IV', 0.02, 'electrical_engineering'),
+    ('q-bio.NC', 0.01, 'quantitative_biology'), ('q-bio.PE', 0.01, 'quantitative_biology'),
+    ('q-fin.ST', 0.01, 'finance'), ('q-fin.MF', 0.01, 'finance'),
+    ('econ.EM', 0.01, 'economics'), ('econ.GN', 0.01, 'economics'),
+]
+CROSS_LIST_PROB = 0.35
+YEARS = np.arange(1991, 2026)
+YEARLY_GROWTH = 0.09
+ABSTRACT_MEDIAN_WORDS = 140
+TITLE_WORDS = (6, 14)
+TERMS_PER_ABSTRACT = (2, 6)
+COMMON_VOCAB = 6000
+CHUNK = 20_000
+
+STOPWORDS = ['the', 'of', 'and', 'in', 'to', 'a', 'we', 'is', 'for', 'that', 'this', 'with',
+             'on', 'by', 'are', 'as', 'an', 'be', 'which', 'from', 'our', 'these', 'can', 'it']
+SYLLABLES = ['ka', 'lo', 'mi', 'ne', 'ra', 'ti', 'vo', 'su', 'pe', 'da', 'gri', 'tor', 'len',
+             'mar', 'sen', 'quo', 'fi', 'zal', 'ber', 'nix', 'sta', 'tic', 'ion', 'ent']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _common_vocabulary(rng):
+    """Anlamsız ama deterministik kelimeler + ingilizce stopword'ler (Zipf sırasıyla)."""
+    n_syll = rng.integers(2, 4, size=COMMON_VOCAB)
+    picks = rng.integers(0, len(SYLLABLES), size=(COMMON_VOCAB, 3))
+    words = [''.join(SYLLABLES[j] for j in row[:k]) for row, k in zip(picks, n_syll)]
+    return np.array(STOPWORDS + words, dtype=object)
+
+
+def _domain_terms():
+    """Alan -> dondurulmuş gerçek bigram listesi (TERMS_FILE)."""
+    with open(TERMS_FILE, encoding='utf-8') as f:
+        return {cat: np.array(terms, dtype=object) for cat, terms in json.load(f).items()}
+
+
+def freeze_terms(path=TERMS_FILE):
+    """TermFlow tablosundaki terimleri TERMS_FILE'a yazar (korpus bundan sonra bu listeyle üretilir)."""
+    sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+    import warehouse
+    df = warehouse.load_terms()
+    if df is None:
+        raise FileNotFoundError(f"{warehouse.MAIN_DATA_PATH} yok")
+    terms = {str(cat): grp.sort_values('total', ascending=False)['bigram'].astype(str).tolist()
+             for cat, grp in df.groupby('category', observed=True)}
+    with open(path, 'w', encoding='utf-8') as f:
+        # Alan başına bir satır: yenilendiğinde fark okunabilir kalsın
+        f.write('{\n' + ',\n'.join(f"{json.dumps(cat)}: {json.dumps(t, ensure_ascii=False)}"
+                                     for cat, t in terms.items()) + '\n}\n')
+    return terms
+
+
+def _zipf_indices(rng, size, n):
+    """[0, n) aralığında Zipf (s=1.25) dağılımlı indeksler (kuyruk n-1'de kırpılır)."""
+    return np.minimum(rng.zipf(1.25, size=size) - 1, n - 1)
+
+
+def _categories(rng, primary, n):
+    codes = np.array([c for c, _, _ in CATEGORY_MIX], dtype=object)
+    cats = codes[primary].astype(object)
+    cross = rng.random(n) < CROSS_LIST_PROB
+    extra = rng.choice(len(codes), size=n, p=_weights())
+    cats[cross] = [f"{a} {b}" if a != b else a for a, b in zip(cats[cross], codes[extra[cross]])]
+    return cats
+
+
+def _weights():
+    w = np.array([w for _, w, _ in CATEGORY_MIX], dtype=np.float64)
+    return w / w.sum()
+
+
+def _dates(rng, n):
+    year_w = np.exp(YEARLY_GROWTH * (YEARS - YEARS[0]))
+    years = rng.choice(YEARS, size=n, p=year_w / year_w.sum())
+    months = rng.integers(1, 13, size=n)
+    days = rng.integers(1, 29, size=n)
+    secs = rng.integers(0, 86400, size=n)
+    return years, months, days, secs
+
+
+def _text(rng, vocab, length, terms):
+    words = list(vocab[_zipf_indices(rng, length, len(vocab))])
+    if len(terms):
+        n_terms = rng.integers(*TERMS_PER_ABSTRACT)
+        for pos, term in zip(rng.integers(0, length, size=n_terms), terms[_zipf_indices(rng, n_terms, len(terms))]):
+            words[pos] = term
+    return ' '.join(words)
+
+
+def generate(n_papers, path, seed=42):
+    """n_papers makaleyi path'e yazar. Aynı (n_papers, seed) her zaman aynı dosyayı üretir."""
+    rng = np.random.default_rng(seed)
+    vocab = _common_vocabulary(rng)
+    terms = _domain_terms()
+    domains = [d for _, _, d in CATEGORY_MIX]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for start in range(0, n_papers, CHUNK):
+            n = min(CHUNK, n_papers - start)
+            primary = rng.choice(len(CATEGORY_MIX), size=n, p=_weights())
+            cats = _categories(rng, primary, n)
+            years, months, days, secs = _dates(rng, n)
+            lengths = np.clip(rng.lognormal(np.log(ABSTRACT_MEDIAN_WORDS), 0.35, size=n), 30, 400).astype(int)
+            title_lengths = rng.integers(*TITLE_WORDS, size=n)
+
+            for i in range(n):
+                idx = start + i
+                domain_terms = terms.get(domains[primary[i]], np.array([], dtype=object))
+                y, m, d, s = int(years[i]), int(months[i]), int(days[i]), int(secs[i])
+                created = (f"{WEEKDAYS[(y + m + d) % 7]}, {d} {MONTHS[m - 1]} {y} "
+                           f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d} GMT")
+                paper = {
+                    'id': f"{y % 100:02d}{m:02d}.{idx:05d}",
+                    'submitter': "Synthetic Author",
+                    'authors': "A. Author, B. Author",
+                    'title': _text(rng, vocab, int(title_lengths[i]), domain_terms).title(),
+                    'comments': None,
+                    'journal-ref': None,
+                    'doi': None,
+                    'report-no': None,
+                    'categories': cats[i],
+                    'license': None,
+                    'abstract': '  ' + _text(rng, vocab, int(lengths[i]), domain_terms) + '.\n',
+                    'versions': [{'version': 'v1', 'created': created}],
+                    'update_date': f"{y}-{m:02d}-{d:02d}",
+                    'authors_parsed': [['Author', 'A.', ''], ['Author', 'B.', '']],
+                }
+                f.write(json.dumps(paper) + '\n')
+    return path
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ['--freeze-terms']:
+        frozen = freeze_terms()
+        print(f"{TERMS_FILE}: {sum(len(t) for t in frozen.values()):,} terim, {len(frozen)} alan")
+        sys.exit(0)
+    if len(sys.argv) < 3:
+        print("Kullanım: python benchmarks/synthetic_arxiv.py <makale_sayısı> <çıktı.json> [seed]")
+        sys.exit(1)
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 42
+    out = generate(int(sys.argv[1]), sys.argv[2], seed)
+    print(f"{out}: {os.path.getsize(out) / 1e6:.1f} MB")
@@ -1,6 +1,7 @@
 import csv
 import os
 from tqdm import tqdm
+import metrics
 
 # Giriş dosyası (Senin temizlediğin dosya)
 input_file = 'data/arxiv_cleaned_data.csv'
@@ -81,13 +82,18 @@ print("Dosya ayrıştırma işlemi başlıyor...")
 file_handles = {} # { 'economics': file_object }
 csv_writers = {}  # { 'economics': csv_writer }
 
+domain_rows = {}  # { 'economics': yazılan satır sayısı } -> metrik kaydı
+
 try:
-    with open(input_file, 'r', encoding='utf-8') as f_in:
+    with metrics.stage('categorizer', input_path=input_file) as stage, \
+         open(input_file, 'r', encoding='utf-8') as f_in:
+        stage.rows_in = 0
         reader = csv.reader(f_in)
         header = next(reader) # Başlığı oku
         
         # tqdm ile ilerleme çubuğu
         for row in tqdm(reader, desc="Ayrıştırılıyor"):
+            stage.rows_in += 1
             
             # row[6] -> 'all_categories' sütunu (Scriptindeki sıraya göre değişebilir, kontrol et!)
             # Eğer temizleme kodunda son sütuna koyduysan index -1'dir.
@@ -108,6 +114,14 @@ try:
                 
                 # İlgili dosyaya satırı yaz
                 csv_writers[domain].writerow(row)
+                domain_rows[domain] = domain_rows.get(domain, 0) + 1
+
+        # Dosyalar henüz açık: byte sayıları doğru ölçülsün diye tamponları boşalt
+        for f in file_handles.values():
+            f.flush()
+        stage.rows_out = sum(domain_rows.values())
+        stage.output_path = output_dir
+        stage.tags['domain_rows'] = domain_rows
 
 finally:
     # Açık olan tüm dosyaları kapat
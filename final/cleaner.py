@@ -1,6 +1,7 @@
 import json
 import csv
 from tqdm import tqdm # İlerleme çubuğu için
+import metrics # Aşama süreleri / bellek / satır sayıları (pipeline_metrics.jsonl)
 
 # Dosya isimleri
 input_file = 'data/arxiv-metadata-oai-snapshot.json'
@@ -41,15 +42,18 @@ headers = [
 print("Dönüştürme işlemi başlıyor... Bu işlem dosya boyutuna göre birkaç dakika sürebilir.")
 
 # Dosyaları açıyoruz
-with open(input_file, 'r', encoding='utf-8') as f_in, \
+with metrics.stage('cleaner', input_path=input_file, output_path=output_file) as stage, \
+     open(input_file, 'r', encoding='utf-8') as f_in, \
      open(output_file, 'w', encoding='utf-8', newline='') as f_out:
     
+    stage.rows_in = stage.rows_out = 0
     writer = csv.writer(f_out)
     writer.writerow(headers) # Başlığı yaz
     
     # tqdm ile dosya satırlarını sarmalayarak ilerleme çubuğu gösteriyoruz
     # total=2400000 yaklaşık makale sayısıdır, sadece görsel tahmin içindir.
     for line in tqdm(f_in, total=2400000, desc="İşleniyor"):
+        stage.rows_in += 1
         try:
             paper = json.loads(line)
             
@@ -86,6 +90,7 @@ with open(input_file, 'r', encoding='utf-8') as f_in, \
                 primary_cat,
                 cats_str # Tüm kategoriler (boşlukla ayrılmış ham hali)
             ])
+            stage.rows_out += 1
             
         except Exception as e:
             # Nadir de olsa bozuk bir satır varsa atla ve hatayı bas
@@ -0,0 +1,251 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.utils.extmath import randomized_svd
+import term_extractor
+import metrics
+
+# ---------------------------------------------------------
+# TERİM EŞ-GEÇİM MATRİSİ VE PPMI TABANLI "İLGİLİ TERİMLER"
+# ---------------------------------------------------------
+# term_extractor.py'nin okuduğu makaleler aynı temizlikten (prepare_frame) ve aynı
+# CountVectorizer bigram analizörü üzerinden geçirilir; sözlük sabittir (TermFlow
+# tablosundaki terimler), bu yüzden sonuç seyrek bir [makale × terim] 0/1 matrisidir.
+#   1) eş-geçim : her (kategori, yıl) dilimi için C = Dᵀ·D (seyrek çarpım; köşegen
+#                 dışı değerler = iki terimin birlikte geçtiği makale sayısı)
+#   2) PPMI     : tüm dilimlerin toplamı üzerinden pozitif noktasal karşılıklı bilgi,
+#                 bağlam dağılımı CONTEXT_ALPHA ile yumuşatılır (nadir terimlerin PMI'ı şişmez)
+#   3) SVD      : seyrek PPMI matrisinin kesik SVD'si (randomized SVD; ARPACK'ten ~5 kat
+#                 hızlı, ilk tekil değerler aynı), gömme = U·√Σ
+#   4) komşular : gömmelerde kosinüs benzerliği; her terim için adaylar en çok eş-geçen
+#                 NEIGHBOR_CANDIDATES terimdir (maliyet terim × aday × boyut, nadir gürültü
+#                 terimleri komşu listesine girmez). Satırlar en fazla NEIGHBOR_BLOCK_CELLS
+#                 hücrelik bloklarla çarpılır; [terim × terim] yoğun matris hiç oluşmaz
+# Çıktılar (TermFlow veri klasörü):
+#   cooccurrence.npz  : dilim başına seyrek matrisler, COO üçlüleri olarak (milyonlarca satır;
+#                       CSV'ye göre ~4 kat küçük ve ~10 kat hızlı yazılır):
+#                       terms[i] = terim adı, slice_category/slice_year[s] = dilim,
+#                       term_a, term_b, slice, docs = (a < b) çiftinin s dilimindeki makale sayısı
+#   related_terms.csv : bigram, rank, related, similarity, cooccurrence
+# Deep Dive sayfası related_terms.csv'yi okur (TermFlow/related.py).
+
+TERMS_FILE = os.path.join('TermFlow', 'data', 'all_data_merged.csv')
+COOCCURRENCE_FILE = os.path.join('TermFlow', 'data', 'cooccurrence.npz')
+RELATED_FILE = os.path.join('TermFlow', 'data', 'related_terms.csv')
+
+TERMS_PER_CATEGORY = None   # None = kategorinin tüm terimleri; örn. 2000 -> total'e göre ilk 2000
+MIN_COOCCURRENCE = 2        # toplamda bundan az makalede birlikte geçen çiftler PPMI'a girmez
+CONTEXT_ALPHA = 0.75
+EMBEDDING_DIM = 100
+SVD_ITERATIONS = 5
+NEIGHBORS = 10
+NEIGHBOR_CANDIDATES = 50_000  # None = tüm terimler aday
+NEIGHBOR_BLOCK_CELLS = 16_000_000  # blok başına benzerlik hücresi (~64 MB float32)
+
+FINAL_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(FINAL_DIR, "TermFlow"))
+import warehouse
+
+# ---------------------------------------------------------
+# EŞ-GEÇİM
+# ---------------------------------------------------------
+
+def category_vocabularies(df_terms, n=None):
+    """Kategori -> o kategorideki terimlerin global kodları (total'e göre ilk n, None = hepsi)."""
+    codes = df_terms['bigram'].cat.codes.to_numpy()
+    cat_codes = df_terms['category'].cat.codes.to_numpy()
+    totals = df_terms['total'].to_numpy()
+    vocabs = {}
+    for cat_code, category in enumerate(df_terms['category'].cat.categories):
+        rows = np.flatnonzero(cat_codes == cat_code)
+        if n is not None and len(rows) > n:
+            rows = rows[np.argsort(-totals[rows], kind='stable')[:n]]
+        vocabs[str(category)] = np.sort(codes[rows])
+    return vocabs
+
+
+def doc_term_matrix(texts, vocabulary):
+    """Metinler -> seyrek [makale × terim] 0/1 matrisi (term_extractor'ın bigram analizörüyle)."""
+    vectorizer = CountVectorizer(ngram_range=(2, 2), vocabulary=list(vocabulary), binary=True, dtype=np.int32)
+    return vectorizer.transform(texts).tocsr()
+
+
+def slice_pairs(X, term_ids):
+    """
+    Bir dilimin [makale × terim] matrisinden birlikte geçen terim çiftleri:
+    (global_a, global_b, makale_sayısı), a < b.
+    """
+    C = sparse.triu(X.T @ X, k=1).tocoo()
+    a, b = term_ids[C.row], term_ids[C.col]
+    return np.minimum(a, b).astype(np.int32), np.maximum(a, b).astype(np.int32), C.data.astype(np.int32)
+
+
+def category_cooccurrence(df, term_ids, labels):
+    """Kategorinin hazırlanmış makale tablosu -> {yıl: (term_a, term_b, docs)}."""
+    X = doc_term_matrix(df['text_ngrams'].fillna(''), labels[term_ids])
+    years = df['year'].to_numpy()
+    return {int(year): slice_pairs(X[years == year], term_ids) for year in np.unique(years)}
+
+
+def cooccurrence_matrix(term_a, term_b, docs, n_terms):
+    """Tüm dilimlerin toplamı: simetrik, köşegeni boş seyrek [terim × terim] matris."""
+    upper = sparse.coo_matrix((docs, (term_a, term_b)),
+                              shape=(n_terms, n_terms)).tocsr()  # aynı çiftin dilimleri toplanır
+    return (upper + upper.T).tocsr()
+
+
+def save_slices(path, labels, slices):
+    """{(kategori, yıl): (term_a, term_b, docs)} -> tek .npz (bkz. dosya başındaki format)."""
+    keys = sorted(slices)
+    sizes = [len(slices[k][0]) for k in keys]
+    np.savez(path,
+             terms=labels.astype(str),
+             slice_category=np.array([k[0] for k in keys], dtype=str),
+             slice_year=np.array([k[1] for k in keys], dtype=np.int16),
+             term_a=np.concatenate([slices[k][0] for k in keys]),
+             term_b=np.concatenate([slices[k][1] for k in keys]),
+             slice=np.repeat(np.arange(len(keys), dtype=np.int32), sizes),
+             docs=np.concatenate([slices[k][2] for k in keys]))
+
+# ---------------------------------------------------------
+# PPMI, SVD VE KOMŞULAR
+# ---------------------------------------------------------
+
+def ppmi(S, min_count=MIN_COOCCURRENCE, alpha=CONTEXT_ALPHA):
+    """Seyrek eş-geçim matrisi -> seyrek PPMI matrisi (sadece sıfır olmayan hücreler hesaplanır)."""
+    S = S.copy()
+    S.data[S.data < min_count] = 0
+    S.eliminate_zeros()
+    total = S.sum()
+    if total == 0:
+        return S
+    row = np.asarray(S.sum(axis=1)).ravel()
+    context = row ** alpha
+    context /= context.sum()
+
+    # log P(a,b) / (P(a) · P_α(b)) = log S[a,b] / (row[a] · P_α(b))
+    C = S.tocoo()
+    pmi = np.log(C.data / row[C.row] / context[C.col])
+    keep = pmi > 0
+    return sparse.csr_matrix((pmi[keep], (C.row[keep], C.col[keep])), shape=S.shape)
+
+
+def embed(P, dim=EMBEDDING_DIM):
+    """
+    PPMI matrisinin kesik SVD gömmesi. Sadece en az bir pozitif hücresi olan terimler:
+    (terim kodları, birim uzunluklu [terim × boyut] gömmeler).
+    """
+    active = np.flatnonzero(P.getnnz(axis=1))
+    k = min(dim, len(active) - 1)
+    if k < 1:
+        return active, np.zeros((len(active), 0), dtype=np.float32)
+    U, sigma, _ = randomized_svd(P[active][:, active], k, n_iter=SVD_ITERATIONS, random_state=0)
+    vectors = U * np.sqrt(sigma)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    # Komşu araması float32 BLAS çarpımı: maliyet terim² × boyut, bellek blok boyutu kadar
+    return active, (vectors / np.where(norms > 0, norms, 1)).astype(np.float32)
+
+
+def nearest_neighbors(vectors, candidates=None, k=NEIGHBORS, block_cells=NEIGHBOR_BLOCK_CELLS):
+    """
+    Her satır için candidates (satır indeksleri, None = hepsi) arasından kosinüs benzerliği
+    en yüksek k satır: (satırlar, komşular, benzerlikler).
+    """
+    n = len(vectors)
+    candidates = np.arange(n) if candidates is None else np.asarray(candidates)
+    k = min(k, len(candidates) - 1)
+    if k < 1:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+    # Satırın aday listesindeki yeri (aday değilse -1): kendisiyle eşleşmesin
+    self_pos = np.full(n, -1)
+    self_pos[candidates] = np.arange(len(candidates))
+    pool = vectors[candidates].T
+
+    chunk = max(1, block_cells // len(candidates))
+    rows, neighbors, sims = [], [], []
+    for start in range(0, n, chunk):
+        block = vectors[start:start + chunk] @ pool
+        idx = np.arange(len(block))
+        pos = self_pos[start + idx]
+        block[idx[pos >= 0], pos[pos >= 0]] = -np.inf  # kendisi hariç (işaret çevrilince en sona düşer)
+        np.negative(block, out=block)
+        top = np.argpartition(block, k - 1, axis=1)[:, :k]
+        top_sims = -np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_sims, axis=1, kind='stable')
+        rows.append(np.repeat(start + idx, k))
+        neighbors.append(candidates[np.take_along_axis(top, order, axis=1)].ravel())
+        sims.append(np.take_along_axis(top_sims, order, axis=1).ravel())
+    return np.concatenate(rows), np.concatenate(neighbors), np.concatenate(sims)
+
+
+def related_table(S, active, vectors, labels, k=NEIGHBORS, n_candidates=NEIGHBOR_CANDIDATES):
+    """Her terimin komşu listesi: bigram, rank, related, similarity, cooccurrence."""
+    candidates = None
+    if n_candidates is not None and len(active) > n_candidates:
+        weight = np.asarray(S[active].sum(axis=1)).ravel()
+        candidates = np.sort(np.argpartition(-weight, n_candidates - 1)[:n_candidates])
+    rows, neighbors, sims = nearest_neighbors(vectors, candidates, k)
+    a, b = active[rows], active[neighbors]
+    related = pd.DataFrame({
+        'bigram': labels[a],
+        'rank': np.arange(len(rows)) - np.searchsorted(rows, rows) + 1,  # satırlar sıralı gelir
+        'related': labels[b],
+        'similarity': np.round(sims, 4),
+        'cooccurrence': np.asarray(S[a, b]).ravel().astype(np.int64),
+    })
+    # Benzerliği pozitif olmayan komşular anlamsız
+    return related[related['similarity'] > 0]
+
+# ---------------------------------------------------------
+# ANA İŞLEM
+# ---------------------------------------------------------
+
+def main():
+    df_terms = warehouse.load_terms(TERMS_FILE)
+    if df_terms is None:
+        raise FileNotFoundError(f"'{TERMS_FILE}' bulunamadı. Önce merge_results.py çalıştırın.")
+    labels = np.asarray(df_terms['bigram'].cat.categories, dtype=object)
+    vocabs = category_vocabularies(df_terms, TERMS_PER_CATEGORY)
+    print(f"{len(labels):,} terim, {len(vocabs)} kategori sözlüğü.")
+
+    with metrics.stage('cooccurrence', output_path=RELATED_FILE):
+        slices = {}
+        for category_name, df in term_extractor.iter_category_frames():
+            if df.empty or category_name not in vocabs:
+                print(f"Atlandı: {category_name} (boş veya TermFlow tablosunda yok)")
+                continue
+            with metrics.stage(category_name, rows_in=len(df)) as stage:
+                df = term_extractor.prepare_frame(df)
+                by_year = category_cooccurrence(df, vocabs[category_name], labels)
+                stage.rows_out = sum(len(pairs[0]) for pairs in by_year.values())
+            slices.update(((category_name, year), pairs) for year, pairs in by_year.items())
+        if not slices:
+            raise FileNotFoundError(f"'{term_extractor.INPUT_FOLDER}' içinde makale bulunamadı.")
+
+        n_pairs = sum(len(p[0]) for p in slices.values())
+        with metrics.stage('write_pairs', rows_in=n_pairs, output_path=COOCCURRENCE_FILE):
+            save_slices(COOCCURRENCE_FILE, labels, slices)
+        print(f"✅ {len(slices)} (kategori, yıl) diliminde {n_pairs:,} çift -> {COOCCURRENCE_FILE}")
+
+        with metrics.stage('ppmi', rows_in=n_pairs) as stage:
+            term_a, term_b, docs = (np.concatenate(arrays) for arrays in zip(*slices.values()))
+            slices.clear()
+            S = cooccurrence_matrix(term_a, term_b, docs, len(labels))
+            del term_a, term_b, docs
+            P = ppmi(S)
+            stage.rows_out = P.nnz
+        with metrics.stage('svd', rows_in=P.nnz) as stage:
+            active, vectors = embed(P)
+            stage.rows_out = len(active)
+        with metrics.stage('neighbors', rows_in=len(active), output_path=RELATED_FILE) as stage:
+            related = related_table(S, active, vectors, labels)
+            related.to_csv(RELATED_FILE, index=False)
+            stage.rows_out = len(related)
+    print(f"✅ {len(active):,} terim için {len(related):,} komşu -> {RELATED_FILE}")
+
+if __name__ == "__main__":
+    main()
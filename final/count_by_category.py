@@ -1,8 +1,22 @@
+import os
+import re
+import numpy as np
 import pandas as pd
+from partition_store import read_partitions, slugify
 
 # Giriş ve Çıkış
 input_file = 'data/arxiv_cleaned_data.csv'
-output_file = 'domain_yearly_stats.csv'
+output_file = os.path.join('TermFlow', 'data', 'domain_yearly_stats.csv')  # TermFlow bu kopyayı okur
+
+# Bölümlenmiş (year=/topic=) girdi kullanılacaksa klasörü ver, None ise input_file okunur.
+partition_input = None
+# Örn: (2021, 2025) -> "son 5 yıl" analizi. Bölümlenmiş girdide sadece bu yılların klasörleri okunur.
+year_range = None
+
+# Hesaplama yolu:
+#   "bitmask" -> her makale için alan bit maskesi + np.bincount (explode yok, bellek sabit kalır)
+#   "explode" -> eski yol (kategori listesini satırlara patlatıp pivot_table)
+agg_mode = 'bitmask'
 
 # Resimdeki klasör yapısına göre Eşleştirme Sözlüğü (Mapping)
 # ArXiv kodlarını senin klasör isimlerine çeviriyoruz.
@@ -15,61 +29,183 @@ DOMAIN_MAP = {
     'q-bio': 'quantitative_biology',
     'stat': 'statistics',
     # Fizik alt dalları çoktur, hepsini 'physics' çatısında topluyoruz
-    'physics': 'physics', 'astro-ph': 'physics', 'cond-mat': 'physics', 
-    'gr-qc': 'physics', 'hep-ex': 'physics', 'hep-lat': 'physics', 
-    'hep-ph': 'physics', 'hep-th': 'physics', 'math-ph': 'physics', 
-    'nucl-ex': 'physics', 'nucl-th': 'physics', 'quant-ph': 'physics', 
+    'physics': 'physics', 'astro-ph': 'physics', 'cond-mat': 'physics',
+    'gr-qc': 'physics', 'hep-ex': 'physics', 'hep-lat': 'physics',
+    'hep-ph': 'physics', 'hep-th': 'physics', 'math-ph': 'physics',
+    'nucl-ex': 'physics', 'nucl-th': 'physics', 'quant-ph': 'physics',
     'nlin': 'physics'
 }
 
-print("Veri işleniyor...")
+# Bit sırası: DOMAINS[i] -> maskenin i. biti
+DOMAINS = sorted(set(DOMAIN_MAP.values()))
+
+# Her alan için önceden derlenmiş tek bir prefix deseni.
+# Kategori ya string başında ya da boşluktan sonra başlar, prefix'ten sonra '.' / boşluk / son gelir.
+# (Böylece 'math' deseni 'math-ph' kategorisini yakalamaz.)
+DOMAIN_PATTERNS = {
+    domain: re.compile(r'(?:^|\s)(?:' + '|'.join(re.escape(p) for p, d in DOMAIN_MAP.items() if d == domain) + r')(?:[.\s]|$)')
+    for domain in DOMAINS
+}
+
+# ---------------------------------------------------------
+# VERİ OKUMA
+# ---------------------------------------------------------
+
+def load_input():
+    """
+    Girdiyi okur ve 'year' sütununu ekler.
+    arXiv verisinde 'all_categories', OpenAlex bölümlerinde ise doğrudan 'domain' sütunu döner.
+    'id' sadece eski (explode) yolda tekrar temizliği için okunur.
+    """
+    id_cols = ['id'] if agg_mode == 'explode' else []
+    if partition_input:
+        start_year, end_year = year_range if year_range else (None, None)
+        df = read_partitions(partition_input, start_year, end_year)
+        # OpenAlex bölümlerinde arXiv kodları ('all_categories') yoktur;
+        # konu (primary_category) doğrudan alan olarak kullanılır.
+        if 'all_categories' not in df.columns:
+            df['domain'] = df['primary_category'].fillna('').map(slugify)
+            df = df[id_cols + ['published_date', 'domain']]
+        else:
+            df = df[id_cols + ['published_date', 'all_categories']]
+    else:
+        df = pd.read_csv(input_file, usecols=id_cols + ['published_date', 'all_categories'])
+
+    # Tarihi Yıla Çevir
+    df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce', utc=True)
+    df = df.dropna(subset=['published_date'])
+    df['year'] = df['published_date'].dt.year.astype(int)
+    if year_range:
+        df = df[df['year'].between(year_range[0], year_range[1])]
+    return df
+
+# ---------------------------------------------------------
+# 1. ESKİ YOL: EXPLODE + PIVOT
+# ---------------------------------------------------------
+
+def domain_year_stats_explode(df):
+    """Kategori listesini satırlara patlatarak alan x yıl makale sayılarını hesaplar."""
+    if 'domain' in df.columns:
+        # Alan zaten belli (her makalenin tek alanı var), patlatmaya gerek yok
+        df_unique_domains = df.drop_duplicates(subset=['id', 'domain'])
+    else:
+        # Önce boşluktan bölerek listeye çevir: "cs.AI stat.ML" -> ["cs.AI", "stat.ML"]
+        df = df.assign(categories_list=df['all_categories'].str.split(' '))
+
+        # Listeyi satırlara patlat (Explode)
+        df_exploded = df.explode('categories_list')
+
+        # Kategori kodunun sadece başını al (cs.AI -> cs)
+        df_exploded['prefix'] = df_exploded['categories_list'].str.split('.').str[0]
+
+        # Prefix'i senin Domain ismine çevir (Mapping)
+        df_exploded['domain'] = df_exploded['prefix'].map(DOMAIN_MAP)
+
+        # Mapping'de olmayanları (varsa) temizle
+        df_exploded = df_exploded.dropna(subset=['domain'])
+
+        # TEKRARLARI ÖNLEME (Önemli!)
+        # Bir makale hem 'cs.AI' hem 'cs.LG' ise 'computer_science' altında 2 kere sayılmamalı.
+        # Bu yüzden aynı makaleID ve aynı Domain ikilisini teke düşürüyoruz.
+        df_unique_domains = df_exploded.drop_duplicates(subset=['id', 'domain'])
+
+    # PIVOT TABLO OLUŞTUR
+    pivot_df = df_unique_domains.pivot_table(
+        index='domain',
+        columns='year',
+        values='id',
+        aggfunc='count',
+        fill_value=0
+    )
+    return _sort_by_total(pivot_df)
+
+# ---------------------------------------------------------
+# 2. YENİ YOL: BIT MASKESİ + BINCOUNT
+# ---------------------------------------------------------
 
-# 1. Veriyi Oku
-df = pd.read_csv(input_file, usecols=['id', 'published_date', 'all_categories'])
+def domain_bitmask(categories):
+    """
+    "cs.AI stat.ML" -> computer_science ve statistics bitleri açık tek bir sayı.
+    Satır sayısı kadar küçük bir tamsayı dizisi döner, Python string listesi oluşmaz.
+    """
+    categories = categories.fillna('')
+    mask_dtype = np.uint8 if len(DOMAINS) <= 8 else np.uint32
+    mask = np.zeros(len(categories), dtype=mask_dtype)
+    for bit, domain in enumerate(DOMAINS):
+        hit = categories.str.contains(DOMAIN_PATTERNS[domain], regex=True).to_numpy(dtype=bool)
+        mask |= (hit.astype(mask_dtype) << bit)
+    return mask
 
-# 2. Tarihi Yıla Çevir
-df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce', utc=True)
-df = df.dropna(subset=['published_date'])
-df['year'] = df['published_date'].dt.year.astype(int)
+def domain_year_stats_bitmask(df):
+    """
+    Alan x yıl makale sayılarını explode etmeden hesaplar.
+    Her alan biti için (yıl kodu) dizisi np.bincount ile sayılır; ara tablo girdi boyutunu aşmaz.
+    Makale id'lerinin tekil olduğu varsayılır (temizlenmiş snapshot'ta öyledir).
+    """
+    years = df['year'].to_numpy()
+    if len(years) == 0:
+        return _sort_by_total(pd.DataFrame())
+    year_min = int(years.min())
+    n_years = int(years.max()) - year_min + 1
+    year_codes = (years - year_min).astype(np.int64)
 
-# 3. Kategorileri Ayır ve Eşleştir
-# Önce boşluktan bölerek listeye çevir: "cs.AI stat.ML" -> ["cs.AI", "stat.ML"]
-df['categories_list'] = df['all_categories'].str.split(' ')
+    if 'domain' in df.columns:
+        # Tek alanlı girdi: alan kodu x yıl kodunu tek bincount ile say
+        domain_codes, domains = pd.factorize(df['domain'], sort=True)
+        keep = domain_codes >= 0
+        flat = domain_codes[keep].astype(np.int64) * n_years + year_codes[keep]
+        counts = np.bincount(flat, minlength=len(domains) * n_years).reshape(len(domains), n_years)
+        domains = list(domains)
+    else:
+        mask = domain_bitmask(df['all_categories'])
+        domains = DOMAINS
+        counts = np.zeros((len(domains), n_years), dtype=np.int64)
+        for bit in range(len(domains)):
+            has_domain = ((mask >> bit) & 1).astype(bool)
+            counts[bit] = np.bincount(year_codes[has_domain], minlength=n_years)
 
-# Listeyi satırlara patlat (Explode)
-df_exploded = df.explode('categories_list')
+    return domain_year_table(counts, domains, year_min)
 
-# Kategori kodunun sadece başını al (cs.AI -> cs)
-df_exploded['prefix'] = df_exploded['categories_list'].str.split('.').str[0]
+def domain_year_table(counts, domains, year_min):
+    """
+    [alan x yıl] sayı matrisini domain_yearly_stats.csv tablosuna çevirir.
+    pivot_table çıktısıyla aynı şekil: sadece görülen alanlar ve yıllar, toplama göre sıralı.
+    """
+    n_years = counts.shape[1]
+    pivot_df = pd.DataFrame(counts, index=pd.Index(domains, name='domain'),
+                            columns=pd.Index(range(year_min, year_min + n_years), name='year'))
+    pivot_df = pivot_df.loc[pivot_df.sum(axis=1) > 0, pivot_df.sum(axis=0) > 0]
+    return _sort_by_total(pivot_df)
 
-# Prefix'i senin Domain ismine çevir (Mapping)
-df_exploded['domain'] = df_exploded['prefix'].map(DOMAIN_MAP)
+def _sort_by_total(pivot_df):
+    """Toplam makale sayısına göre (büyükten küçüğe) sıralar."""
+    if pivot_df.empty:
+        return pivot_df
+    pivot_df = pivot_df.sort_index()
+    pivot_df['Total'] = pivot_df.sum(axis=1)
+    pivot_df = pivot_df.sort_values(by='Total', ascending=False)
+    return pivot_df.drop(columns=['Total'])
 
-# Mapping'de olmayanları (varsa) temizle
-df_exploded = df_exploded.dropna(subset=['domain'])
+# ---------------------------------------------------------
+# ANA İŞLEM
+# ---------------------------------------------------------
 
-# 4. TEKRARLARI ÖNLEME (Önemli!)
-# Bir makale hem 'cs.AI' hem 'cs.LG' ise 'computer_science' altında 2 kere sayılmamalı.
-# Bu yüzden aynı makaleID ve aynı Domain ikilisini teke düşürüyoruz.
-df_unique_domains = df_exploded.drop_duplicates(subset=['id', 'domain'])
+def main():
+    print("Veri işleniyor...")
+    df = load_input()
 
-# 5. PIVOT TABLO OLUŞTUR
-pivot_df = df_unique_domains.pivot_table(
-    index='domain', 
-    columns='year', 
-    values='id', 
-    aggfunc='count', 
-    fill_value=0
-)
+    if agg_mode == 'explode':
+        pivot_df = domain_year_stats_explode(df)
+    else:
+        pivot_df = domain_year_stats_bitmask(df)
 
-# 6. Toplam Sayıya Göre Sırala
-pivot_df['Total'] = pivot_df.sum(axis=1)
-pivot_df = pivot_df.sort_values(by='Total', ascending=False)
-pivot_df = pivot_df.drop(columns=['Total'])
+    # Kaydet
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    pivot_df.to_csv(output_file)
 
-# Kaydet
-pivot_df.to_csv(output_file)
+    print(f"\n✅ İşlem tamamlandı! Dosya: {output_file}")
+    print("\n--- Son 5 Yılın Özeti ---")
+    print(pivot_df[pivot_df.columns[-5:]])
 
-print(f"\n✅ İşlem tamamlandı! Dosya: {output_file}")
-print("\n--- Son 5 Yılın Özeti ---")
-print(pivot_df[pivot_df.columns[-5:]])
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import os
+import glob
+import numpy as np
+import pandas as pd
+import metrics
+
+# ---------------------------------------------------------
+# ANALİZ SONUÇLARINI BİRLEŞTİRME (all_data_merged.csv)
+# ---------------------------------------------------------
+# term_extractor.py her kategori için analysis_results/<kategori>/bigrams_yearly.csv
+# yazar. TermFlow ise tüm kategorilerin tek tablosunu (all_data_merged.csv) okur.
+# Bu script dosyaları parça parça okuyup tek geçişte yazar:
+#   - açık 'bigram' ve 'category' sütunları (isimsiz index sütunu yok)
+#   - tüm dosyalardaki yılların birleşimi, sıralı; dosyada olmayan yıl 0
+#   - tam sayı sayımlar ve yıllardan hesaplanan 'total'
+# Önce sadece başlıklar okunur (yıl birleşimi için), sonra satırlar CHUNK_ROWS'luk
+# parçalarla çıktıya eklenir: bellekte hiçbir zaman tüm tablo tutulmaz.
+# PARQUET_OUTPUT verilirse aynı parçalar aynı döngüde sabit şemalı bir Parquet dosyasına
+# da yazılır (pyarrow ParquetWriter; metin sütunları sözlük kodlu, yıllar int32). Dashboard
+# bu dosyayı CSV'den çok daha hızlı yükler, okurken warehouse.apply_schema tipleri küçültür.
+
+INPUT_FOLDER = 'analysis_results'
+NGRAM_FILE = 'bigrams_yearly.csv'   # keywords_yearly.csv / trigrams_yearly.csv da olabilir
+OUTPUT_FILE = os.path.join('TermFlow', 'data', 'all_data_merged.csv')
+PARQUET_OUTPUT = os.path.join('TermFlow', 'data', 'all_data_merged.parquet')  # None = yazma
+CHUNK_ROWS = 100_000
+
+# ---------------------------------------------------------
+# YARDIMCI FONKSİYONLAR
+# ---------------------------------------------------------
+
+def find_inputs():
+    """(kategori, dosya yolu) çiftleri, kategori adına göre sıralı."""
+    paths = glob.glob(os.path.join(INPUT_FOLDER, '*', NGRAM_FILE))
+    return sorted((os.path.basename(os.path.dirname(p)), p) for p in paths)
+
+
+def year_union(inputs):
+    """Sadece başlıkları okuyarak tüm dosyalardaki yılların sıralı birleşimi."""
+    years = set()
+    for _, path in inputs:
+        header = pd.read_csv(path, nrows=0).columns
+        years.update(str(c) for c in header if str(c).isdigit())
+    return sorted(years, key=int)
+
+
+def aligned_chunks(category, path, years):
+    """Dosyayı parça parça okuyup (bigram, category, yıllar..., total) sütunlarına hizalar."""
+    for chunk in pd.read_csv(path, index_col=0, chunksize=CHUNK_ROWS):
+        chunk.columns = [str(c) for c in chunk.columns]
+        counts = (chunk.reindex(columns=years)
+                  .apply(pd.to_numeric, errors='coerce')
+                  .fillna(0)
+                  .to_numpy(dtype=np.int64))
+        out = pd.DataFrame(counts, columns=years)
+        out.insert(0, 'category', category)
+        out.insert(0, 'bigram', chunk.index.astype(str).to_numpy())
+        out['total'] = counts.sum(axis=1)
+        # Boş terim (NaN index) satırları atılır
+        yield out[chunk.index.notna()]
+
+
+def parquet_writer(path, years):
+    """
+    Birleşik tablonun sabit şemalı Parquet yazıcısı (bigram, category, yıllar..., total);
+    pyarrow kurulu değilse None. Parçalar write_chunk ile eklenir.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        print(f"Parquet yazılmayacak (pyarrow kurulu değil): {e}")
+        return None
+    text = pa.dictionary(pa.int32(), pa.string())  # pandas'ta 'category' olarak okunur
+    schema = pa.schema([('bigram', text), ('category', text)]
+                       + [(year, pa.int32()) for year in years] + [('total', pa.int64())])
+    return pq.ParquetWriter(path, schema)
+
+
+def write_chunk(writer, chunk):
+    import pyarrow as pa
+    chunk = chunk.astype({'bigram': 'category', 'category': 'category'})
+    writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+
+# ---------------------------------------------------------
+# ANA İŞLEM
+# ---------------------------------------------------------
+
+def main():
+    inputs = find_inputs()
+    if not inputs:
+        raise FileNotFoundError(f"'{INPUT_FOLDER}/*/{NGRAM_FILE}' bulunamadı. Önce term_extractor.py çalıştırın.")
+
+    years = year_union(inputs)
+    print(f"{len(inputs)} kategori, {len(years)} yıl ({years[0]}-{years[-1]}) birleştiriliyor...")
+    os.makedirs(os.path.dirname(OUTPUT_FILE) or '.', exist_ok=True)
+
+    # Yarım kalan yazım eski dosyaları bozmasın: önce geçici dosyalara yaz
+    tmp_path = OUTPUT_FILE + '.tmp'
+    parquet_tmp = PARQUET_OUTPUT + '.tmp' if PARQUET_OUTPUT else None
+    with metrics.stage('merge_results', input_path=INPUT_FOLDER) as stage:
+        stage.rows_out = 0
+        writer = parquet_writer(parquet_tmp, years) if parquet_tmp else None
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f_out:
+                header = True
+                for category, path in inputs:
+                    for chunk in aligned_chunks(category, path, years):
+                        chunk.to_csv(f_out, header=header, index=False)
+                        if writer is not None:
+                            write_chunk(writer, chunk)
+                        header = False
+                        stage.rows_out += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        os.replace(tmp_path, OUTPUT_FILE)
+        if writer is not None:
+            # CSV'den sonra: warehouse sadece CSV'den yeni Parquet'i kullanır
+            os.replace(parquet_tmp, PARQUET_OUTPUT)
+        stage.output_path = OUTPUT_FILE
+    print(f"✅ {stage.rows_out:,} satır -> {OUTPUT_FILE}")
+    if writer is not None:
+        print(f"✅ Parquet -> {PARQUET_OUTPUT}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import time
+import uuid
+import threading
+import functools
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+# ---------------------------------------------------------
+# AŞAMA (STAGE) METRİKLERİ
+# ---------------------------------------------------------
+# tqdm çubukları ve print'ler yerine her aşama için ölçüm kaydı:
+#
+#     with metrics.stage("term_extractor", output_path=OUT) as m:
+#         with metrics.stage("physics", rows_in=len(df)) as sub:   # -> term_extractor/physics
+#             ...
+#             sub.rows_out = len(result)
+#
+#     @metrics.timed("load")            # fonksiyonun her çağrısı bir aşama
+#     def load(): ...
+#
+# Her aşama bitince METRICS_FILE'a (JSON lines) bir satır eklenir: duvar saati, CPU
+# süresi, başlangıç/bitiş RSS, tepe RSS, girdi/çıktı satır ve byte sayıları, hata durumu.
+# Alt süreçler (ProcessPoolExecutor worker'ları) aynı dosyaya kendi satırlarını ekler.
+#
+# Ortam değişkenleri:
+#   PIPELINE_METRICS_FILE  : kayıt dosyası (varsayılan pipeline_metrics.jsonl, "" = kapalı)
+#   PIPELINE_PROFILE_STAGE : bu isimdeki aşama (tam yol veya son parça) örneklemeli
+#                            profiler ile çalışır; yığınlar <kayıt dosyası>.<aşama>.folded
+#                            dosyasına flamegraph "folded" formatında yazılır.
+
+METRICS_FILE = os.environ.get('PIPELINE_METRICS_FILE', 'pipeline_metrics.jsonl')
+PROFILE_STAGE = os.environ.get('PIPELINE_PROFILE_STAGE') or None
+PROFILE_INTERVAL = 0.005  # saniye
+RUN_ID = os.environ.get('PIPELINE_RUN_ID') or uuid.uuid4().hex[:12]
+os.environ.setdefault('PIPELINE_RUN_ID', RUN_ID)  # worker süreçleri aynı run_id'yi görür
+
+_PAGE_MB = os.sysconf('SC_PAGE_SIZE') / 1e6 if hasattr(os, 'sysconf') else 0
+_local = threading.local()
+_write_lock = threading.Lock()
+
+
+def configure(path=None, profile_stage=None, interval=None):
+    """Kayıt dosyasını / profil alınacak aşamayı kod içinden değiştirir."""
+    global METRICS_FILE, PROFILE_STAGE, PROFILE_INTERVAL
+    if path is not None:
+        METRICS_FILE = path
+    if profile_stage is not None:
+        PROFILE_STAGE = profile_stage
+    if interval is not None:
+        PROFILE_INTERVAL = interval
+
+
+# ---------------------------------------------------------
+# BELLEK ÖLÇÜMÜ (Linux /proc; yoksa None)
+# ---------------------------------------------------------
+
+def _rss_mb():
+    try:
+        with open('/proc/self/statm') as f:
+            return round(int(f.read().split()[1]) * _PAGE_MB, 1)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_mb():
+    """Sürecin tepe RSS'i (VmHWM)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _reset_peak_rss():
+    """VmHWM'i sıfırlar (Linux >= 4.0). Sadece en dış aşamada çağrılır."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def path_bytes(path):
+    """Dosya boyutu veya klasördeki tüm dosyaların toplam boyutu (yoksa None)."""
+    if not path or not os.path.exists(path):
+        return None
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files)
+
+
+# ---------------------------------------------------------
+# ÖRNEKLEMELİ PROFİLER
+# ---------------------------------------------------------
+
+class _Sampler(threading.Thread):
+    """Hedef thread'in yığınını her `interval` saniyede bir okur ve sayar."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+# ---------------------------------------------------------
+# AŞAMA KAYDI
+# ---------------------------------------------------------
+
+class StageRecord:
+    """with metrics.stage(...) as m: -> m.rows_in / m.rows_out / m.bytes_out / m.tags doldurulabilir."""
+
+    def __init__(self, path, rows_in=None, input_path=None, output_path=None, tags=None):
+        self.path = path
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.bytes_in = path_bytes(input_path)
+        self.bytes_out = None
+        self.output_path = output_path
+        self.tags = dict(tags or {})
+
+    def to_dict(self):
+        return {
+            'run_id': RUN_ID,
+            'pid': os.getpid(),
+            'stage': self.path,
+            'depth': self.path.count('/'),
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            **self.tags,
+        }
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def _write(record):
+    if not METRICS_FILE:
+        return
+    line = json.dumps(record, default=str) + '\n'
+    # Tek satırlık append: worker süreçlerinin satırları birbirine karışmaz
+    with _write_lock, open(METRICS_FILE, 'a', encoding='utf-8') as f:
+        f.write(line)
+
+
+def _profile_path(stage_path):
+    slug = stage_path.replace('/', '.').replace(' ', '_')
+    return f"{METRICS_FILE or 'pipeline_metrics.jsonl'}.{slug}.folded"
+
+
+@contextmanager
+def stage(name, rows_in=None, input_path=None, output_path=None, **tags):
+    """
+    Adlandırılmış bir aşamayı ölçer. İç içe aşamaların adı 'dış/iç' olur.
+    input_path / output_path verilirse byte sayıları dosya/klasör boyutundan okunur.
+    """
+    stack = _stack()
+    path = '/'.join(stack + [name])
+    if not stack:
+        _reset_peak_rss()
+    stack.append(name)
+    record = StageRecord(path, rows_in, input_path, output_path, tags)
+
+    sampler = None
+    if PROFILE_STAGE and PROFILE_STAGE in (name, path):
+        sampler = _Sampler(threading.get_ident(), PROFILE_INTERVAL)
+        sampler.start()
+
+    started = datetime.now().isoformat(timespec='seconds')
+    rss_start = _rss_mb()
+    wall, cpu = time.perf_counter(), time.process_time()
+    status = 'ok'
+    try:
+        yield record
+    except BaseException as e:
+        status = f"error: {type(e).__name__}"
+        raise
+    finally:
+        wall_sec = time.perf_counter() - wall
+        cpu_sec = time.process_time() - cpu
+        stack.pop()
+        if record.bytes_out is None:
+            record.bytes_out = path_bytes(record.output_path)
+        rss_end = _rss_mb()
+        result = {
+            'ts': started,
+            **record.to_dict(),
+            'status': status,
+            'wall_sec': round(wall_sec, 4),
+            'cpu_sec': round(cpu_sec, 4),
+            'rss_start_mb': rss_start,
+            'rss_end_mb': rss_end,
+            # VmHWM tembel güncellenir; anlık RSS'ten küçük görünmesin
+            'peak_rss_mb': max(filter(None, [_peak_rss_mb(), rss_start, rss_end]), default=None),
+        }
+        if record.rows_in and wall_sec > 0:
+            result['rows_per_sec'] = round(record.rows_in / wall_sec, 1)
+        if sampler is not None:
+            sampler.stop()
+            result['profile'] = _profile_path(path)
+            sampler.write(result['profile'])
+        _write(result)
+
+
+def timed(name=None, **tags):
+    """Fonksiyonun her çağrısını bir aşama olarak ölçen dekoratör."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name or func.__name__, **tags):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -9,6 +9,8 @@ import glob
 import time
 from tqdm import tqdm
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from partition_store import write_partitioned, slugify, YEAR_KEY, TOPIC_KEY, DEFAULT_PARTITION
+import metrics
 
 # --- YENİ EKLENEN KÜTÜPHANE ---
 from langdetect import detect, DetectorFactory, LangDetectException
@@ -22,6 +24,13 @@ TEMP_DIR = "temp_chunks_clean"
 MAX_FILES = None   # Deneme için 50. Hepsini indirmek için None yap.
 WORKER_COUNT = 6 # Bilgisayarının gücüne göre 4, 6 veya 8 yapabilirsin.
 
+# Çıktı modu:
+#   "csv"         -> tek parça FINAL_FILENAME (eski davranış)
+#   "partitioned" -> PARTITION_DIR altında year=YYYY[/topic=...] klasörleri (Hive düzeni)
+OUTPUT_MODE = "csv"
+PARTITION_DIR = "openalex_partitioned"
+PARTITION_BY_TOPIC = False  # True ise yılın altına primary_category'ye göre ikinci seviye eklenir
+
 # İstenen Sütunlar
 CSV_HEADERS = ['id', 'title', 'published_date', 'authors', 'primary_category', 'summary']
 
@@ -55,6 +64,17 @@ def is_title_english(text):
         return False
 
 def process_single_file(file_key):
+    """Worker girişi: her S3 dosyası ayrı bir metrik kaydıdır (openalex/file)."""
+    with metrics.stage('openalex/file', file=file_key) as stage:
+        stage.rows_in = 0
+        result = _process_single_file(file_key, stage)
+        if isinstance(result, int):
+            stage.rows_out = result
+        else:
+            stage.tags['error'] = result
+        return result
+
+def _process_single_file(file_key, stage):
     s3 = boto3.client('s3', config=Config(signature_version=UNSIGNED))
     bucket_name = "openalex"
     
@@ -65,6 +85,7 @@ def process_single_file(file_key):
         
         with gzip.open(obj['Body'], mode='rt', encoding='utf-8') as f:
             for line in f:
+                stage.rows_in += 1
                 try:
                     item = json.loads(line)
                     
@@ -110,10 +131,15 @@ def process_single_file(file_key):
         
         if chunk_data:
             df = pd.DataFrame(chunk_data)
+
+            if OUTPUT_MODE == "partitioned":
+                return write_partitions(df, file_key)
+
             safe_name = file_key.replace('/', '_').replace('.gz', '.csv')
             output_path = os.path.join(TEMP_DIR, safe_name)
             # Escape karakterlerini ve quoting'i düzgün ayarla
             df.to_csv(output_path, index=False, header=False, quoting=1) # quoting=1 (QUOTE_ALL) güvenlidir
+            stage.output_path = output_path
             return len(chunk_data)
             
     except Exception as e:
@@ -121,6 +147,20 @@ def process_single_file(file_key):
     
     return 0
 
+def write_partitions(df, file_key):
+    """Parçayı yayın yılına (ve istenirse konuya) göre bölümlenmiş klasörlere yazar."""
+    # publication_date 'YYYY-MM-DD' formatındadır, yıl için ilk 4 karakter yeterli
+    years = df['published_date'].astype(str).str[:4]
+    df[YEAR_KEY] = years.where(years.str.isdigit(), DEFAULT_PARTITION)
+
+    partition_cols = [YEAR_KEY]
+    if PARTITION_BY_TOPIC:
+        df[TOPIC_KEY] = df['primary_category'].fillna('').map(slugify)
+        partition_cols.append(TOPIC_KEY)
+
+    part_name = file_key.replace('/', '_').replace('.gz', '')
+    return write_partitioned(df, PARTITION_DIR, partition_cols, part_name)
+
 def get_all_s3_files(bucket_name, prefix="data/works/", max_files=None):
     s3 = boto3.client('s3', config=Config(signature_version=UNSIGNED))
     files = []
@@ -156,35 +196,50 @@ def merge_csv_files():
     os.rmdir(TEMP_DIR)
 
 def main():
-    if not os.path.exists(TEMP_DIR):
+    if OUTPUT_MODE == "partitioned":
+        os.makedirs(PARTITION_DIR, exist_ok=True)
+    elif not os.path.exists(TEMP_DIR):
         os.makedirs(TEMP_DIR)
     
-    all_files = get_all_s3_files("openalex", max_files=MAX_FILES)
-    print(f"İşlenecek dosya sayısı: {len(all_files)}")
-    
-    start_time = time.time()
-    total_records = 0
-    
-    with ProcessPoolExecutor(max_workers=WORKER_COUNT) as executor:
-        futures = {executor.submit(process_single_file, f): f for f in all_files}
+    output_path = PARTITION_DIR if OUTPUT_MODE == "partitioned" else FINAL_FILENAME
+    with metrics.stage('openalex', output_path=output_path) as run:
+        with metrics.stage('list_files') as stage:
+            all_files = get_all_s3_files("openalex", max_files=MAX_FILES)
+            stage.rows_out = len(all_files)
+        print(f"İşlenecek dosya sayısı: {len(all_files)}")
         
-        with tqdm(total=len(all_files), unit="dosya", desc="İşleniyor") as pbar:
-            for future in as_completed(futures):
-                result = future.result()
-                if isinstance(result, int):
-                    total_records += result
-                pbar.update(1)
-
-    print(f"\nİndirme bitti. Toplam {total_records} TEMİZ makale bulundu.")
-    
-    if total_records > 0:
-        merge_csv_files()
-        print(f"\n--- İŞLEM BAŞARILI ---")
-        print(f"Dosya: {os.path.abspath(FINAL_FILENAME)}")
-    else:
-        print("Hiç veri bulunamadı.")
+        start_time = time.time()
+        total_records = 0
         
-    print(f"Toplam Süre: {int(time.time() - start_time)} saniye")
+        # Worker'lar kendi 'openalex/file' satırlarını aynı metrik dosyasına ekler
+        with metrics.stage('download', rows_in=len(all_files), workers=WORKER_COUNT) as stage, \
+             ProcessPoolExecutor(max_workers=WORKER_COUNT) as executor:
+            futures = {executor.submit(process_single_file, f): f for f in all_files}
+            
+            with tqdm(total=len(all_files), unit="dosya", desc="İşleniyor") as pbar:
+                for future in as_completed(futures):
+                    result = future.result()
+                    if isinstance(result, int):
+                        total_records += result
+                    pbar.update(1)
+            stage.rows_out = total_records
+
+        print(f"\nİndirme bitti. Toplam {total_records} TEMİZ makale bulundu.")
+        
+        if total_records > 0 and OUTPUT_MODE == "partitioned":
+            print(f"\n--- İŞLEM BAŞARILI ---")
+            print(f"Bölümlenmiş klasör: {os.path.abspath(PARTITION_DIR)}")
+        elif total_records > 0:
+            with metrics.stage('merge', input_path=TEMP_DIR, output_path=FINAL_FILENAME) as stage:
+                stage.rows_in = stage.rows_out = total_records
+                merge_csv_files()
+            print(f"\n--- İŞLEM BAŞARILI ---")
+            print(f"Dosya: {os.path.abspath(FINAL_FILENAME)}")
+        else:
+            print("Hiç veri bulunamadı.")
+        run.rows_out = total_records
+            
+        print(f"Toplam Süre: {int(time.time() - start_time)} saniye")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
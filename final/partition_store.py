@@ -0,0 +1,131 @@
+import os
+import re
+import pandas as pd
+
+# ----------------------------------------------------------------
+# Hive tarzı bölümlenmiş (partitioned) CSV deposu
+# ----------------------------------------------------------------
+# Klasör düzeni:  <root>/year=2023/topic=machine_learning/<parça>.csv
+# Bölüm değerleri (year, topic) dosyanın içine yazılmaz, klasör adından okunur.
+# Böylece "son 5 yıl" gibi bir filtre sadece ilgili klasörlere dokunur.
+
+YEAR_KEY = 'year'
+TOPIC_KEY = 'topic'
+# Yılı okunamayan satırlar için Hive'ın standart boş bölüm adı
+DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def slugify(value):
+    """'Machine Learning & AI' -> 'machine_learning_ai' (klasör adı için güvenli hale getirir)."""
+    value = str(value).strip().lower()
+    value = re.sub(r'[^a-z0-9]+', '_', value).strip('_')
+    return value or DEFAULT_PARTITION
+
+
+def _parse_dir_name(name):
+    """'year=2023' -> ('year', '2023'). Bölüm klasörü değilse None döner."""
+    key, sep, value = name.partition('=')
+    if not sep or not key:
+        return None
+    return key, value
+
+
+def write_partitioned(df, root, partition_cols, part_name):
+    """
+    DataFrame'i partition_cols sütunlarına göre gruplayıp her grubu
+    <root>/<k1>=<v1>/<k2>=<v2>/<part_name>.csv dosyasına yazar.
+    Bölüm sütunları dosyaya yazılmaz. Yazılan satır sayısını döndürür.
+    """
+    if df.empty:
+        return 0
+
+    data_cols = [c for c in df.columns if c not in partition_cols]
+    written = 0
+
+    for values, group in df.groupby(partition_cols, sort=False, dropna=False):
+        if not isinstance(values, tuple):
+            values = (values,)
+        parts = [f"{k}={DEFAULT_PARTITION if pd.isna(v) else v}" for k, v in zip(partition_cols, values)]
+        out_dir = os.path.join(root, *parts)
+        os.makedirs(out_dir, exist_ok=True)
+        # Her worker kendi parça dosyasını yazar, birleştirme adımına gerek kalmaz
+        group[data_cols].to_csv(os.path.join(out_dir, f"{part_name}.csv"), index=False, quoting=1)
+        written += len(group)
+
+    return written
+
+
+def list_partitions(root):
+    """
+    Kök klasörün altındaki tüm yaprak bölümleri bulur.
+    Geriye [({'year': '2023', 'topic': 'x'}, klasör_yolu), ...] listesi döner.
+    """
+    partitions = []
+    if not os.path.isdir(root):
+        return partitions
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        if not any(f.endswith('.csv') for f in filenames):
+            continue
+        rel = os.path.relpath(dirpath, root)
+        values = {}
+        for name in rel.split(os.sep):
+            parsed = _parse_dir_name(name)
+            if parsed:
+                values[parsed[0]] = parsed[1]
+        partitions.append((values, dirpath))
+    return partitions
+
+
+def prune_partitions(root, start_year=None, end_year=None, categories=None):
+    """
+    Yıl aralığı ve kategori (topic) filtresine uymayan bölümleri klasör adından eler.
+    Dosyaların içine hiç bakılmaz (predicate pushdown).
+    """
+    wanted_topics = None
+    if categories:
+        wanted_topics = {slugify(c) for c in categories}
+
+    selected = []
+    for values, path in list_partitions(root):
+        year = values.get(YEAR_KEY)
+        if start_year is not None or end_year is not None:
+            if year is None or not year.isdigit():
+                continue
+            if start_year is not None and int(year) < start_year:
+                continue
+            if end_year is not None and int(year) > end_year:
+                continue
+        if wanted_topics is not None and values.get(TOPIC_KEY) not in wanted_topics:
+            continue
+        selected.append((values, path))
+    return selected
+
+
+def partition_values(root, key):
+    """Bir bölüm anahtarının (örn. 'topic') mevcut tüm değerlerini sıralı döndürür."""
+    return sorted({values[key] for values, _ in list_partitions(root) if key in values})
+
+
+def read_partitions(root, start_year=None, end_year=None, categories=None, usecols=None):
+    """
+    Filtreye uyan bölümleri okuyup tek DataFrame olarak döndürür.
+    Klasör adındaki bölüm değerleri (year, topic) sütun olarak eklenir.
+    """
+    frames = []
+    for values, path in prune_partitions(root, start_year, end_year, categories):
+        for filename in sorted(os.listdir(path)):
+            if not filename.endswith('.csv'):
+                continue
+            part = pd.read_csv(os.path.join(path, filename), usecols=usecols)
+            for key, value in values.items():
+                if key == YEAR_KEY and value.isdigit():
+                    part[key] = int(value)
+                else:
+                    part[key] = value
+            frames.append(part)
+
+    if not frames:
+        return pd.DataFrame(columns=list(usecols) if usecols else None)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,383 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import metrics
+
+FINAL_DIR = os.path.dirname(os.path.abspath(__file__))
+TERMFLOW_DIR = os.path.join(FINAL_DIR, "TermFlow")
+TERMFLOW_DATA = os.path.join('TermFlow', 'data')  # çalışma klasörüne göre (merge_results'ın yazdığı yer)
+
+# ---------------------------------------------------------
+# İÇERİK ADRESLİ PIPELINE ÇALIŞTIRICI
+# ---------------------------------------------------------
+# final/ scriptleri her biri kendi göreli yollarıyla çalışan bağımsız adımlardır. Burada
+# her aşamanın girdileri, çıktıları ve kodu tanımlanır; aşama ancak bunlardan birinin
+# İÇERİĞİ değiştiyse (veya çıktısı yok/elle değiştirilmişse) yeniden çalıştırılır.
+#   - Parmak izi: script + yerel modüller + girdi dosyalarının sha256'sı. Dosya özetleri
+#     (boyut, mtime, inode) ile STATE_FILE'da saklanır; değişmeyen dosya tekrar okunmaz,
+#     böylece değişiklik yokken yenileme saniyeler sürer.
+#   - Bağımlılıklar girdi/çıktı yollarından çıkarılır; birbirine bağlı olmayan aşamalar
+#     (örn. count_by_category ve total_count_per_mounth) paralel çalışır.
+#   - Her aşama ayrı bir süreçte, çalışma klasöründe (scriptlerin beklediği göreli yollar)
+#     çalışır. Başarısız aşamanın aşağısındaki aşamalar atlanır.
+# Kullanım: python pipeline.py [run|status] [aşama ...] [--force] [--jobs N]
+#           [--workdir DIR] [--single-pass]
+
+STATE_FILE = '.pipeline_state.json'
+HASH_BLOCK = 1 << 20
+
+# script: final/'e göre; inputs/outputs: çalışma klasörüne göre (mutlak yollar olduğu gibi)
+# code: scriptin import ettiği yerel modüller (değişirlerse aşama bayatlar)
+Stage = namedtuple('Stage', ['name', 'script', 'inputs', 'outputs', 'code', 'cwd'])
+
+STAGES = [
+    Stage('cleaner', 'cleaner.py',
+          ['data/arxiv-metadata-oai-snapshot.json'], ['data/arxiv_cleaned_data.csv'],
+          ['metrics.py'], None),
+    Stage('categorizer', 'categorizer.py',
+          ['data/arxiv_cleaned_data.csv'], ['arxiv_domain_data'],
+          ['metrics.py'], None),
+    Stage('term_extractor', 'term_extractor.py',
+          ['arxiv_domain_data'], ['analysis_results'],
+          ['metrics.py', 'partition_store.py'], None),
+    Stage('merge_results', 'merge_results.py',
+          # Parquet kopyası opsiyonel (pyarrow gerektirir), bayatlık kontrolüne girmez
+          ['analysis_results'], ['TermFlow/data/all_data_merged.csv'],
+          ['metrics.py', 'TermFlow/warehouse.py'], None),
+    Stage('cooccurrence', 'cooccurrence.py',
+          ['arxiv_domain_data', 'TermFlow/data/all_data_merged.csv'],
+          ['TermFlow/data/cooccurrence.npz', 'TermFlow/data/related_terms.csv'],
+          ['metrics.py', 'term_extractor.py', 'partition_store.py', 'TermFlow/warehouse.py'], None),
+    Stage('count_by_category', 'count_by_category.py',
+          ['data/arxiv_cleaned_data.csv'], [os.path.join(TERMFLOW_DATA, 'domain_yearly_stats.csv')],
+          ['partition_store.py'], None),
+    Stage('total_count_per_mounth', 'total_count_per_mounth.py',
+          ['data/arxiv_cleaned_data.csv'], ['monthly_article_counts.csv'],
+          ['partition_store.py'], None),
+    # TermFlow batch tabloları: çalışma klasörünün TermFlow/data'sı (TERMFLOW_DATA_DIR ile
+    # warehouse.DATA_DIR oraya yönlenir); girdileri merge_results ve count_by_category yazar
+    Stage('term_metrics', 'TermFlow/term_metrics.py',
+          [os.path.join(TERMFLOW_DATA, 'all_data_merged.csv')],
+          [os.path.join(TERMFLOW_DATA, 'term_metrics.csv')],
+          ['TermFlow/warehouse.py'], TERMFLOW_DIR),
+    Stage('bursts', 'TermFlow/bursts.py',
+          [os.path.join(TERMFLOW_DATA, 'all_data_merged.csv'),
+           os.path.join(TERMFLOW_DATA, 'domain_yearly_stats.csv')],
+          [os.path.join(TERMFLOW_DATA, 'emerging_terms.csv')],
+          ['TermFlow/warehouse.py', 'TermFlow/normalized.py'], TERMFLOW_DIR),
+    Stage('archetypes', 'TermFlow/archetypes.py',
+          [os.path.join(TERMFLOW_DATA, 'all_data_merged.csv'),
+           os.path.join(TERMFLOW_DATA, 'domain_yearly_stats.csv')],
+          [os.path.join(TERMFLOW_DATA, 'term_archetypes.csv'),
+           os.path.join(TERMFLOW_DATA, 'archetype_centroids.csv')],
+          ['TermFlow/warehouse.py', 'TermFlow/normalized.py', 'TermFlow/trajectory.py'], TERMFLOW_DIR),
+    Stage('diffusion', 'TermFlow/diffusion.py',
+          [os.path.join(TERMFLOW_DATA, 'all_data_merged.csv'),
+           os.path.join(TERMFLOW_DATA, 'domain_yearly_stats.csv')],
+          [os.path.join(TERMFLOW_DATA, 'term_flows.csv')],
+          ['TermFlow/warehouse.py', 'TermFlow/normalized.py'], TERMFLOW_DIR),
+]
+
+# --single-pass: iki sayım aşaması yerine time_aggregator aynı çıktıları tek taramada üretir
+SINGLE_PASS_STAGE = Stage('time_aggregator', 'time_aggregator.py',
+                          ['data/arxiv_cleaned_data.csv'],
+                          ['time_aggregates.csv', 'monthly_article_counts.csv',
+                           os.path.join(TERMFLOW_DATA, 'domain_yearly_stats.csv')],
+                          ['partition_store.py', 'count_by_category.py'], None)
+SINGLE_PASS_REPLACES = {'count_by_category', 'total_count_per_mounth'}
+
+
+def stage_list(single_pass=False):
+    if not single_pass:
+        return list(STAGES)
+    stages = [s for s in STAGES if s.name not in SINGLE_PASS_REPLACES]
+    return stages[:4] + [SINGLE_PASS_STAGE] + stages[4:]
+
+
+# ---------------------------------------------------------
+# İÇERİK ÖZETLERİ
+# ---------------------------------------------------------
+
+class HashCache:
+    """(boyut, mtime, inode) değişmediyse dosyanın önceki sha256'sını döndürür."""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.lock = threading.Lock()
+
+    def file_digest(self, path):
+        st = os.stat(path)
+        key = os.path.abspath(path)
+        stamp = [st.st_size, st.st_mtime_ns, st.st_ino]
+        with self.lock:
+            cached = self.entries.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK), b''):
+                h.update(block)
+        digest = h.hexdigest()
+        with self.lock:
+            self.entries[key] = [stamp, digest]
+        return digest
+
+    def digest(self, path):
+        """Dosya veya klasör (içindeki tüm dosyalar, göreli yollarıyla) özeti; yoksa None."""
+        if os.path.isfile(path):
+            return self.file_digest(path)
+        if not os.path.isdir(path):
+            return None
+        h = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            for name in sorted(files):
+                full = os.path.join(root, name)
+                h.update(os.path.relpath(full, path).encode('utf-8'))
+                h.update(self.file_digest(full).encode('ascii'))
+        return h.hexdigest()
+
+
+def stage_fingerprint(stage, workdir, hashes):
+    """Aşamanın kodu + girdileri için tek özet. Eksik girdi varsa (None, eksik_yol)."""
+    h = hashlib.sha256()
+    for rel in [stage.script] + stage.code:
+        h.update(rel.encode('utf-8'))
+        h.update(hashes.file_digest(os.path.join(FINAL_DIR, rel)).encode('ascii'))
+    for rel in stage.inputs:
+        digest = hashes.digest(os.path.join(workdir, rel))
+        if digest is None:
+            return None, rel
+        h.update(rel.encode('utf-8'))
+        h.update(digest.encode('ascii'))
+    return h.hexdigest(), None
+
+
+def output_digests(stage, workdir, hashes):
+    return {rel: hashes.digest(os.path.join(workdir, rel)) for rel in stage.outputs}
+
+
+# ---------------------------------------------------------
+# DURUM DOSYASI
+# ---------------------------------------------------------
+
+def load_state(workdir):
+    path = os.path.join(workdir, STATE_FILE)
+    if not os.path.exists(path):
+        return {'stages': {}, 'hashes': {}}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(workdir, state):
+    path = os.path.join(workdir, STATE_FILE)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------
+# DAG
+# ---------------------------------------------------------
+
+def _produces(path, output):
+    return path == output or path.startswith(output + os.sep)
+
+
+def dependencies(stages, workdir):
+    """aşama adı -> girdilerini üreten aşamaların adları."""
+    def resolve(paths):
+        return [os.path.normpath(os.path.join(workdir, p)) for p in paths]
+
+    deps = {}
+    for stage in stages:
+        deps[stage.name] = {other.name for other in stages if other is not stage
+                            for i in resolve(stage.inputs) for o in resolve(other.outputs)
+                            if _produces(i, o)}
+    return deps
+
+
+def select(stages, deps, targets):
+    """Hedef aşamalar + onları besleyen tüm üst aşamalar (hedef yoksa hepsi)."""
+    if not targets:
+        return stages
+    wanted, todo = set(), list(targets)
+    while todo:
+        name = todo.pop()
+        if name not in wanted:
+            wanted.add(name)
+            todo.extend(deps[name])
+    return [s for s in stages if s.name in wanted]
+
+
+def staleness(stage, workdir, state, hashes):
+    """(parmak izi, neden) -- neden None ise aşama güncel."""
+    fingerprint, missing = stage_fingerprint(stage, workdir, hashes)
+    if fingerprint is None:
+        return None, f"girdi yok: {missing}"
+    previous = state['stages'].get(stage.name)
+    if previous is None:
+        return fingerprint, "hiç çalışmamış"
+    if previous['fingerprint'] != fingerprint:
+        return fingerprint, "girdi veya kod değişmiş"
+    current = output_digests(stage, workdir, hashes)
+    if any(d is None for d in current.values()):
+        return fingerprint, "çıktı eksik"
+    if current != previous['outputs']:
+        return fingerprint, "çıktı elle değiştirilmiş"
+    return fingerprint, None
+
+
+def run_script(stage, workdir):
+    cwd = stage.cwd or workdir
+    env = dict(os.environ)
+    # Yerel importlar (partition_store, metrics) her çalışma klasöründen bulunsun
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [FINAL_DIR, env.get('PYTHONPATH')]))
+    env.setdefault('PIPELINE_METRICS_FILE', os.path.join(workdir, 'pipeline_metrics.jsonl'))
+    # TermFlow scriptleri (cwd=TermFlow/) de merge_results'ın yazdığı klasörü okuyup yazsın
+    env['TERMFLOW_DATA_DIR'] = os.path.join(workdir, TERMFLOW_DATA)
+    log_path = os.path.join(workdir, f".pipeline_{stage.name}.log")
+    with open(log_path, 'w', encoding='utf-8') as log:
+        proc = subprocess.run([sys.executable, os.path.join(FINAL_DIR, stage.script)],
+                              cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT)
+    return proc.returncode, log_path
+
+
+# ---------------------------------------------------------
+# ÇALIŞTIRMA
+# ---------------------------------------------------------
+
+def run(targets=None, workdir=FINAL_DIR, force=False, jobs=None, dry_run=False, single_pass=False):
+    """
+    Bayat aşamaları bağımlılık sırasıyla (bağımsız olanları paralel) çalıştırır.
+    Dönen sözlük: aşama adı -> 'fresh' / 'ran' / 'stale' (dry_run) / 'failed' / 'blocked' / 'missing'.
+    """
+    workdir = os.path.abspath(workdir)
+    stages = stage_list(single_pass)
+    deps = dependencies(stages, workdir)
+    unknown = set(targets or []) - set(deps)
+    if unknown:
+        raise ValueError(f"Bilinmeyen aşama: {', '.join(sorted(unknown))}")
+    selected = select(stages, deps, targets)
+    names = {s.name for s in selected}
+
+    state = load_state(workdir)
+    hashes = HashCache(state.get('hashes'))
+    state_lock = threading.Lock()
+    results = {}
+    # dry_run'da yeniden çalışacak bir aşamanın altındakiler de bayat sayılır
+    upstream_changed = set()
+
+    def execute(stage, fingerprint):
+        with metrics.stage(f"pipeline/{stage.name}"):
+            code, log_path = run_script(stage, workdir)
+        if code != 0:
+            return stage, f"çıkış kodu {code}, log: {log_path}"
+        with state_lock:
+            state['stages'][stage.name] = {
+                'fingerprint': fingerprint,
+                'outputs': output_digests(stage, workdir, hashes),
+                'finished': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+            state['hashes'] = hashes.entries
+            save_state(workdir, state)
+        return stage, None
+
+    pending = list(selected)
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        while pending or running:
+            waiting = len(pending)
+            for stage in list(pending):
+                stage_deps = deps[stage.name] & names
+                # Üst aşama 'missing' ise engellemez: aşamanın kendi girdileri duruyor olabilir
+                if any(results.get(d) in ('failed', 'blocked') for d in stage_deps):
+                    results[stage.name] = 'blocked'
+                    print(f"[{stage.name}] atlandı (üst aşama başarısız)")
+                    pending.remove(stage)
+                    continue
+                if not all(d in results for d in stage_deps):
+                    continue
+                pending.remove(stage)
+
+                if dry_run and stage_deps & upstream_changed:
+                    results[stage.name] = 'stale'
+                    upstream_changed.add(stage.name)
+                    print(f"[{stage.name}] bayat: üst aşama yeniden çalışacak")
+                    continue
+                fingerprint, reason = staleness(stage, workdir, state, hashes)
+                if fingerprint is None and all(output_digests(stage, workdir, hashes).values()):
+                    # Kaynak silinmiş ama çıktı duruyor (örn. ham snapshot): mevcut çıktı kullanılır
+                    results[stage.name] = 'fresh'
+                    print(f"[{stage.name}] {reason}, mevcut çıktı kullanılıyor")
+                elif fingerprint is None:
+                    results[stage.name] = 'missing'
+                    print(f"[{stage.name}] çalıştırılamıyor: {reason}")
+                elif reason is None and not force:
+                    results[stage.name] = 'fresh'
+                    print(f"[{stage.name}] güncel")
+                elif dry_run:
+                    results[stage.name] = 'stale'
+                    upstream_changed.add(stage.name)
+                    print(f"[{stage.name}] bayat: {reason or 'zorla'}")
+                else:
+                    print(f"[{stage.name}] çalışıyor ({reason or 'zorla'})...")
+                    running[pool.submit(execute, stage, fingerprint)] = time.perf_counter()
+
+            if not running:
+                # Çalışan aşama yok ve bu turda hiçbir aşama ilerlemediyse kalanlar birbirini bekliyor
+                if pending and len(pending) == waiting:
+                    raise RuntimeError("Aşama bağımlılıklarında döngü var: "
+                                       + ", ".join(s.name for s in pending))
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, error = future.result()
+                elapsed = time.perf_counter() - running.pop(future)
+                if error:
+                    results[stage.name] = 'failed'
+                    print(f"[{stage.name}] HATA ({elapsed:.1f} sn): {error}")
+                else:
+                    results[stage.name] = 'ran'
+                    print(f"[{stage.name}] tamamlandı ({elapsed:.1f} sn)")
+
+    # Sadece özet önbelleği değiştiyse de kaydet (bir sonraki kontrol yine hızlı olsun)
+    with state_lock:
+        state['hashes'] = hashes.entries
+        save_state(workdir, state)
+    return results
+
+
+if __name__ == "__main__":
+    # İlk argüman komut (run: bayat aşamaları çalıştır, status: sadece göster); verilmezse run
+    argv = sys.argv[1:]
+    command = argv.pop(0) if argv and argv[0] in ('run', 'status') else 'run'
+
+    parser = argparse.ArgumentParser(prog='pipeline.py [run|status]',
+                                     description="final/ pipeline'ını sadece bayat aşamaları çalıştırarak yeniler")
+    parser.add_argument('stages', nargs='*', help="hedef aşamalar (üst aşamalarıyla birlikte); boşsa hepsi")
+    parser.add_argument('--force', action='store_true', help="güncel olsa da çalıştır")
+    parser.add_argument('--jobs', type=int, help="aynı anda en fazla kaç aşama (varsayılan: CPU sayısı)")
+    parser.add_argument('--workdir', default=FINAL_DIR, help="scriptlerin çalışacağı klasör")
+    parser.add_argument('--single-pass', action='store_true',
+                        help="sayımları time_aggregator ile tek taramada üret")
+    args = parser.parse_args(argv)
+
+    metrics.configure(path=os.path.join(os.path.abspath(args.workdir), 'pipeline_metrics.jsonl'))
+    start = time.perf_counter()
+    try:
+        results = run(args.stages, args.workdir, args.force, args.jobs,
+                      dry_run=command == 'status', single_pass=args.single_pass)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"\n{len(results)} aşama: " + ", ".join(f"{k}={v}" for k, v in results.items()))
+    print(f"Toplam süre: {time.perf_counter() - start:.2f} sn")
+    sys.exit(1 if any(v == 'failed' for v in results.values()) else 0)
@@ -7,6 +7,8 @@ from sklearn.feature_extraction.text import CountVectorizer
 import os
 import glob
 from tqdm import tqdm
+from partition_store import read_partitions, partition_values, TOPIC_KEY
+import metrics
 
 # --- Gerekli NLTK verilerini indir (Sadece ilk seferde çalışır) ---
 try:
@@ -22,6 +24,13 @@ except LookupError:
 INPUT_FOLDER = 'arxiv_domain_data'   # CSV'lerin olduğu klasör
 OUTPUT_MAIN_FOLDER = 'analysis_results' # Sonuçların gideceği ana klasör
 
+# Bölümlenmiş (year=/topic=) girdi kullanılacaksa klasörü ver (örn. 'openalex_partitioned').
+# None ise INPUT_FOLDER'daki kategori CSV'leri okunur.
+PARTITION_INPUT = None
+# Örn: (2021, 2025) -> sadece bu yıllar analiz edilir. Bölümlenmiş girdide diğer yılların
+# klasörleri hiç açılmaz.
+YEAR_RANGE = None
+
 # Akademik Stopwords (Her alanda geçen gereksiz kelimeler)
 ACADEMIC_STOPWORDS = {
     'paper', 'study', 'result', 'method', 'using', 'proposed', 'based', 
@@ -60,10 +69,38 @@ def preprocess_for_unigrams(text):
     filtered = [w for w in words if w not in extended_stop_words and len(w) > 2]
     return " ".join(filtered)
 
+def prepare_frame(df):
+    """
+    Ham makale tablosu -> year, text_clean, text_unigrams ve text_ngrams sütunları eklenmiş
+    tablo (tarihi olmayan satırlar atılır). cooccurrence.py de aynı temizliği kullanır.
+    """
+    # Ön İşleme (Tarih ve Metin Birleştirme)
+    df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce')
+    df = df.dropna(subset=['published_date']) # Tarihi olmayanları at
+    df['year'] = df['published_date'].dt.year
+
+    # Dosya girdisinde yıl filtresi satır bazında uygulanır
+    if YEAR_RANGE:
+        df = df[df['year'].between(YEAR_RANGE[0], YEAR_RANGE[1])].copy()
+    
+    # Başlık ve Özeti Birleştirip Temizle
+    df['text_raw'] = df['title'].fillna('') + ' ' + df['summary'].fillna('')
+    df['text_clean'] = df['text_raw'].apply(clean_text)
+    
+    # A) Tekil Kelimeler (Unigrams) için Hazırlık
+    # (Daha sıkı stopword filtresi uygulanır)
+    df['text_unigrams'] = df['text_clean'].apply(preprocess_for_unigrams)
+    
+    # B) Terim Öbekleri (N-grams: Machine Learning, Interest Rate vb.) için Hazırlık
+    # (Sadece standart stopword'ler atılır, yapı bozulmasın diye)
+    df['text_ngrams'] = df['text_clean'].apply(preprocess_for_ngrams)
+    return df
+
 def analyze_yearly_trends(df, text_column, ngram_range=(1,1), min_freq=2):
     """
     Belirtilen metin sütununu yıllara göre analiz eder.
     Geriye index'i terimler, sütunları yıllar olan bir DataFrame döner.
+    Her yıl ayrı bir metrik alt aşamasıdır (örn. term_extractor/physics/bigrams/2021).
     """
     yearly_counts = {}
     all_terms = set()
@@ -78,21 +115,24 @@ def analyze_yearly_trends(df, text_column, ngram_range=(1,1), min_freq=2):
         if len(corpus) < 5: # Çok az makale varsa atla
             continue
             
-        try:
-            # CountVectorizer çok hızlıdır
-            vectorizer = CountVectorizer(ngram_range=ngram_range, min_df=min_freq)
-            X = vectorizer.fit_transform(corpus)
-            
-            # Kelime frekanslarını topla
-            sum_words = X.sum(axis=0)
-            words_freq = {word: sum_words[0, idx] for word, idx in vectorizer.vocabulary_.items()}
-            
-            yearly_counts[year] = words_freq
-            all_terms.update(words_freq.keys())
-            
-        except ValueError:
-            # "Empty vocabulary" hatası alırsak (hiç kelime kalmadıysa) devam et
-            continue
+        with metrics.stage(str(year), rows_in=len(corpus)) as stage:
+            try:
+                # CountVectorizer çok hızlıdır
+                vectorizer = CountVectorizer(ngram_range=ngram_range, min_df=min_freq)
+                X = vectorizer.fit_transform(corpus)
+                
+                # Kelime frekanslarını topla
+                sum_words = X.sum(axis=0)
+                words_freq = {word: sum_words[0, idx] for word, idx in vectorizer.vocabulary_.items()}
+                
+                yearly_counts[year] = words_freq
+                all_terms.update(words_freq.keys())
+                stage.rows_out = len(words_freq)
+                
+            except ValueError:
+                # "Empty vocabulary" hatası alırsak (hiç kelime kalmadıysa) devam et
+                stage.rows_out = 0
+                continue
 
     # Sonuç tablosunu oluştur
     result_df = pd.DataFrame(index=sorted(list(all_terms)))
@@ -113,11 +153,28 @@ def analyze_yearly_trends(df, text_column, ngram_range=(1,1), min_freq=2):
 # ANA İŞLEM DÖNGÜSÜ
 # ---------------------------------------------------------
 
-def main():
-    # Çıktı klasörünü oluştur
-    if not os.path.exists(OUTPUT_MAIN_FOLDER):
-        os.makedirs(OUTPUT_MAIN_FOLDER)
-    
+def iter_category_frames():
+    """
+    (kategori_adı, DataFrame) çiftlerini sırayla üretir.
+    Girdi ya INPUT_FOLDER'daki arxiv_<kategori>.csv dosyaları ya da PARTITION_INPUT'taki
+    bölümlerdir (topic bölümü varsa her topic bir kategori sayılır).
+    """
+    start_year, end_year = YEAR_RANGE if YEAR_RANGE else (None, None)
+
+    if PARTITION_INPUT:
+        topics = partition_values(PARTITION_INPUT, TOPIC_KEY)
+        if not topics:
+            # Sadece yıla göre bölümlenmiş: tüm veri tek kategori
+            topics = [None]
+            name = os.path.basename(os.path.normpath(PARTITION_INPUT))
+        print(f"Toplam {len(topics)} bölüm kategorisi bulundu. Analiz başlıyor...\n")
+
+        for topic in tqdm(topics, desc="Kategoriler İşleniyor"):
+            df = read_partitions(PARTITION_INPUT, start_year, end_year,
+                                 categories=[topic] if topic else None)
+            yield (topic or name), df
+        return
+
     # Tüm kategori dosyalarını bul
     csv_files = glob.glob(os.path.join(INPUT_FOLDER, "*.csv"))
     
@@ -127,57 +184,60 @@ def main():
         # Dosya adından kategori ismini çıkar (örn: arxiv_economics.csv -> economics)
         filename = os.path.basename(file_path)
         category_name = filename.replace('arxiv_', '').replace('.csv', '')
-        
-        # Bu kategori için özel klasör oluştur
-        category_out_dir = os.path.join(OUTPUT_MAIN_FOLDER, category_name)
-        if not os.path.exists(category_out_dir):
-            os.makedirs(category_out_dir)
             
         # 1. Veriyi Oku
         try:
-            df = pd.read_csv(file_path)
+            with metrics.stage(f"read/{category_name}", input_path=file_path) as stage:
+                df = pd.read_csv(file_path)
+                stage.rows_out = len(df)
         except Exception as e:
             print(f"Hata: {filename} okunamadı. {e}")
             continue
-            
-        if df.empty:
-            continue
 
-        # 2. Ön İşleme (Tarih ve Metin Birleştirme)
-        df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce')
-        df = df.dropna(subset=['published_date']) # Tarihi olmayanları at
-        df['year'] = df['published_date'].dt.year
-        
-        # Başlık ve Özeti Birleştirip Temizle
-        df['text_raw'] = df['title'].fillna('') + ' ' + df['summary'].fillna('')
-        df['text_clean'] = df['text_raw'].apply(clean_text)
-        
-        # A) Tekil Kelimeler (Unigrams) için Hazırlık
-        # (Daha sıkı stopword filtresi uygulanır)
-        df['text_unigrams'] = df['text_clean'].apply(preprocess_for_unigrams)
-        
-        # B) Terim Öbekleri (N-grams: Machine Learning, Interest Rate vb.) için Hazırlık
-        # (Sadece standart stopword'ler atılır, yapı bozulmasın diye)
-        df['text_ngrams'] = df['text_clean'].apply(preprocess_for_ngrams)
-        
-        # 3. Analizleri Çalıştır ve Kaydet
-        
-        # --- Analiz 1: Tekil Kelimeler (Keywords) ---
-        # Örn: "inflation", "blockchain", "virus"
-        df_uni = analyze_yearly_trends(df, 'text_unigrams', ngram_range=(1, 1), min_freq=5)
-        df_uni.head(1000).to_csv(os.path.join(category_out_dir, "keywords_yearly.csv"))
-        
-        # --- Analiz 2: İkili Terimler (Bigrams) ---
-        # Örn: "machine learning", "monetary policy", "supply chain"
-        df_bi = analyze_yearly_trends(df, 'text_ngrams', ngram_range=(2, 2), min_freq=3)
-        df_bi.head(1000).to_csv(os.path.join(category_out_dir, "bigrams_yearly.csv"))
-        
-        # --- Analiz 3: Üçlü Terimler (Trigrams) ---
-        # Örn: "deep neural network", "stochastic differential equations"
-        df_tri = analyze_yearly_trends(df, 'text_ngrams', ngram_range=(3, 3), min_freq=3)
-        df_tri.head(1000).to_csv(os.path.join(category_out_dir, "trigrams_yearly.csv"))
+        yield category_name, df
+
+NGRAM_ANALYSES = [
+    # (çıktı adı, metin sütunu, ngram_range, min_freq)
+    # Örn: "inflation", "blockchain", "virus"
+    ('keywords', 'text_unigrams', (1, 1), 5),
+    # Örn: "machine learning", "monetary policy", "supply chain"
+    ('bigrams', 'text_ngrams', (2, 2), 3),
+    # Örn: "deep neural network", "stochastic differential equations"
+    ('trigrams', 'text_ngrams', (3, 3), 3),
+]
+
+def main():
+    # Çıktı klasörünü oluştur
+    if not os.path.exists(OUTPUT_MAIN_FOLDER):
+        os.makedirs(OUTPUT_MAIN_FOLDER)
+    
+    with metrics.stage('term_extractor', output_path=OUTPUT_MAIN_FOLDER):
+        for category_name, df in iter_category_frames():
+            if df.empty:
+                continue
+            with metrics.stage(category_name, rows_in=len(df)):
+                process_category(category_name, df)
 
     print(f"\n✅ Tüm işlemler tamamlandı! Sonuçlar '{OUTPUT_MAIN_FOLDER}' klasöründe.")
+    print("TermFlow tablosu için: python merge_results.py")
+
+def process_category(category_name, df):
+    # Bu kategori için özel klasör oluştur
+    category_out_dir = os.path.join(OUTPUT_MAIN_FOLDER, category_name)
+    if not os.path.exists(category_out_dir):
+        os.makedirs(category_out_dir)
+
+    with metrics.stage('preprocess', rows_in=len(df)) as stage:
+        df = prepare_frame(df)
+        stage.rows_out = len(df)
+
+    # 3. Analizleri Çalıştır ve Kaydet
+    for name, text_column, ngram_range, min_freq in NGRAM_ANALYSES:
+        out_path = os.path.join(category_out_dir, f"{name}_yearly.csv")
+        with metrics.stage(name, rows_in=len(df), output_path=out_path) as stage:
+            result = analyze_yearly_trends(df, text_column, ngram_range=ngram_range, min_freq=min_freq)
+            result.head(1000).to_csv(out_path)
+            stage.rows_out = min(len(result), 1000)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
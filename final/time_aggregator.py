@@ -0,0 +1,231 @@
+import os
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from tqdm import tqdm
+from partition_store import read_partitions, slugify
+from count_by_category import DOMAINS, domain_bitmask, domain_year_table
+
+# ---------------------------------------------------------
+# TEK GEÇİŞLİ ZAMAN TOPLAMA MOTORU
+# ---------------------------------------------------------
+# total_count_per_mounth.py (aylık), count_by_category.py (yıllık x alan) ve
+# hw3'teki çeyreklik sayımlar aynı dosyayı ayrı ayrı okuyup tarihi tekrar tekrar
+# çözüyordu. Bu script veriyi parça parça TEK KEZ okur, tarihi bir kez gün sayısına
+# (1970'ten beri gün) çevirir ve aylık sayımları tutar. Çeyrek ve yıl sayımları
+# aylıkların toplamıdır, yeni bir okuma gerektirmez.
+
+# Giriş ve Çıkış
+input_file = 'data/arxiv_cleaned_data.csv'
+output_file = 'time_aggregates.csv'             # Tek, düzenli (tidy) tablo
+monthly_output_file = 'monthly_article_counts.csv'  # total_count_per_mounth.py ile aynı format
+domain_output_file = os.path.join('TermFlow', 'data', 'domain_yearly_stats.csv')  # count_by_category.py ile aynı format ve yer
+
+# Bölümlenmiş (year=/topic=) girdi kullanılacaksa klasörü ver, None ise input_file okunur.
+partition_input = None
+year_range = None
+
+CHUNK_SIZE = 500_000
+# Aylık sayaçların başlangıcı (bu yıldan önceki tarihler hatalı kabul edilir)
+BASE_YEAR = 1900
+
+GRANULARITIES = ['month', 'quarter', 'year']
+
+# ---------------------------------------------------------
+# TARİH ÇÖZÜMLEME
+# ---------------------------------------------------------
+
+def to_day_ordinals(dates):
+    """Tarih string'lerini bir kez çözüp 1970-01-01'den beri gün sayısına (int32) çevirir."""
+    parsed = pd.to_datetime(dates, errors='coerce', utc=True)
+    valid = parsed.notna().to_numpy()
+    days = np.full(len(parsed), -1, dtype=np.int32)
+    if valid.any():
+        naive = parsed[valid].dt.tz_localize(None).to_numpy()
+        days[valid] = naive.astype('datetime64[D]').astype(np.int64)
+    return days, valid
+
+def month_codes(days):
+    """Gün sayısı -> BASE_YEAR Ocak'tan beri ay numarası."""
+    months_since_1970 = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    return months_since_1970 + (1970 - BASE_YEAR) * 12
+
+def month_label(code):
+    return f"{BASE_YEAR + code // 12}-{code % 12 + 1:02d}"
+
+def quarter_label(code):
+    return f"{BASE_YEAR + code // 4}Q{code % 4 + 1}"
+
+# ---------------------------------------------------------
+# SAYAÇLAR
+# ---------------------------------------------------------
+
+class MonthlyCounter:
+    """
+    Anahtar (alan / kategori) x ay sayım matrisi. Yeni anahtar geldikçe satır ekler.
+    Her parça için sadece bincount yapılır; parça bitince ara veri bellekte kalmaz.
+    """
+    def __init__(self, n_months, keys=None):
+        self.n_months = n_months
+        self.keys = list(keys) if keys else []
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        self.counts = np.zeros((len(self.keys), n_months), dtype=np.int64)
+
+    def _grow(self, new_keys):
+        for k in new_keys:
+            self.index[k] = len(self.keys)
+            self.keys.append(k)
+        extra = len(self.keys) - self.counts.shape[0]
+        if extra > 0:
+            self.counts = np.vstack([self.counts, np.zeros((extra, self.n_months), dtype=np.int64)])
+
+    def add_codes(self, row, months):
+        self.counts[row] += np.bincount(months, minlength=self.n_months)
+
+    def add_labels(self, labels, months):
+        """labels: her makalenin anahtarı (örn. primary_category)."""
+        codes, uniques = pd.factorize(labels)
+        self._grow([u for u in uniques if u not in self.index])
+        keep = codes >= 0
+        rows = np.array([self.index[u] for u in uniques], dtype=np.int64)[codes[keep]]
+        flat = rows * self.n_months + months[keep]
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+# ---------------------------------------------------------
+# OKUMA (TEK GEÇİŞ)
+# ---------------------------------------------------------
+
+def iter_chunks():
+    """Girdiyi parça parça okur; her parçada published_date + kategori sütunları bulunur."""
+    if partition_input:
+        start_year, end_year = year_range if year_range else (None, None)
+        df = read_partitions(partition_input, start_year, end_year)
+        for start in range(0, len(df), CHUNK_SIZE):
+            yield df.iloc[start:start + CHUNK_SIZE]
+        return
+
+    reader = pd.read_csv(input_file, usecols=['published_date', 'primary_category', 'all_categories'],
+                         chunksize=CHUNK_SIZE)
+    for chunk in reader:
+        yield chunk
+
+def aggregate():
+    """
+    Tüm veriyi tek kez tarayıp genel / alan / birincil kategori bazında aylık sayımları döndürür.
+    Geriye (overall[n_months], domain_counter, category_counter) döner.
+    """
+    n_months = (datetime.now().year + 2 - BASE_YEAR) * 12
+    overall = np.zeros(n_months, dtype=np.int64)
+    domains = MonthlyCounter(n_months, DOMAINS)
+    categories = MonthlyCounter(n_months)
+
+    for chunk in tqdm(iter_chunks(), desc="Parçalar taranıyor"):
+        days, valid = to_day_ordinals(chunk['published_date'])
+        months = month_codes(days[valid])
+        in_range = (months >= 0) & (months < n_months)
+        if year_range:
+            years = BASE_YEAR + months // 12
+            in_range &= (years >= year_range[0]) & (years <= year_range[1])
+        months = months[in_range]
+        chunk = chunk[valid][in_range]
+
+        overall += np.bincount(months, minlength=n_months)
+
+        if 'all_categories' in chunk.columns:
+            mask = domain_bitmask(chunk['all_categories'])
+            for bit in range(len(DOMAINS)):
+                has_domain = ((mask >> bit) & 1).astype(bool)
+                domains.add_codes(bit, months[has_domain])
+        else:
+            # OpenAlex: arXiv kodu yok, konu doğrudan alan
+            domains.add_labels(chunk['primary_category'].fillna('').map(slugify).to_numpy(), months)
+
+        categories.add_labels(chunk['primary_category'].to_numpy(), months)
+
+    return overall, domains, categories
+
+# ---------------------------------------------------------
+# ÇIKTI TABLOLARI
+# ---------------------------------------------------------
+
+def roll_up(counts, granularity):
+    """Aylık sayımları (son eksen) çeyrek veya yıla toplar."""
+    if granularity == 'month':
+        return counts
+    size = 3 if granularity == 'quarter' else 12
+    shape = counts.shape[:-1] + (counts.shape[-1] // size, size)
+    return counts.reshape(shape).sum(axis=-1)
+
+def period_labels(granularity, first, last):
+    if granularity == 'month':
+        return [month_label(c) for c in range(first, last + 1)]
+    if granularity == 'quarter':
+        return [quarter_label(c) for c in range(first, last + 1)]
+    return [str(BASE_YEAR + c) for c in range(first, last + 1)]
+
+def build_tidy_table(overall, domains, categories):
+    """
+    (granularity, dimension, key, period, count) tablosu.
+    Dönem aralığı verideki ilk ve son aya göre kırpılır; aradaki boş dönemler 0 olarak yazılır.
+    """
+    nonzero = np.flatnonzero(overall)
+    if len(nonzero) == 0:
+        return pd.DataFrame(columns=['granularity', 'dimension', 'key', 'period', 'count'])
+    first_month, last_month = nonzero[0], nonzero[-1]
+
+    dimensions = [
+        ('all', ['all'], overall[np.newaxis, :]),
+        ('domain', domains.keys, domains.counts),
+        ('primary_category', categories.keys, categories.counts),
+    ]
+
+    frames = []
+    for granularity in GRANULARITIES:
+        size = {'month': 1, 'quarter': 3, 'year': 12}[granularity]
+        first, last = first_month // size, last_month // size
+        labels = period_labels(granularity, first, last)
+
+        for dimension, keys, counts in dimensions:
+            if len(keys) == 0:
+                continue
+            rolled = roll_up(counts, granularity)[:, first:last + 1]
+            frames.append(pd.DataFrame({
+                'granularity': granularity,
+                'dimension': dimension,
+                'key': np.repeat(np.asarray(keys, dtype=object), len(labels)),
+                'period': np.tile(labels, len(keys)),
+                'count': rolled.ravel(),
+            }))
+
+    return pd.concat(frames, ignore_index=True)
+
+def build_monthly_view(tidy):
+    """monthly_article_counts.csv ile aynı tablo (date, count)."""
+    view = tidy[(tidy['granularity'] == 'month') & (tidy['dimension'] == 'all')]
+    return view[['period', 'count']].rename(columns={'period': 'date'}).reset_index(drop=True)
+
+def build_domain_view(domains):
+    """domain_yearly_stats.csv ile aynı tablo."""
+    yearly = roll_up(domains.counts, 'year')
+    return domain_year_table(yearly, domains.keys, BASE_YEAR)
+
+def main():
+    print("Veri tek geçişte taranıyor...")
+    overall, domains, categories = aggregate()
+
+    tidy = build_tidy_table(overall, domains, categories)
+    tidy.to_csv(output_file, index=False)
+
+    # Eski scriptlerin çıktılarını da aynı taramadan üret
+    build_monthly_view(tidy).to_csv(monthly_output_file, index=False)
+    os.makedirs(os.path.dirname(domain_output_file) or '.', exist_ok=True)
+    build_domain_view(domains).to_csv(domain_output_file)
+
+    print(f"\n✅ İşlem tamamlandı! Dosya: {output_file} ({len(tidy)} satır)")
+    print(f"Türetilen görünümler: {monthly_output_file}, {domain_output_file}")
+    print("\n--- Son 5 Yılın Özeti ---")
+    yearly = tidy[(tidy['granularity'] == 'year') & (tidy['dimension'] == 'all')]
+    print(yearly.tail(5)[['period', 'count']].to_string(index=False))
+
+if __name__ == "__main__":
+    main()
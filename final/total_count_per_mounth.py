@@ -1,19 +1,31 @@
 import pandas as pd
+from partition_store import read_partitions
 
 # Giriş ve Çıkış dosyaları
 input_file = 'data/arxiv_cleaned_data.csv'
 output_file = 'monthly_article_counts.csv'
 
+# Bölümlenmiş (year=/topic=) girdi kullanılacaksa klasörü ver, None ise input_file okunur.
+partition_input = None
+# Örn: (2021, 2025) -> bölümlenmiş girdide sadece bu yılların klasörleri okunur.
+year_range = None
+
 print("Veri okunuyor...")
 
 # Sadece tarih sütununu okuyoruz
-df = pd.read_csv(input_file, usecols=['published_date'])
+if partition_input:
+    start_year, end_year = year_range if year_range else (None, None)
+    df = read_partitions(partition_input, start_year, end_year, usecols=['published_date'])[['published_date']]
+else:
+    df = pd.read_csv(input_file, usecols=['published_date'])
 
 # Tarihi datetime formatına çevir (UTC=True, saat dilimi karmaşasını önler)
 df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce', utc=True)
 
 # Hatalı tarihleri temizle
 df = df.dropna(subset=['published_date'])
+if year_range:
+    df = df[df['published_date'].dt.year.between(year_range[0], year_range[1])]
 
 # Tarihi indeks yap (Resample/Zaman serisi işlemi için şarttır)
 df.set_index('published_date', inplace=True)
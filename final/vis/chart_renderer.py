@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import plotly.io as pio
+
+# ---------------------------------------------------------
+# BATCH CHART RENDERER
+# ---------------------------------------------------------
+# Scripts collect figures with add() instead of calling write_html / write_image
+# one by one. render() then:
+#   - skips outputs whose figure + render parameters hash is unchanged since the
+#     last run (hashes live in CACHE_FILE inside the output directory),
+#   - exports PNGs in a process pool; each worker keeps one Kaleido instance alive
+#     for all of its charts instead of starting a renderer per image,
+#   - optionally writes one combined HTML report per group (e.g. per category)
+#     with plotly.js embedded once, instead of one HTML file per chart.
+
+CACHE_FILE = ".render_cache.json"
+PNG_SCALE = 2
+
+
+def figure_hash(fig_json, **params):
+    """Content hash of a serialized figure plus the parameters that affect the output."""
+    h = hashlib.sha256(fig_json.encode('utf-8'))
+    h.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------
+# WORKER PROCESS
+# ---------------------------------------------------------
+
+def _init_worker():
+    """Start one persistent Kaleido renderer per worker (Kaleido >= 1.0)."""
+    try:
+        import kaleido
+        if hasattr(kaleido, 'start_sync_server'):
+            kaleido.start_sync_server(silence_warnings=True)
+    except ImportError:
+        pass  # write_image will raise a clear error on first use
+    # Older Kaleido (0.2.x) already keeps its subprocess alive between calls
+
+
+def _render_png(job):
+    fig_json, png_path, scale = job
+    start = time.perf_counter()
+    pio.write_image(pio.from_json(fig_json, skip_invalid=True), png_path, scale=scale)
+    return png_path, time.perf_counter() - start
+
+
+# ---------------------------------------------------------
+# BATCH
+# ---------------------------------------------------------
+
+class BatchRenderer:
+    def __init__(self, output_dir, workers=None, scale=PNG_SCALE, png=True):
+        self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.scale = scale
+        self.png = png
+        self.cache_path = os.path.join(output_dir, CACHE_FILE)
+        self.specs = []
+
+    def add(self, fig, html_path=None, png_path=None, group=None):
+        """Queue a figure. group: key for the combined report (e.g. category folder)."""
+        self.specs.append({
+            'fig_json': pio.to_json(fig, validate=False),
+            'html_path': html_path,
+            'png_path': png_path if self.png else None,
+            'group': group,
+        })
+
+    def _load_cache(self):
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def _save_cache(self, cache):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(self.cache_path, 'w') as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+
+    @staticmethod
+    def _fresh(cache, path, digest):
+        return cache.get(path) == digest and os.path.exists(path)
+
+    def render(self, combined_html=False, report_name="report.html"):
+        """
+        Write all queued outputs. combined_html=True writes <group dir>/<report_name>
+        per group instead of one HTML per chart. Returns a small stats dict.
+        """
+        cache = self._load_cache()
+        stats = {'png_rendered': 0, 'html_written': 0, 'skipped': 0, 'png_sec': 0.0}
+
+        # 1. HTML (cheap, done in this process)
+        if combined_html:
+            groups = {}
+            for spec in self.specs:
+                groups.setdefault(spec['group'], []).append(spec)
+            for group, specs in groups.items():
+                base_dir = os.path.dirname(specs[0]['html_path'] or specs[0]['png_path'] or self.output_dir)
+                path = os.path.join(base_dir, report_name)
+                digest = figure_hash(''.join(s['fig_json'] for s in specs), kind='report')
+                if self._fresh(cache, path, digest):
+                    stats['skipped'] += 1
+                    continue
+                self._write_report(path, specs, title=str(group))
+                cache[path] = digest
+                stats['html_written'] += 1
+        else:
+            for spec in self.specs:
+                path = spec['html_path']
+                if not path:
+                    continue
+                digest = figure_hash(spec['fig_json'], kind='html')
+                if self._fresh(cache, path, digest):
+                    stats['skipped'] += 1
+                    continue
+                pio.write_html(pio.from_json(spec['fig_json'], skip_invalid=True), path)
+                cache[path] = digest
+                stats['html_written'] += 1
+
+        # 2. PNG (expensive, process pool with one Kaleido per worker)
+        jobs, digests = [], {}
+        for spec in self.specs:
+            path = spec['png_path']
+            if not path:
+                continue
+            digest = figure_hash(spec['fig_json'], kind='png', scale=self.scale)
+            if self._fresh(cache, path, digest):
+                stats['skipped'] += 1
+                continue
+            jobs.append((spec['fig_json'], path, self.scale))
+            digests[path] = digest
+
+        # Cache is saved even if a render fails, so finished outputs are not redone
+        try:
+            if jobs:
+                start = time.perf_counter()
+                if self.workers == 1 or len(jobs) == 1:
+                    _init_worker()
+                    self._collect(map(_render_png, jobs), cache, digests, stats)
+                else:
+                    with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)), initializer=_init_worker) as pool:
+                        self._collect(pool.map(_render_png, jobs), cache, digests, stats)
+                stats['png_sec'] = round(time.perf_counter() - start, 2)
+        finally:
+            self._save_cache(cache)
+        return stats
+
+    def _collect(self, results, cache, digests, stats):
+        for png_path, _ in results:
+            cache[png_path] = digests[png_path]
+            stats['png_rendered'] += 1
+            print(f"    Saved: {png_path}")
+
+    @staticmethod
+    def _write_report(path, specs, title):
+        """One HTML page per group: plotly.js is embedded once, each chart is a div."""
+        parts = []
+        for i, spec in enumerate(specs):
+            fig = pio.from_json(spec['fig_json'], skip_invalid=True)
+            parts.append(pio.to_html(fig, full_html=False, include_plotlyjs=(i == 0)))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"<html><head><meta charset=\"utf-8\"><title>{title}</title></head><body>\n")
+            f.write("\n".join(parts))
+            f.write("\n</body></html>\n")
@@ -3,6 +3,11 @@ import numpy as np
 import plotly.graph_objects as go
 from sklearn.metrics import r2_score
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "TermFlow"))
+import normalized
+from chart_renderer import BatchRenderer
 
 # ---------------------------------------------------------
 # CONFIGURATION
@@ -13,117 +18,67 @@ CONFIG = {
     "output_dir": "output",
     "target_year": 2030,
     "top_n": 5,  # Top N terms to plot per category
+    "png": True,  # Export PNGs (requires kaleido)
+    "render_workers": None,  # PNG worker processes (None = CPU count)
+    "combined_html": False,  # One forecast_report.html per category instead of one HTML per term
 }
 
 # ---------------------------------------------------------
 # 1. DATA LOADING AND NORMALIZATION
 # ---------------------------------------------------------
 def load_and_normalize_data():
-    if not os.path.exists(CONFIG['words_file']) or not os.path.exists(CONFIG['domains_file']):
-        print(f"Error: Data files not found!")
-        return None, None, None
-
     try:
-        # A. Word Data
-        df_words = pd.read_csv(CONFIG['words_file'])
-        df_words.columns = [str(c).lower().strip() for c in df_words.columns]
-        
-        term_col = next((c for c in ['bigram', 'term', 'keyword', 'unnamed: 0'] if c in df_words.columns), None)
-        if term_col == 'unnamed: 0': 
-            df_words.rename(columns={'unnamed: 0': 'bigram'}, inplace=True)
-            term_col = 'bigram'
-        
-        # B. Domain Data (Total Paper Counts)
-        df_domains = pd.read_csv(CONFIG['domains_file'])
-        df_domains.columns = [str(c).lower().strip() for c in df_domains.columns]
-        if 'domain' in df_domains.columns:
-            df_domains.rename(columns={'domain': 'category'}, inplace=True)
-
-        # C. Find Years and Melt (Long Format)
-        year_cols = [c for c in df_words.columns if c.isdigit() and 1990 <= int(c) <= 2030]
-        
-        # Melt Words
-        df_words_long = df_words.melt(
-            id_vars=['category', term_col], 
-            value_vars=year_cols, 
-            var_name='year', 
-            value_name='count'
-        )
-        
-        # Melt Domains
-        d_cols = ['category'] + [y for y in year_cols if y in df_domains.columns]
-        df_domains_long = df_domains[d_cols].melt(
-            id_vars=['category'], 
-            var_name='year', 
-            value_name='total_papers'
-        )
-
-        # Fix Data Types
-        df_words_long['year'] = pd.to_numeric(df_words_long['year'])
-        df_words_long['count'] = pd.to_numeric(df_words_long['count'], errors='coerce').fillna(0)
-        
-        df_domains_long['year'] = pd.to_numeric(df_domains_long['year'])
-        df_domains_long['total_papers'] = pd.to_numeric(df_domains_long['total_papers'], errors='coerce').fillna(1)
-
-        # D. Merge
-        merged_df = pd.merge(df_words_long, df_domains_long, on=['category', 'year'], how='inner')
-        
-        # E. Normalization (Per 10,000 papers)
-        merged_df['norm_freq'] = (merged_df['count'] / merged_df['total_papers']) * 10000
-        
-        # Cleanup: Remove outliers
-        merged_df = merged_df[merged_df['norm_freq'] < 50000]
-
-        return merged_df, term_col, sorted(merged_df['year'].unique())
+        # Word counts / domain totals * 10,000, precomputed once as a [term x year] matrix
+        cube = normalized.load_cube(CONFIG['words_file'], CONFIG['domains_file'])
+        if cube is None:
+            print(f"Error: Data files not found!")
+            return None, None
+        
+        years = cube.years[cube.year_mask(1990, 2030)]
+        return cube, years
 
     except Exception as e:
         print(f"Error: {e}")
-        return None, None, None
+        return None, None
 
 # ---------------------------------------------------------
 # 2. REGRESSION ENGINE
 # ---------------------------------------------------------
-def calculate_normalized_trends(df, category, start_year, end_year, term_col):
-    # Category Filter
-    df = df[df['category'] == category].copy()
-    
-    # Year Filter (Training Range)
-    df_train = df[(df['year'] >= start_year) & (df['year'] <= end_year)]
-    
-    results = []
-    grouped = df_train.groupby(term_col)
-    
-    for term, group in grouped:
-        if len(group) < 2: 
-            continue
-        
-        last_val = group[group['year'] == end_year]['norm_freq'].values
-        if len(last_val) == 0 or last_val[0] < 1: 
-            continue
-        
-        X = group['year'].values
-        y = group['norm_freq'].values
-        
-        try:
-            slope, intercept = np.polyfit(X, y, 1)
-            y_pred = slope * X + intercept
-            r2 = r2_score(y, y_pred)
-            
-            full_history = df[df[term_col] == term].sort_values('year')
-            
-            results.append({
-                'term': term,
-                'slope': slope,
-                'intercept': intercept,
-                'r2': r2,
-                'current_norm': last_val[0],
-                'history_x': full_history['year'].values,
-                'history_y': full_history['norm_freq'].values
-            })
-        except:
-            continue
-            
-    return pd.DataFrame(results)
+def calculate_normalized_trends(cube, category, start_year, end_year):
+    # Full history (1990-2030) of every term in the category
+    rows = cube.category_rows(category)
+    history_y, history_x = cube.gather(rows, 1990, 2030)
+    
+    # Cleanup: Remove outliers and years without a paper count
+    history_y[~(history_y < 50000)] = np.nan
+    
+    # Training range; only years that have data for the whole category
+    train = (history_x >= start_year) & (history_x <= end_year) & ~np.isnan(history_y).all(axis=0)
+    X = history_x[train]
+    Y = history_y[:, train]
+    if len(X) < 2 or X[-1] != end_year:
+        return pd.DataFrame()
+    
+    # Terms with a complete training series and last value >= 1
+    keep = ~np.isnan(Y).any(axis=1) & (Y[:, -1] >= 1)
+    rows, history_y, Y = rows[keep], history_y[keep], Y[keep]
+    if len(rows) == 0:
+        return pd.DataFrame()
+    
+    # One least-squares fit for all terms at once (one column per term)
+    slope, intercept = np.polyfit(X, Y.T, 1)
+    y_pred = np.outer(X, slope) + intercept
+    r2 = r2_score(Y.T, y_pred, multioutput='raw_values')
+    
+    return pd.DataFrame({
+        'term': cube.labels(rows),
+        'slope': slope,
+        'intercept': intercept,
+        'r2': r2,
+        'current_norm': Y[:, -1],
+        'history_x': [history_x] * len(rows),
+        'history_y': list(history_y),
+    })
 
 # ---------------------------------------------------------
 # 3. CHART GENERATION
@@ -183,7 +138,7 @@ def main():
         print("Error: Could not load data files.")
         return
     
-    df, term_col, all_years = data_tuple
+    cube, all_years = data_tuple
     min_yr, max_yr = int(min(all_years)), int(max(all_years))
     
     # Training range: last 5 years
@@ -194,13 +149,16 @@ def main():
     # Create output directory
     os.makedirs(CONFIG['output_dir'], exist_ok=True)
     
-    categories = sorted(df['category'].unique())
+    categories = sorted(cube.categories)
     print(f"Found {len(categories)} categories: {categories}")
     
+    # Charts are queued here and rendered in one batch at the end
+    renderer = BatchRenderer(CONFIG['output_dir'], workers=CONFIG['render_workers'], png=CONFIG['png'])
+    
     for category in categories:
         print(f"\nProcessing: {category}")
         
-        res_df = calculate_normalized_trends(df, category, train_start, train_end, term_col)
+        res_df = calculate_normalized_trends(cube, category, train_start, train_end)
         
         if res_df.empty:
             print(f"  No significant trends found for {category}")
@@ -224,21 +182,24 @@ def main():
             
             fig = create_forecast_chart(row, train_start, train_end, target_year, category)
             
-            # Save as HTML and PNG
+            # Queue HTML and PNG
             safe_term = term.replace(" ", "_").replace("/", "_").replace("\\", "_")[:50]
             html_path = os.path.join(cat_dir, f"{safe_term}_forecast.html")
             png_path = os.path.join(cat_dir, f"{safe_term}_forecast.png")
             
-            fig.write_html(html_path)
-            fig.write_image(png_path, scale=2)
-            
-            print(f"    Saved: {png_path}")
+            renderer.add(fig, html_path=html_path, png_path=png_path, group=category)
         
         # Save summary CSV
         summary_path = os.path.join(cat_dir, "top_trends_summary.csv")
         top_df[['term', 'slope', 'current_norm', 'r2']].to_csv(summary_path, index=False)
         print(f"  Summary saved: {summary_path}")
     
+    # Render all queued charts (unchanged charts are skipped)
+    print(f"\nRendering {len(renderer.specs)} charts...")
+    stats = renderer.render(combined_html=CONFIG['combined_html'], report_name="forecast_report.html")
+    print(f"  HTML written: {stats['html_written']}, PNG rendered: {stats['png_rendered']} "
+          f"({stats['png_sec']}s), unchanged/skipped: {stats['skipped']}")
+    
     print(f"\n✅ All charts saved to '{CONFIG['output_dir']}/' folder.")
 
 if __name__ == "__main__":
@@ -2,43 +2,25 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "TermFlow"))
+import warehouse
 
 # ---------------------------------------------------------
 # 1. VERİYİ YÜKLEME VE BİRLEŞTİRME FONKSİYONU
 # ---------------------------------------------------------
-def get_aggregated_frequencies(file_path="all_data_merged.csv"):
-    if not os.path.exists(file_path):
-        print(f"'{file_path}' dosyası bulunamadı!")
-        return None
-
+def get_aggregated_frequencies(file_path=warehouse.MAIN_DATA_PATH):
     try:
-        df = pd.read_csv(file_path)
-        
-        # Sütun isimlerini temizle (küçük harf, boşluksuz)
-        df.columns = [str(c).lower().strip() for c in df.columns]
-
-        # --- A. KELİME SÜTUNUNU BUL ---
-        possible_names = ['bigram', 'term', 'keyword', 'word', 'ngram', 'unnamed: 0']
-        term_col = None
-        for name in possible_names:
-            if name in df.columns:
-                term_col = name
-                break
-        
-        if not term_col:
-            print("Veri setinde kelime sütunu (bigram/term) bulunamadı.")
+        # Ortak, tipli tablo (bigram / category / yıllar / total)
+        df = warehouse.load_terms(file_path)
+        if df is None:
+            print(f"'{file_path}' dosyası bulunamadı!")
             return None
-
-        # --- B. SAYI SÜTUNUNU BUL ---
-        count_col = 'total' if 'total' in df.columns else 'count'
-        
-        if count_col not in df.columns:
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            df['calculated_total'] = df[numeric_cols].sum(axis=1)
-            count_col = 'calculated_total'
+        term_col, count_col = 'bigram', 'total'
 
         # --- C. AGGREGATION (BİRLEŞTİRME) ---
-        aggregated_df = df.groupby(term_col)[count_col].sum().reset_index()
+        aggregated_df = df.groupby(term_col, observed=True)[count_col].sum().reset_index()
         frequencies = dict(zip(aggregated_df[term_col], aggregated_df[count_col]))
         
         return frequencies
@@ -1,27 +1,22 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-import os
+from utils.term_registry import load_tracked_counts
 
 # ----------------------------------------------------------------
 # PLOT: COMPARE ALL CATEGORIES
 # ----------------------------------------------------------------
 print("Generating plot: Comparing all categories...")
 
-# 1. Veri dosyalarını bul
-data_dir = 'data/pandemic'
-csv_files = [f for f in os.listdir(data_dir) if f.endswith('_quarterly_counts.csv')]
+# 1. 'pandemic' grubunu tek sayım tablosundan oku
+combined_df = load_tracked_counts(groups=['pandemic'])
 
-# 2. Tüm verileri tek bir DataFrame'de birleştir
+# 2. Her terimi ayrı çizgi olarak çiz
 fig, ax = plt.subplots(figsize=(18, 10))
 
-for filename in csv_files:
-    # Dosya adından kategori adını çıkar (örn: "artificial_intelligence")
-    category_name = filename.replace('_quarterly_counts.csv', '').replace('_', ' ').title()
-    
-    # Veriyi oku
-    df_temp = pd.read_csv(os.path.join(data_dir, filename))
-    
+for category_name, df_temp in combined_df.groupby('term', sort=False):
+    df_temp = df_temp.copy()
+
     # Tarih formatını ayarla
     df_temp['date'] = pd.PeriodIndex(df_temp['period'], freq='Q').to_timestamp()
     
@@ -1,31 +1,10 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from utils.term_registry import load_tracked_counts
 
-# Map of term names to their file names
-file_map = {
-    "Artificial Intelligence": "data/ai/artificial_intelligence_quarterly_counts.csv",
-    "Large Language Models": "data/ai/large_language_quarterly_counts.csv",
-    "Machine Learning": "data/ai/machine_learning_quarterly_counts.csv",
-    "Climate Change": "data/climate_change/climate_change_quarterly_counts.csv",
-    "Electric Vehicle": "data/climate_change/electric_vehicle_quarterly_counts.csv",
-    "Renewable Energy": "data/climate_change/renewable_energy_quarterly_counts.csv",
-    "COVID Pandemic": "data/pandemic/covid_pandemic_quarterly_counts.csv",
-    "Public Health": "data/pandemic/public_health_quarterly_counts.csv",
-    "Social Distancing": "data/pandemic/social_distancing_quarterly_counts.csv"
-}
-
-# Load and combine data
-all_data = []
-for term, file_name in file_map.items():
-    try:
-        df = pd.read_csv(file_name)
-        df['term'] = term
-        all_data.append(df)
-    except FileNotFoundError:
-        print(f"File not found: {file_name}")
-
-combined_df = pd.concat(all_data, ignore_index=True)
+# Load all tracked terms from the single counts table
+combined_df = load_tracked_counts()
 
 # 1. Calculate Mean Count for each term
 mean_counts = combined_df.groupby('term')['count'].mean().sort_values(ascending=False).reset_index()
@@ -1,22 +1,10 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from utils.term_registry import load_tracked_counts
 
-# List of the three provided files
-file_names = {
-    "Climate Change": "data/climate_change/climate_change_quarterly_counts.csv",
-    "Electric Vehicle": "data/climate_change/electric_vehicle_quarterly_counts.csv",
-    "Renewable Energy": "data/climate_change/renewable_energy_quarterly_counts.csv"
-}
-
-# Load and combine data
-all_data = []
-for term, file_name in file_names.items():
-    df = pd.read_csv(file_name)
-    df['term'] = term
-    all_data.append(df)
-
-combined_df = pd.concat(all_data, ignore_index=True)
+# Load the 'climate_change' group from the single counts table
+combined_df = load_tracked_counts(groups=['climate_change'])
 
 # Inspect the combined DataFrame
 print(combined_df.head())
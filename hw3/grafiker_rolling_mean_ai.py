@@ -1,22 +1,10 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from utils.term_registry import load_tracked_counts
 
-# List of the three provided files
-file_names = {
-    "Artificial Intelligence": "data/ai/artificial_intelligence_quarterly_counts.csv",
-    "Large Language": "data/ai/large_language_quarterly_counts.csv",
-    "Machine Learning": "data/ai/machine_learning_quarterly_counts.csv"
-}
-
-# Load and combine data
-all_data = []
-for term, file_name in file_names.items():
-    df = pd.read_csv(file_name)
-    df['term'] = term
-    all_data.append(df)
-
-combined_df = pd.concat(all_data, ignore_index=True)
+# Load the 'ai' group from the single counts table
+combined_df = load_tracked_counts(groups=['ai'])
 
 # Inspect the combined DataFrame
 print(combined_df.head())
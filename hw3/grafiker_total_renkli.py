@@ -1,30 +1,10 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from utils.term_registry import load_tracked_counts
 
-# Load the combined data from the previous step (assuming it was saved or available in memory,
-# but to be safe, I'll re-combine and prepare it briefly if needed, though for the thought process I know it exists.
-# Since the interpreter state is reset, I must re-read and combine the files.)
-
-file_map = {
-    "Artificial Intelligence": "data/ai/artificial_intelligence_quarterly_counts.csv",
-    "Large Language Models": "data/ai/large_language_quarterly_counts.csv",
-    "Machine Learning": "data/ai/machine_learning_quarterly_counts.csv",
-    "Climate Change": "data/climate_change/climate_change_quarterly_counts.csv",
-    "Electric Vehicle": "data/climate_change/electric_vehicle_quarterly_counts.csv",
-    "Renewable Energy": "data/climate_change/renewable_energy_quarterly_counts.csv",
-    "COVID Pandemic": "data/pandemic/covid_pandemic_quarterly_counts.csv",
-    "Public Health": "data/pandemic/public_health_quarterly_counts.csv",
-    "Social Distancing": "data/pandemic/social_distancing_quarterly_counts.csv"
-}
-
-all_data = []
-for term, file_name in file_map.items():
-    df = pd.read_csv(file_name)
-    df['term'] = term
-    all_data.append(df)
-
-combined_df = pd.concat(all_data, ignore_index=True)
+# All tracked terms (synonyms already merged) from the single counts table
+combined_df = load_tracked_counts()
 
 # Prepare for plotting and sorting
 combined_df['sort_period'] = combined_df['period'].str.replace('Q', '.').astype(float)
@@ -2,6 +2,9 @@ import pandas as pd
 import re
 import json
 import sys # Hata durumunda çıkmak için
+from utils.term_matcher import TermMatcher
+from utils.term_registry import (load_registry, load_counts, save_counts, plan_update, merge_counts,
+                                 export_tracked_counts, COUNTS_FILE, TRACKED_FILE)
 
 # --- Config dosyasını oku ---
 try:
@@ -28,52 +31,67 @@ def basic_clean(text):
     text = re.sub(r'\s+', ' ', text).strip() # Fazladan boşlukları kaldır
     return text
 
-SEARCH_TERMS = [
-    "machine learning",
-    "artificial intelligence",
-    "large language",
-    "climate change",
-    "renewable energy",
-    "electric vehicle",
-    "electric vehicles",
-    "covid pandemic",
-    "social distancing",
-    "public health"
-]
+# --- Takip edilen terimler config.json'daki kayıt defterinden gelir ---
+registry = load_registry(economy_config)
+if registry.empty:
+    print("HATA: config.json 'tracked_terms' içinde takip edilecek terim yok.")
+    sys.exit(1)
+SEARCH_TERMS = [basic_clean(p) for p in dict.fromkeys(registry['pattern'])]
 
-# 2. Gerekli Sütunları Hazırla (tek seferlik)
-print("Metinler temizleniyor ve tarihler ayarlanıyor...")
+# 2. Tarihleri ayarla (tüm korpus için ucuz adım)
+# Tarihi olmayan / okunamayan makaleler hiçbir çeyreğe girmez
+df['published_date'] = pd.to_datetime(df['published_date'], errors='coerce')
+df['period'] = df['published_date'].dt.to_period('Q').astype(str).where(df['published_date'].notna())
+undated = df['period'].isna().sum()
+df = df.dropna(subset=['period'])
+if undated:
+    print(f"Tarihsiz {undated} makale atlandı.")
 
-# Başlık ve özeti birleştir
-df['text'] = df['title'].astype(str) + ' ' + df['summary'].astype(str)
+# 3. Artımlı güncelleme planı: sadece yeni çeyrekler ve yeni eklenen yazımlar sayılır
+counts = load_counts(COUNTS_FILE)
+recount_from, new_patterns = plan_update(counts, SEARCH_TERMS)
 
-# 'basic_clean' fonksiyonunu uygula
-df['basic_processed'] = df['text'].apply(basic_clean)
+def count_terms(articles, terms):
+    """Verilen makalelerde terimleri tek taramada sayar -> (term, period, count) satırları."""
+    if articles.empty or not terms:
+        return pd.DataFrame(columns=['term', 'period', 'count'])
 
-df['published_date'] = pd.to_datetime(df['published_date'])
+    # Başlık ve özeti birleştirip temizle (sadece bu alt küme için)
+    text = (articles['title'].astype(str) + ' ' + articles['summary'].astype(str)).apply(basic_clean)
 
-df['period'] = df['published_date'].dt.to_period('Q')
+    matcher = TermMatcher(terms)
+    period_codes, periods = pd.factorize(articles['period'], sort=True)
+    matrix = matcher.count_by_group(text, period_codes, len(periods))
 
-# 3. Her terim için say ve CSV oluştur
-print("\n--- Terimler için çeyreklik sayım başlıyor ---")
-for term in SEARCH_TERMS:
-    # Temrin basic_clean ile aynı şekilde işlenmiş halini kullan
-    term_clean = basic_clean(term)
-    print(f"\nAranacak Terim: '{term}' (temizlenmiş: '{term_clean}')")
+    return pd.DataFrame({
+        'term': [t for t in terms for _ in periods],
+        'period': [p for _ in terms for p in periods],
+        'count': matrix.T.ravel(),
+    })
 
-    # Her döngüde 'term_count' sütununu yeniden oluştur
-    df['term_count'] = df['basic_processed'].apply(lambda x: x.count(term_clean))
+print("\n--- Terimler için çeyreklik sayım başlıyor ---")
+new_rows = []
+if recount_from is None:
+    print(f"Kayıtlı sayım yok, tüm korpus taranıyor ({len(SEARCH_TERMS)} terim).")
+    new_rows.append(count_terms(df, SEARCH_TERMS))
+else:
+    recent = df[df['period'] >= recount_from]
+    print(f"{recount_from} ve sonrası ({len(recent)} makale) tüm terimler için sayılıyor.")
+    new_rows.append(count_terms(recent, SEARCH_TERMS))
 
-    # Çeyreklik olarak grupla ve topla
-    quarterly_counts = df.groupby('period')['term_count'].sum()
+    if new_patterns:
+        older = df[df['period'] < recount_from]
+        print(f"Kelime bazlı geçmişi olmayan yazımlar tüm geçmiş için sayılıyor: {new_patterns}")
+        new_rows.append(count_terms(older, new_patterns))
 
-    # Sonuçları göster (kısa özet)
-    print(f"'{term}' Teriminin Çeyreklik Geçiş Sayısı (ilk 10):")
-    print(quarterly_counts.head(10))
+counts = merge_counts(counts, pd.concat(new_rows, ignore_index=True), recount_from,
+                      new_patterns if recount_from is not None else ())
+save_counts(counts, COUNTS_FILE)
+print(f"Ham sayımlar '{COUNTS_FILE}' dosyasına kaydedildi ({len(counts)} satır).")
 
-    # Sonucu CSV'ye kaydet
-    output_csv_name = f"data/{term_clean.replace(' ', '_')}_quarterly_counts.csv"
-    quarterly_counts.to_csv(output_csv_name, header=['count'])
-    print(f"Sonuçlar '{output_csv_name}' dosyasına kaydedildi.")
+# 4. Eş anlamlıları birleştirilmiş tabloyu grafik scriptleri için dışa aktar
+tracked = export_tracked_counts()
+print(f"Birleştirilmiş sayımlar '{TRACKED_FILE}' dosyasına kaydedildi.")
+print(tracked.groupby('term', sort=False)['count'].sum().to_string())
 
-print("\n--- Tüm terimler işlendi ---")
\ No newline at end of file
+print("\n--- Tüm terimler işlendi ---")
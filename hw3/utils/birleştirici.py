@@ -1,11 +1,13 @@
-import pandas as pd
+import os
+import sys
 
-vehicle = pd.read_csv('data/climate_change/electric_vehicle_quarterly_counts.csv')
-vehicles = pd.read_csv('data/climate_change/electric_vehicles_quarterly_counts.csv')
+# Eş anlamlı birleştirme artık config.json'daki "tracked_terms" kayıt defterinden yapılır
+# (örn. "Electric Vehicle": ["electric vehicle", "electric vehicles"]).
+# Bu script korpusu taramadan, ham data/term_counts.csv tablosundan
+# birleştirilmiş data/tracked_term_counts.csv dosyasını yeniden üretir.
+# hw3 klasöründen çalıştırın:  python utils/birleştirici.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.term_registry import export_tracked_counts, TRACKED_FILE
 
-total_vehicles = vehicle['count'] + vehicles['count']
-combined_df = pd.DataFrame({
-    'period': vehicle['period'],
-    'count': total_vehicles
-})
-combined_df.to_csv('data/climate_change/electric_vehicle_combined.csv', index=False)
\ No newline at end of file
+tracked = export_tracked_counts()
+print(f"'{TRACKED_FILE}' güncellendi ({len(tracked)} satır).")
@@ -0,0 +1,96 @@
+from collections import deque
+import numpy as np
+
+# ----------------------------------------------------------------
+# Kelime bazlı Aho-Corasick çoklu terim eşleştirici
+# ----------------------------------------------------------------
+# Otomat bir kez tüm terimlerden kurulur; her metin kelime kelime TEK KEZ taranır
+# ve içindeki bütün terimler birlikte sayılır. Semboller harf değil kelime olduğu
+# için eşleşmeler kelime sınırına uyar: "electric vehicle" terimi
+# "electric vehicles" içinde sayılmaz (str.count bunu sayıyordu).
+
+
+class TermMatcher:
+    def __init__(self, terms):
+        """terms: basic_clean'den geçmiş terim listesi (örn. ['machine learning', ...])."""
+        self.terms = list(terms)
+        self.goto = [{}]      # durum -> {kelime: sonraki durum}
+        self.fail = [0]       # durum -> hata bağlantısı
+        self.output = [[]]    # durum -> bu durumda biten terim indeksleri
+
+        for term_idx, term in enumerate(self.terms):
+            self._add(term.split(), term_idx)
+        self._build_links()
+
+    def _add(self, words, term_idx):
+        state = 0
+        for word in words:
+            nxt = self.goto[state].get(word)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][word] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = nxt
+        self.output[state].append(term_idx)
+
+    def _build_links(self):
+        """BFS ile hata bağlantılarını kurar ve çıktıları hata zinciri boyunca birleştirir."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and word not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(word, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def iter_matches(self, text):
+        """Metindeki her eşleşme için terim indeksini üretir."""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for word in text.split():
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if output[state]:
+                yield from output[state]
+
+    def count(self, text):
+        """Tek metin için terim başına geçiş sayısı listesi."""
+        counts = [0] * len(self.terms)
+        for term_idx in self.iter_matches(text):
+            counts[term_idx] += 1
+        return counts
+
+    def count_by_group(self, texts, group_codes, n_groups):
+        """
+        Tüm metinleri tarayıp [grup x terim] sayım matrisi döndürür
+        (örn. grup = çeyrek dönemi kodu). Kodu < 0 olan metinler (pd.factorize'ın
+        eksik değer kodu, örn. tarihsiz makale) sayılmaz.
+        """
+        hit_groups = []
+        hit_terms = []
+        for text, group in zip(texts, group_codes):
+            if group < 0:
+                continue
+            for term_idx in self.iter_matches(text):
+                hit_groups.append(group)
+                hit_terms.append(term_idx)
+
+        n_terms = len(self.terms)
+        flat = np.asarray(hit_groups, dtype=np.int64) * n_terms + np.asarray(hit_terms, dtype=np.int64)
+        return np.bincount(flat, minlength=n_groups * n_terms).reshape(n_groups, n_terms)
+
+
+if __name__ == "__main__":
+    # Kısa doğrulama: python -m utils.term_matcher
+    matcher = TermMatcher(['electric vehicle', 'electric vehicles', 'vehicle'])
+    assert matcher.count('electric vehicles and an electric vehicle') == [1, 1, 1]
+    # Tarihsiz makale (grup kodu -1) atlanır, bincount'a negatif indeks gitmez
+    matrix = matcher.count_by_group(['electric vehicle', 'electric vehicle'], [0, -1], 1)
+    assert matrix.tolist() == [[1, 0, 1]]
+    print("TermMatcher kontrolleri geçti.")
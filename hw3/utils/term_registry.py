@@ -0,0 +1,152 @@
+import os
+import glob
+import json
+import pandas as pd
+
+# ----------------------------------------------------------------
+# Takip edilen terim kayıt defteri (config.json -> "tracked_terms")
+# ----------------------------------------------------------------
+# Yapı:  grup -> görünen ad -> eş anlamlı yazımlar
+#   "climate_change": {"Electric Vehicle": ["electric vehicle", "electric vehicles"]}
+#
+# Sayımlar tek bir uzun tabloda (term, period, count, method) tutulur; 'term' burada
+# eş anlamlı yazımın kendisidir. Eş anlamlıların birleştirilmesi okuma anında
+# yapılır, bu yüzden eş anlamlı eklemek/birleştirmek tüm korpusu yeniden taramayı
+# gerektirmez.
+# 'method' sayımın nasıl yapıldığını tutar:
+#   substring : eski *_quarterly_counts.csv dosyaları (str.count, kelime içini de sayar)
+#   word      : TermMatcher (kelime sınırına uyar)
+# Bir yazımın serisinde iki yöntem karışmaz: kelime bazlı geçmişi olmayan yazım
+# procces.py'nin ilk çalışmasında tüm geçmiş için TermMatcher ile yeniden sayılır.
+
+CONFIG_FILE = 'config.json'
+CONFIG_SECTION = 'Economy'
+COUNTS_FILE = 'data/term_counts.csv'            # Ham sayımlar (yazım bazında)
+TRACKED_FILE = 'data/tracked_term_counts.csv'   # Eş anlamlıları birleştirilmiş dışa aktarım
+
+COUNT_COLUMNS = ['term', 'period', 'count', 'method']
+LEGACY_METHOD = 'substring'
+MATCHER_METHOD = 'word'
+
+
+def load_config(path=CONFIG_FILE, section=CONFIG_SECTION):
+    with open(path, 'r') as f:
+        return json.load(f)[section]
+
+
+def load_registry(config):
+    """
+    config['tracked_terms'] -> (group, term, pattern) tablosu.
+    'term' grafiklerde görünen ad, 'pattern' metinde aranan (temizlenmiş) yazımdır.
+    """
+    rows = []
+    for group, terms in config.get('tracked_terms', {}).items():
+        for term, patterns in terms.items():
+            for pattern in patterns:
+                rows.append({'group': group, 'term': term, 'pattern': pattern})
+    return pd.DataFrame(rows, columns=['group', 'term', 'pattern'])
+
+
+def load_counts(path=COUNTS_FILE):
+    """Ham (term, period, count, method) tablosunu okur; dosya yoksa boş tablo döner."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=COUNT_COLUMNS)
+    counts = pd.read_csv(path, dtype={'term': str, 'period': str, 'count': 'int64', 'method': str})
+    if 'method' not in counts.columns:
+        counts['method'] = LEGACY_METHOD  # method sütunundan önceki tablo eski dosyalardan doluydu
+    return counts
+
+
+def save_counts(counts, path=COUNTS_FILE):
+    counts = counts.sort_values(['term', 'period']).reset_index(drop=True)
+    counts[COUNT_COLUMNS].to_csv(path, index=False)
+
+
+def plan_update(counts, patterns):
+    """
+    Artımlı güncelleme planı.
+    Geriye (yeniden_sayılacak_ilk_dönem, geçmişi_sayılacak_yazımlar) döner:
+      - Son kayıtlı çeyrek ve sonrası tüm yazımlar için yeniden sayılır
+        (son çeyrek önceki çalıştırmada yarım kalmış olabilir).
+      - Kelime bazlı geçmişi olmayan yazımlar (tabloda hiç olmayanlar ve eski dosyalardan
+        alt dize sayımıyla gelenler) o dönemden öncesi için bir kez TermMatcher ile sayılır;
+        yeni çeyrekler kelime bazlı sayıldığından seri ortasında yöntem değişmez. Eş
+        anlamlılar da böylece aynı yöntemle sayılır ("electric vehicle" alt dize sayımı
+        "electric vehicles"ı da içeriyordu, toplamları geçmişi iki kez sayardı).
+    Hiç kayıt yoksa (None, tüm yazımlar) döner -> her şey sayılır.
+    """
+    if counts.empty:
+        return None, list(patterns)
+    last_period = counts['period'].max()
+    word_counted = set(counts.loc[counts['method'] == MATCHER_METHOD, 'term'])
+    return last_period, [p for p in patterns if p not in word_counted]
+
+
+def merge_counts(counts, new_rows, recount_from, recounted=()):
+    """
+    Eski tablodan yeniden sayılan dönemleri ve geçmişi baştan sayılan yazımları
+    (recounted) düşürüp yeni (TermMatcher) satırları ekler.
+    """
+    if recount_from is not None:
+        counts = counts[counts['period'] < recount_from]
+    counts = counts[~counts['term'].isin(list(recounted))]
+    merged = pd.concat([counts, new_rows.assign(method=MATCHER_METHOD)], ignore_index=True)
+    return merged.drop_duplicates(subset=['term', 'period'], keep='last')
+
+
+def tracked_counts(counts, registry, groups=None):
+    """
+    Ham sayımları kayıt defterine göre görünen adlara toplar (eş anlamlılar birleşir).
+    Geriye (group, term, period, count) tablosu döner.
+    """
+    if groups:
+        registry = registry[registry['group'].isin(groups)]
+    merged = registry.merge(counts, left_on='pattern', right_on='term', suffixes=('', '_raw'))
+    result = merged.groupby(['group', 'term', 'period'], as_index=False, sort=False)['count'].sum()
+    # Kayıt defterindeki sırayı koru, dönemleri sırala
+    order = {t: i for i, t in enumerate(dict.fromkeys(registry['term']))}
+    result['_order'] = result['term'].map(order)
+    result = result.sort_values(['_order', 'period']).drop(columns='_order')
+    return result.reset_index(drop=True)
+
+
+def load_tracked_counts(groups=None, config_path=CONFIG_FILE, counts_path=COUNTS_FILE):
+    """Grafik scriptleri için tek giriş noktası: (group, term, period, count)."""
+    registry = load_registry(load_config(config_path))
+    return tracked_counts(load_counts(counts_path), registry, groups)
+
+
+def export_tracked_counts(config_path=CONFIG_FILE, counts_path=COUNTS_FILE, output_path=TRACKED_FILE):
+    """Eş anlamlıları birleştirilmiş tabloyu diske yazar (korpus taraması yapmaz)."""
+    tracked = load_tracked_counts(config_path=config_path, counts_path=counts_path)
+    tracked.to_csv(output_path, index=False)
+    return tracked
+
+
+def import_legacy_files(data_dir='data', counts_path=COUNTS_FILE, registry=None):
+    """
+    Eski <yazım>_quarterly_counts.csv dosyalarını (data_dir/ altında) ham tabloya aktarır.
+    Sadece tabloda henüz olmayan yazımlar, method='substring' ile eklenir (procces.py'nin
+    ilk çalışmasında kelime bazlı sayımla değiştirilirler). Eski dosyalar str.count (alt
+    dize) ile sayıldığından, registry verilirse birden fazla yazımı olan görünen adların
+    dosyaları atlanır ("electric vehicle" sayımı çoğulu zaten içerir; ikisini toplamak
+    geçmişi iki kez sayar).
+    """
+    counts = load_counts(counts_path)
+    known = set(counts['term'])
+    if registry is not None:
+        spellings = registry.groupby('term')['pattern'].transform('count')
+        known |= set(registry.loc[spellings > 1, 'pattern'])
+    frames = [counts]
+    for path in sorted(glob.glob(os.path.join(data_dir, '**', '*_quarterly_counts.csv'), recursive=True)):
+        pattern = os.path.basename(path).replace('_quarterly_counts.csv', '').replace('_', ' ')
+        if pattern in known:
+            continue
+        legacy = pd.read_csv(path)
+        legacy['term'] = pattern
+        legacy['method'] = LEGACY_METHOD
+        frames.append(legacy[COUNT_COLUMNS])
+        known.add(pattern)
+    merged = pd.concat(frames, ignore_index=True)
+    save_counts(merged, counts_path)
+    return merged